@@ -13,6 +13,8 @@
 # =============================================================================
 
 from server.server import A2AServer
+from server.cli import admission_options, worker_options, store_options
+from server.task_store import create_task_store
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
 from agents.book_appointment_agent.task_manager import AgentTaskManager
 from agents.book_appointment_agent.agent import BookAppointmentAgent
@@ -24,8 +26,12 @@ logger = logging.getLogger(__name__)
 @click.command()
 @click.option("--host", default="localhost", help="Host to bind the server to")
 @click.option("--port", default=10007, help="Port number for the server")
-def main(host, port):
-    capabilities = AgentCapabilities(streaming=False)
+@admission_options
+@worker_options
+@store_options
+def main(host, port, max_in_flight, max_queue, queue_timeout, workers, max_pending,
+         max_tasks, task_ttl, task_db, task_cache_ttl):
+    capabilities = AgentCapabilities(streaming=True)
     skill = AgentSkill(
         id="book_appointment",
         name="Book Appointment",
@@ -47,7 +53,17 @@ def main(host, port):
         host=host,
         port=port,
         agent_card=agent_card,
-        task_manager=AgentTaskManager(agent=BookAppointmentAgent())
+        task_manager=AgentTaskManager(
+            agent=BookAppointmentAgent(),
+            store=create_task_store(
+                max_tasks=max_tasks, ttl=task_ttl, db_path=task_db, cache_ttl=task_cache_ttl
+            )
+        ),
+        max_in_flight=max_in_flight,
+        max_queue=max_queue,
+        queue_timeout=queue_timeout,
+        workers=workers,
+        max_pending=max_pending
     )
     server.start()
 
@@ -13,8 +13,8 @@ from models.task import Message, TextPart, TaskStatus, TaskState
 logger = logging.getLogger(__name__)
 
 class AgentTaskManager(InMemoryTaskManager):
-    def __init__(self, agent):
-        super().__init__()
+    def __init__(self, agent, store=None):
+        super().__init__(store=store)
         self.agent = agent
 
     def _get_user_query(self, req: SendTaskRequest):
@@ -29,8 +29,6 @@ class AgentTaskManager(InMemoryTaskManager):
         response_text = self.agent.book(query, sid)
 
         msg = Message(role="agent", parts=[TextPart(text=response_text)])
-        async with self.lock:
-            task.status = TaskStatus(state=TaskState.COMPLETED)
-            task.history.append(msg)
+        task = await self.update_store(task.id, TaskStatus(state=TaskState.COMPLETED), msg)
 
         return SendTaskResponse(id=req.id, result=task)
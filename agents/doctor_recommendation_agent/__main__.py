@@ -18,6 +18,8 @@
 
 # A2A Server framework
 from server.server import A2AServer
+from server.cli import admission_options, worker_options, store_options
+from server.task_store import create_task_store
 
 # Agent metadata
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
@@ -46,14 +48,18 @@ logger = logging.getLogger(__name__)
 @click.command()
 @click.option("--host", default="localhost", help="Host to bind the server to")
 @click.option("--port", default=10006, help="Port number for the server")
-def main(host, port):
+@admission_options
+@worker_options
+@store_options
+def main(host, port, max_in_flight, max_queue, queue_timeout, workers, max_pending,
+         max_tasks, task_ttl, task_db, task_cache_ttl):
     """
     This function sets up everything needed to start the DoctorRecommendationAgent server.
     Run via: `python -m agents.doctor_recommendation_agent --host 0.0.0.0 --port 12345`
     """
 
-    # Define capabilities (streaming not required)
-    capabilities = AgentCapabilities(streaming=False)
+    # Define capabilities (replies are instant, so "tasks/sendSubscribe" sends a single update)
+    capabilities = AgentCapabilities(streaming=True)
 
     # Define the agent skill
     skill = AgentSkill(
@@ -85,7 +91,17 @@ def main(host, port):
         host=host,
         port=port,
         agent_card=agent_card,
-        task_manager=AgentTaskManager(agent=DoctorRecommendationAgent())
+        task_manager=AgentTaskManager(
+            agent=DoctorRecommendationAgent(),
+            store=create_task_store(
+                max_tasks=max_tasks, ttl=task_ttl, db_path=task_db, cache_ttl=task_cache_ttl
+            )
+        ),
+        max_in_flight=max_in_flight,
+        max_queue=max_queue,
+        queue_timeout=queue_timeout,
+        workers=workers,
+        max_pending=max_pending
     )
 
     server.start()
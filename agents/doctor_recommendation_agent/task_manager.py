@@ -8,8 +8,8 @@ import logging
 logger = logging.getLogger(__name__)
 
 class AgentTaskManager(InMemoryTaskManager):
-    def __init__(self, agent):
-        super().__init__()
+    def __init__(self, agent, store=None):
+        super().__init__(store=store)
         self.agent = agent
         self.awaiting_selection = {}  # session_id -> True/False
 
@@ -34,8 +34,8 @@ class AgentTaskManager(InMemoryTaskManager):
 
         # Format response
         agent_message = Message(role="agent", parts=[TextPart(text=response)])
-        async with self.lock:
-            task.status = TaskStatus(state=TaskState.COMPLETED)
-            task.history.append(agent_message)
+        task = await self.update_store(
+            task.id, TaskStatus(state=TaskState.COMPLETED), agent_message
+        )
 
         return SendTaskResponse(id=request.id, result=task)
@@ -12,6 +12,8 @@ import logging                        # Standard Python module for logging
 import click                          # Library for building command-line interfaces
 
 from server.server import A2AServer    # Our generic A2A server implementation
+from server.cli import admission_options, worker_options, store_options, session_options  # Shared server tuning flags
+from server.task_store import create_task_store  # Task storage (RAM or SQLite)
 from models.agent import (
     AgentCard,                        # Pydantic model for describing an agent
     AgentCapabilities,                # Describes streaming & other features
@@ -21,6 +23,8 @@ from agents.greeting_agent.task_manager import GreetingTaskManager
                                       # TaskManager that adapts GreetingAgent to A2A
 from agents.greeting_agent.agent import GreetingAgent
                                       # Our custom orchestration agent logic
+from utilities.session_service import BoundedSessionService
+                                      # Bounded, compacting conversation sessions
 
 # -----------------------------------------------------------------------------
 # ⚙️ Logging setup
@@ -45,13 +49,32 @@ logger = logging.getLogger(__name__)
     default=10001,
     help="Port for GreetingAgent server"
 )
-def main(host: str, port: int):
+@admission_options
+@worker_options
+@store_options
+@session_options
+def main(host: str, port: int, max_in_flight: int, max_queue: int, queue_timeout: float,
+         workers: int, max_pending: int, max_tasks: int, task_ttl: float,
+         task_db: str | None, task_cache_ttl: float,
+         max_sessions: int, session_ttl: float, keep_turns: int):
     """
     Launches the GreetingAgent A2A server.
 
     Args:
         host (str): Hostname or IP to bind to (default: localhost)
         port (int): TCP port to listen on (default: 10001)
+        max_in_flight (int): Max greetings generated concurrently (0 = unlimited)
+        max_queue (int): Max requests waiting for a slot before "server busy"
+        queue_timeout (float): Max seconds a request waits for a slot
+        workers (int): Background workers; if > 0, "tasks/send" returns immediately
+        max_pending (int): Max tasks waiting for a background worker
+        max_tasks (int): Max tasks kept in memory (least recently used are evicted)
+        task_ttl (float): Seconds a finished task is kept after its last use
+        task_db (str | None): SQLite file to persist tasks to (None = RAM only)
+        task_cache_ttl (float): Seconds a task cached from task_db is trusted (0 = always)
+        max_sessions (int): Max conversation sessions kept (least recently used are evicted)
+        session_ttl (float): Seconds a conversation session is kept after its last use
+        keep_turns (int): Turns per session sent to the LLM verbatim; older ones are summarized
     """
     # Print a friendly banner so the user knows the server is starting
     print(f"\n🚀 Starting GreetingAgent on http://{host}:{port}/\n")
@@ -59,9 +82,9 @@ def main(host: str, port: int):
     # -------------------------------------------------------------------------
     # 1) Define the agent’s capabilities
     # -------------------------------------------------------------------------
-    # Here we specify that this agent does NOT support streaming responses.
-    # It will always send a single, complete reply.
-    capabilities = AgentCapabilities(streaming=False)
+    # Here we specify that this agent supports streaming responses.
+    # Clients using "tasks/sendSubscribe" see the greeting as it's written.
+    capabilities = AgentCapabilities(streaming=True)
 
     # -------------------------------------------------------------------------
     # 2) Define the agent’s skill metadata
@@ -95,7 +118,7 @@ def main(host: str, port: int):
         version="1.0.0",                                   # Semantic version
         defaultInputModes=["text"],                        # Accepts plain text
         defaultOutputModes=["text"],                       # Produces plain text
-        capabilities=capabilities,                         # Streaming disabled
+        capabilities=capabilities,                         # Streaming enabled
         skills=[skill]                                     # List of skills
     )
 
@@ -103,9 +126,18 @@ def main(host: str, port: int):
     # 4) Instantiate the core logic and its TaskManager
     # -------------------------------------------------------------------------
     # GreetingAgent contains the orchestration logic (LLM + tools).
-    greeting_agent = GreetingAgent()
+    # Its conversations are kept in a bounded session service.
+    greeting_agent = GreetingAgent(session_service=BoundedSessionService(
+        max_sessions=max_sessions, ttl=session_ttl, keep_turns=keep_turns
+    ))
     # GreetingTaskManager adapts that logic to the A2A JSON-RPC protocol.
-    task_manager = GreetingTaskManager(agent=greeting_agent)
+    # Its tasks are kept in a bounded store (optionally persisted to SQLite).
+    task_manager = GreetingTaskManager(
+        agent=greeting_agent,
+        store=create_task_store(
+            max_tasks=max_tasks, ttl=task_ttl, db_path=task_db, cache_ttl=task_cache_ttl
+        )
+    )
 
     # -------------------------------------------------------------------------
     # 5) Create and start the A2A server
@@ -118,7 +150,12 @@ def main(host: str, port: int):
         host=host,
         port=port,
         agent_card=agent_card,
-        task_manager=task_manager
+        task_manager=task_manager,
+        max_in_flight=max_in_flight,
+        max_queue=max_queue,
+        queue_timeout=queue_timeout,
+        workers=workers,
+        max_pending=max_pending
     )
     server.start()  # Blocks here, serving requests until the process is killed
 
@@ -9,16 +9,18 @@
 # =============================================================================
 
 import logging                              # Built-in module to log info, warnings, errors
+from typing import AsyncIterable            # Type hint for the streaming generator
 from dotenv import load_dotenv              # For loading environment variables from a .env file
 
 load_dotenv()  # Read .env in project root so that GOOGLE_API_KEY (and others) are set
 
 # Gemini LLM agent and supporting services from Google’s ADK:
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import BaseSessionService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.runners import Runner
+from google.adk.agents.run_config import RunConfig, StreamingMode
 
 # Gemini types for wrapping messages
 from google.genai import types
@@ -27,12 +29,19 @@ from google.genai import types
 from google.adk.tools.function_tool import FunctionTool
 
 # Utilities we wrote for agent discovery and HTTP connection:
-from utilities.discovery import DiscoveryClient
-from agents.host_agent.agent_connect import AgentConnector
+from utilities.discovery import DiscoveryClient, REGISTRY_POLL_INTERVAL
+from utilities.session_service import BoundedSessionService
+from client.client import create_http_client
+from models.agent import AgentCard
+from agents.host_agent.agent_connect import AgentConnector, forward_partials
+from agents.host_agent.agent_connect import COALESCED_AGENTS, HedgePolicy, HEDGED_AGENTS
 
 # Create a module-level logger using this file’s name
 logger = logging.getLogger(__name__)
 
+# Seconds before a cached agent card is revalidated with the agent
+CARD_CACHE_TTL = 60.0
+
 
 class GreetingAgent:
     """
@@ -47,10 +56,15 @@ class GreetingAgent:
     # Declare which content types this agent accepts by default
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self):
+    def __init__(self, session_service: BaseSessionService | None = None):
         """
         🏗️ Constructor: build the internal orchestrator LLM, runner, discovery client.
+
+        Args:
+            session_service: Where conversations are kept
+                (default: a BoundedSessionService with default limits)
         """
+        self.session_service = session_service or BoundedSessionService()
         # Build the LLM with its tools and system instruction
         self.orchestrator = self._build_orchestrator()
 
@@ -62,16 +76,48 @@ class GreetingAgent:
             app_name=self.orchestrator.name,
             agent=self.orchestrator,
             artifact_service=InMemoryArtifactService(),       # file blobs, unused here
-            session_service=InMemorySessionService(),         # in-memory sessions
+            session_service=self.session_service,             # bounded in-memory sessions
             memory_service=InMemoryMemoryService(),           # conversation memory
         )
 
-        # A helper client to discover what agents are registered
-        self.discovery = DiscoveryClient()
+        # One connection pool for discovery and every agent we call
+        self._http = create_http_client()
+
+        # A helper client to discover what agents are registered.
+        # Cards are cached and refreshed in the background, so tool calls
+        # never wait on a registry sweep
+        self.discovery = DiscoveryClient(
+            http_client=self._http,
+            cache_ttl=CARD_CACHE_TTL,
+            on_change=self._on_cards_changed,
+            watch_interval=REGISTRY_POLL_INTERVAL    # Pick up registry edits without a restart
+        )
 
         # Cache for created connectors so we reuse them
         self.connectors: dict[str, AgentConnector] = {}
 
+    async def start(self):
+        """Load the agent directory and start refreshing it in the background."""
+        await self.discovery.start()
+
+    async def aclose(self):
+        """Stop refreshing the agent directory and close the connection pool."""
+        await self.discovery.stop()
+        await self._http.aclose()
+
+    def _on_cards_changed(self, cards: list[AgentCard]):
+        """
+        Discovery callback: forget connectors whose agent went away or moved,
+        so the next call builds one from the fresh cards.
+        """
+        urls: dict[str, set[str]] = {}
+        for card in cards:
+            urls.setdefault(card.name, set()).add(card.url)
+        for name, connector in list(self.connectors.items()):
+            if urls.get(name) != {replica.url for replica in connector.replicas}:
+                logger.info(f"GreetingAgent: agent {name} changed, dropping its connector")
+                del self.connectors[name]
+
 
     def _build_orchestrator(self) -> LlmAgent:
         """
@@ -96,7 +142,7 @@ class GreetingAgent:
             Given an agent_name string and a user message,
             find that agent’s URL, send the task, and return its reply.
             """
-            # Re-fetch registry each call to catch new agents dynamically
+            # Cached directory, refreshed in the background (no network here)
             cards = await self.discovery.list_agent_cards()
 
             # Try to match exactly by name or id (case-insensitive)
@@ -114,6 +160,12 @@ class GreetingAgent:
                     None
                 )
 
+            # Fallback: the LLM may describe the capability instead of
+            # naming the agent ("time agent") — search skills and tags
+            if not matched:
+                best = await self.discovery.find_agents(agent_name, top_k=1)
+                matched = best[0].card if best else None
+
             # If still nothing, error out
             if not matched:
                 raise ValueError(f"Agent '{agent_name}' not found.")
@@ -121,25 +173,25 @@ class GreetingAgent:
             # Use Pydantic model’s name field as key
             key = matched.name
             # If we haven’t built a connector yet, create and cache one
+            # (every card with that name is a replica of the same agent)
             if key not in self.connectors:
+                replicas = [c for c in cards if c.name == key]
                 self.connectors[key] = AgentConnector(
                     name=matched.name,
-                    base_url=matched.url
+                    base_url=[c.url for c in replicas],
+                    http_client=self._http,
+                    streaming=all(c.capabilities.streaming for c in replicas),
+                    hedge=HedgePolicy() if key in HEDGED_AGENTS else None,
+                    coalesce=key in COALESCED_AGENTS
                 )
             connector = self.connectors[key]
 
             # Use a single session per greeting agent run (could be improved)
             session_id = self.user_id
 
-            # Delegate the task and wait for the full Task object
-            task = await connector.send_task(message, session_id=session_id)
-
-            # Pull the final agent reply out of the history
-            if task.history and task.history[-1].parts:
-                return task.history[-1].parts[0].text
-
-            # If no reply, return empty string
-            return ""
+            # Delegate the task and wait for the agent's reply
+            # (streamed upstream as it arrives when we are streaming too)
+            return await connector.stream_reply(message, session_id=session_id)
 
 
         # --- System instruction for the LLM ---
@@ -222,4 +274,57 @@ class GreetingAgent:
             return ""
 
         # 📤 Extract and join all text responses into one string
-        return "\n".join([p.text for p in last_event.content.parts if p.text])
\ No newline at end of file
+        return "\n".join([p.text for p in last_event.content.parts if p.text])
+
+    async def stream(self, query: str, session_id: str) -> AsyncIterable[dict]:
+        """
+        🌀 Public: same pipeline as invoke(), but yields Gemini's reply as it's
+        generated (Runner in SSE streaming mode), along with the partial
+        replies of the agents it calls.
+
+        Yields:
+            dict: {"is_task_complete": False, "content": <partial text>} for each chunk,
+                  then {"is_task_complete": True, "content": <full reply>}
+        """
+        async for item in forward_partials(self._stream(query, session_id)):
+            yield item
+
+    async def _stream(self, query: str, session_id: str) -> AsyncIterable[dict]:
+        """The greeting agent's own streamed reply (see stream())."""
+        session = await self.runner.session_service.get_session(
+            app_name=self.orchestrator.name,
+            user_id=self.user_id,
+            session_id=session_id,
+        )
+        if session is None:
+            session = await self.runner.session_service.create_session(
+                app_name=self.orchestrator.name,
+                user_id=self.user_id,
+                session_id=session_id,
+                state={},
+            )
+
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+
+        # 🚀 Tool calls run as usual; only model text is forwarded as it streams
+        async for event in self.runner.run_async(
+            user_id=self.user_id,
+            session_id=session.id,
+            new_message=content,
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE)
+        ):
+            if not event.content or not event.content.parts:
+                continue
+
+            text = "".join(p.text for p in event.content.parts if p.text)
+            if event.is_final_response():
+                yield {"is_task_complete": True, "content": text}
+                return
+            if event.partial and text:
+                yield {"is_task_complete": False, "content": text}
+
+        # 🧹 Fallback: the run ended without a final response
+        yield {"is_task_complete": True, "content": ""}
@@ -17,13 +17,18 @@ import logging                            # Python's built-in logging module
 
 # InMemoryTaskManager provides an in-memory store and locking for tasks
 from server.task_manager import InMemoryTaskManager
+from server.task_store import TaskStore    # Pluggable task storage (RAM or SQLite)
 
 # Data models for handling A2A JSON-RPC requests/responses and task structures
 from models.request import SendTaskRequest, SendTaskResponse
+from models.request import SendTaskStreamingRequest, SendTaskStreamingResponse
+from typing import AsyncIterable
 from models.task import Message, TaskStatus, TaskState, TextPart
 
 # The core business logic: GreetingAgent with an async invoke() method
 from agents.greeting_agent.agent import GreetingAgent
+# Its session service, whose counters we report
+from utilities.session_service import BoundedSessionService
 
 # -----------------------------------------------------------------------------
 # 🪵 Logger setup
@@ -42,21 +47,23 @@ class GreetingTaskManager(InMemoryTaskManager):
       * call the GreetingAgent.invoke() to craft a greeting
       * update the task status and history
       * wrap and return the result as SendTaskResponse
+    - Overrides on_send_task_subscribe() to stream the greeting as it's written
 
     Note:
     - GreetingAgent.invoke() is asynchronous, but on_send_task()
       itself is also defined as async, so we await internal calls.
     """
-    def __init__(self, agent: GreetingAgent):
+    def __init__(self, agent: GreetingAgent, store: TaskStore | None = None):
         """
         Initialize the TaskManager with a GreetingAgent instance.
 
         Args:
             agent (GreetingAgent): The core logic handler that knows how to
                                    produce a greeting.
+            store (TaskStore): Where tasks are kept (default: in RAM, no limits)
         """
-        # Call the parent constructor to set up self.tasks and self.lock
-        super().__init__()
+        # Call the parent constructor to set up self.tasks and its locks
+        super().__init__(store=store)
         # Store a reference to our GreetingAgent for later use
         self.agent = agent
 
@@ -75,6 +82,28 @@ class GreetingTaskManager(InMemoryTaskManager):
         # We take the first element's .text attribute.
         return request.params.message.parts[0].text
 
+    async def start(self, workers: int = 0, max_pending: int = 0):
+        """
+        Called by the A2A server on startup: start background work, then
+        load the agent directory and keep it fresh in the background.
+        """
+        await super().start(workers=workers, max_pending=max_pending)
+        await self.agent.start()
+
+    async def stop(self):
+        """
+        Called by the A2A server on shutdown: stop background work, then
+        stop refreshing the agent directory and close connections.
+        """
+        await super().stop()
+        await self.agent.aclose()
+
+    def agent_stats(self) -> dict:
+        """Conversation session counters and token estimates, for GET /metrics."""
+        if isinstance(self.agent.session_service, BoundedSessionService):
+            return {"sessions": self.agent.session_service.stats()}
+        return {}
+
     async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
         """
         Handle a new greeting task:
@@ -118,13 +147,36 @@ class GreetingTaskManager(InMemoryTaskManager):
         )
 
         # Step 5: Update the task status to COMPLETED and append our reply
-        # Use the lock to avoid race conditions with other coroutines.
-        async with self.lock:
-            # Mark the task as done
-            task.status = TaskStatus(state=TaskState.COMPLETED)
-            # Add the agent's reply to the task's history
-            task.history.append(reply_message)
+        # update_store() takes this task's lock to avoid race conditions.
+        task = await self.update_store(
+            task.id,
+            TaskStatus(state=TaskState.COMPLETED),  # Mark the task as done
+            reply_message                           # Add the agent's reply to the history
+        )
 
         # Step 6: Return a SendTaskResponse, containing the JSON-RPC id
         # (mirroring the request.id) and the updated Task model.
         return SendTaskResponse(id=request.id, result=task)
+
+    async def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Handle a greeting task over SSE ("tasks/sendSubscribe").
+
+        Same flow as on_send_task(), except GreetingAgent.stream() is used so
+        the client sees the greeting while Gemini is still writing it.
+
+        Args:
+            request (SendTaskStreamingRequest): The JSON-RPC request with TaskSendParams
+
+        Yields:
+            SendTaskStreamingResponse: Status and artifact events for the task
+        """
+        logger.info(f"GreetingTaskManager streaming task {request.params.id}")
+
+        user_text = self._get_user_text(request)
+        updates = self.agent.stream(user_text, request.params.sessionId)
+
+        async for response in self.stream_agent_updates(request, updates):
+            yield response
@@ -5,19 +5,418 @@
 # Provides a simple wrapper (`AgentConnector`) around the A2AClient to send tasks
 # to any remote agent identified by a base URL. This decouples the Orchestrator
 # from low-level HTTP details and HTTP client setup.
+#
+# All connectors can share one pooled HTTP client (see create_http_client),
+# so calls to a child reuse open keep-alive connections.
+#
+# If the caller is canceled while waiting (e.g., the user's task was canceled
+# on the orchestrator), the remote task is canceled too.
+#
+# An agent may run as several replicas (registry entries whose cards share
+# a name). The connector spreads calls over them with "power of two
+# choices": pick two replicas at random, use the one with fewer calls in
+# flight. Calls of one session stick to the replica that served it first,
+# since agents keep per-session state.
+#
+# Each replica has a CircuitBreaker: after repeated failures it stops
+# calling that replica for a while (it's ejected from the balancing) and
+# fails fast if no replica is left, then lets a single probe call through
+# to detect recovery.
+#
+# Hedging (opt-in, for read-only agents): if a reply takes longer than most
+# replies do (a latency percentile), the same task is sent once more, to
+# another replica if there is one. The first answer wins and the other call
+# is canceled. A budget caps hedges at a fraction of all calls.
+#
+# Streaming: when an agent is itself streaming its reply (its `stream()` is
+# wrapped in `forward_partials()`), `AgentConnector.stream_reply()` calls the
+# child with "tasks/sendSubscribe" and passes the child's partial output
+# straight up the caller's own stream, so multi-hop chains (orchestrator ->
+# greeting -> tell-time) show progress as soon as the last hop produces it.
+#
+# Coalescing (opt-in, for idempotent agents): identical messages sent while
+# one is already in flight don't start another call; they wait for the
+# running one and get its reply ("singleflight"). A spike of N users asking
+# the same question costs one child call instead of N.
 # =============================================================================
 
+import asyncio                        # Used to detect and propagate cancellation
+import random                         # Power-of-two-choices replica selection
+import time                           # Monotonic clock for the circuit breaker
 import uuid                           # Standard library for generating unique IDs
 import logging                        # Standard library for configurable logging
+from collections import OrderedDict, deque  # Session bindings (LRU), recent latencies
+from contextlib import asynccontextmanager  # For `async with breaker.guard():`
+from contextvars import ContextVar    # Where partial child output is forwarded to
+from typing import AsyncIterable, Awaitable, Callable    # Type hints
 
 # Import our custom A2AClient which handles JSON-RPC task requests
-from client.client import A2AClient
+from client.client import A2AClient, A2AClientHTTPError, A2AClientRPCError, RetryPolicy
+from models.json_rpc import MethodNotFoundError, ServerBusyError, TaskNotFoundError
+import httpx                          # Type of the optional shared HTTP client
 # Import Task model to represent the full task response
 from models.task import Task
+from models.task import TaskArtifactUpdateEvent, TaskStatusUpdateEvent
 
 # Create a logger for this module using its namespace
 logger = logging.getLogger(__name__)
 
+# Max seconds spent telling a child agent to cancel before giving up
+CANCEL_TIMEOUT = 2.0
+
+# Queue of the stream currently being produced (set by forward_partials);
+# None while the agent is answering a plain, non-streaming request
+_partial_sink: ContextVar[asyncio.Queue | None] = ContextVar("partial_sink", default=None)
+
+# Marks the end of the agent's own updates in forward_partials()
+_DONE = object()
+
+# Max sessions remembered for replica stickiness (least recently used dropped)
+MAX_STICKY_SESSIONS = 10000
+
+# Read-only, stateless agents: running one of their tasks twice is harmless,
+# so slow calls to them are hedged. The hedge may go to another replica, so
+# agents that keep per-session state in the process (DoctorRecommendationAgent
+# remembers the list it showed, to resolve "2") must not be listed here.
+HEDGED_AGENTS = {"TellTimeAgent"}
+
+# Idempotent agents: the reply depends only on the message, not on the
+# session, so concurrent identical calls to them share one child call.
+# Flights are keyed by message only, so agents whose reply depends on the
+# session's history (GreetingAgent keeps an LLM conversation per session)
+# must not be listed here: users would get each other's replies
+COALESCED_AGENTS = {"TellTimeAgent"}
+
+
+# -----------------------------------------------------------------------------
+# forward_partials: Merge child agents' partial output into a stream
+# -----------------------------------------------------------------------------
+async def forward_partials(updates: AsyncIterable[dict]) -> AsyncIterable[dict]:
+    """
+    Wrap an agent's `stream()` so that partial output of the child agents it
+    calls (through AgentConnector.stream_reply) is yielded as it arrives,
+    in between the agent's own updates.
+
+    Args:
+        updates: The agent's own stream of
+            {"is_task_complete": bool, "content": str} dicts
+
+    Yields:
+        dict: The same dicts, plus {"is_task_complete": False, "content": ...}
+              for every partial reply of a child agent
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump():
+        # Tools run inside this task, so connectors find the queue here
+        _partial_sink.set(queue)
+        try:
+            async for item in updates:
+                queue.put_nowait(item)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(_DONE)
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+            if item["is_task_complete"]:
+                return
+    finally:
+        # The consumer went away (or the reply is complete): stop the agent
+        pump_task.cancel()
+        await asyncio.gather(pump_task, return_exceptions=True)
+
+
+def mute_partials():
+    """
+    Stop forwarding child partial output from the current task (and tasks it
+    starts), e.g. for concurrent child calls whose chunks would interleave.
+    Other tasks are unaffected: each has its own copy of the context.
+    """
+    _partial_sink.set(None)
+
+
+# -----------------------------------------------------------------------------
+# CircuitOpenError: Raised instead of calling a child that is known to be down
+# -----------------------------------------------------------------------------
+class CircuitOpenError(Exception):
+    """Raised when a connector's circuit breaker is open (the child is failing)."""
+    pass
+
+
+# -----------------------------------------------------------------------------
+# CircuitBreaker: Fail fast while a child agent is down
+# -----------------------------------------------------------------------------
+class CircuitBreaker:
+    """
+    ⚡ Classic three-state circuit breaker.
+
+    - closed:    calls go through; `failure_threshold` failures in a row open it
+    - open:      calls fail immediately with CircuitOpenError for `reset_timeout` seconds
+    - half-open: one probe call goes through (others still fail fast);
+                 success closes the breaker, failure opens it again
+
+    Only signs that the child is unhealthy count as failures: connection
+    errors, timeouts, HTTP errors and "server busy". Other JSON-RPC errors
+    (e.g., task not found) prove the child is up.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the breaker
+        reset_timeout (float): Seconds to stay open before probing again
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = self.CLOSED
+        self.failures = 0           # Consecutive failures
+        self._opened_at = 0.0       # When the breaker last opened
+        self._probing = False       # True while the half-open probe is running
+
+        # 📊 Counters
+        self.rejected = 0           # Calls failed fast while open
+        self.opened = 0             # Times the breaker opened
+
+    @asynccontextmanager
+    async def guard(self):
+        """
+        Wrap one call to the child:
+
+            async with breaker.guard():
+                await client.send_task(...)
+
+        Raises:
+            CircuitOpenError: if the call isn't allowed right now
+        """
+        self._before_call()
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            self._probing = False       # Inconclusive; let the next call probe
+            raise
+        except Exception as e:
+            if self.is_failure(e):
+                self._on_failure()
+            else:
+                self._on_success()
+            raise
+        else:
+            self._on_success()
+
+    def is_failure(self, error: Exception) -> bool:
+        """True if `error` means the child is unhealthy."""
+        if isinstance(error, A2AClientRPCError):
+            return error.code == ServerBusyError().code
+        return isinstance(error, (httpx.TransportError, A2AClientHTTPError, TimeoutError))
+
+    def available(self) -> bool:
+        """True if a call would be let through right now (checking doesn't start a probe)."""
+        if self.state == self.OPEN:
+            return time.monotonic() - self._opened_at >= self.reset_timeout
+        if self.state == self.HALF_OPEN:
+            return not self._probing
+        return True
+
+    def _before_call(self):
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError("circuit open")
+            self.state = self.HALF_OPEN     # Waited long enough: try one probe
+
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self.rejected += 1
+                raise CircuitOpenError("circuit half-open, probe in progress")
+            self._probing = True
+
+    def _on_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def _on_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opened += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+# -----------------------------------------------------------------------------
+# HedgePolicy: When to send a second copy of a slow call
+# -----------------------------------------------------------------------------
+class HedgePolicy:
+    """
+    🦔 Decides when a call is slow enough to be hedged, within a budget.
+
+    The hedge delay is the `percentile` of the last `window` successful call
+    latencies, clamped to [min_delay, max_delay]; until `min_samples` calls
+    were measured, nothing is hedged. With percentile=0.95 roughly the
+    slowest 5% of calls get a second copy.
+
+    The budget is a token bucket: every call adds `budget` tokens (up to
+    `burst`) and every hedge spends one, so in the long run at most
+    `budget` x calls are hedged (0.1 = 10% extra load at most).
+
+    Attributes:
+        percentile (float): Latency percentile used as the hedge delay (0-1)
+        budget (float): Max hedges per call, on average
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.1,
+        min_delay: float = 0.05,
+        max_delay: float = 10.0,
+        window: int = 200,
+        min_samples: int = 20,
+        burst: float = 10.0
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.burst = burst
+
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._tokens = 0.0
+
+        # 📊 Counters
+        self.calls = 0      # Calls that could have been hedged
+        self.hedged = 0     # Calls that sent a second copy
+        self.won = 0        # Hedged calls answered first by the copy
+
+    def record(self, latency: float):
+        """Remember the latency (seconds) of a successful call."""
+        self._latencies.append(latency)
+
+    def delay(self) -> float | None:
+        """Seconds to wait before hedging a new call (None = don't hedge it)."""
+        self.calls += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+        return self.current_delay()
+
+    def allow(self) -> bool:
+        """Spend one budget token on a hedge, if there is one."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.hedged += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "won": self.won,
+            "delay": self.current_delay(),
+        }
+
+    def current_delay(self) -> float | None:
+        """The hedge delay right now, without counting a call."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        value = ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+        return min(self.max_delay, max(self.min_delay, value))
+
+
+# -----------------------------------------------------------------------------
+# Replica: One endpoint of an agent
+# -----------------------------------------------------------------------------
+class Replica:
+    """
+    🖥️ One running copy of an agent, with its own client and circuit breaker.
+
+    Attributes:
+        url (str): The replica's base URL
+        client (A2AClient): Client bound to that URL
+        breaker (CircuitBreaker): Ejects the replica while it's failing
+        outstanding (int): Calls currently in flight
+    """
+
+    def __init__(self, url: str, client: A2AClient, breaker: CircuitBreaker):
+        self.url = url
+        self.client = client
+        self.breaker = breaker
+        self.outstanding = 0
+        self.calls = 0              # Calls sent to this replica
+
+    @asynccontextmanager
+    async def call(self):
+        """Count one call in flight, under the replica's breaker."""
+        async with self.breaker.guard():
+            self.outstanding += 1
+            self.calls += 1
+            try:
+                yield self.client
+            finally:
+                self.outstanding -= 1
+
+    def stats(self) -> dict:
+        return {
+            "url": self.url,
+            "outstanding": self.outstanding,
+            "calls": self.calls,
+            "breaker": self.breaker.stats(),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Flight: One call shared by every caller sending the same message
+# -----------------------------------------------------------------------------
+class Flight:
+    """
+    ✈️ A child call in progress, awaited by one or more callers.
+
+    Attributes:
+        task (asyncio.Task): Runs the call, independently of any one caller
+        waiters (int): Callers currently waiting for it
+    """
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+    async def join(self):
+        """
+        Wait for the call's result. A caller that is canceled stops waiting;
+        the call itself is canceled only when nobody waits for it anymore.
+        """
+        self.waiters += 1
+        try:
+            return await asyncio.shield(self.task)
+        finally:
+            self.waiters -= 1
+            if self.waiters == 0 and not self.task.done():
+                self.task.cancel()
+
 
 class AgentConnector:
     """
@@ -25,23 +424,118 @@ class AgentConnector:
 
     Attributes:
         name (str): Human-readable identifier of the remote agent.
-        client (A2AClient): HTTP client pointing at the agent's URL.
+        replicas (list[Replica]): The agent's endpoints (usually just one).
+        streaming (bool): The agent supports "tasks/sendSubscribe"
+        hedge (HedgePolicy | None): Hedges slow calls if set (read-only agents only)
+        coalesce (bool): Identical concurrent calls share one child call
+            (idempotent agents only)
     """
 
-    def __init__(self, name: str, base_url: str):
+    def __init__(
+        self,
+        name: str,
+        base_url: str | list[str],
+        http_client: httpx.AsyncClient | None = None,
+        retry: RetryPolicy | None = None,
+        breaker_factory: Callable[[], CircuitBreaker] = CircuitBreaker,
+        streaming: bool = False,
+        max_sessions: int = MAX_STICKY_SESSIONS,
+        hedge: HedgePolicy | None = None,
+        coalesce: bool = False
+    ):
         """
         Initialize the connector for a specific remote agent.
 
         Args:
             name (str): Identifier for the agent (e.g., "TellTimeAgent").
-            base_url (str): The HTTP endpoint (e.g., "http://localhost:10000").
+            base_url (str | list[str]): The HTTP endpoint (e.g.,
+                "http://localhost:10000"), or one per replica of the agent.
+            http_client (httpx.AsyncClient, optional): Shared connection pool;
+                if omitted, each replica's A2AClient creates its own.
+            retry (RetryPolicy, optional): How failed calls are retried.
+            breaker_factory (callable): Builds the CircuitBreaker of each
+                replica (default: CircuitBreaker with default thresholds).
+            streaming (bool): Whether the agent card advertises streaming;
+                only then does stream_reply() use "tasks/sendSubscribe".
+            max_sessions (int): Sessions remembered for replica stickiness.
+            hedge (HedgePolicy, optional): Send a second copy of slow calls.
+                Only for agents where running a task twice is harmless.
+            coalesce (bool): Let concurrent calls with the same message share
+                one call. Only for agents whose reply doesn't depend on the
+                session: every caller gets the reply of the first one's task.
         """
+        urls = [base_url] if isinstance(base_url, str) else list(dict.fromkeys(base_url))
+        if not urls:
+            raise ValueError(f"No URL given for agent {name}")
+
         # Store the agent’s name for logging and reference
         self.name = name
-        # Instantiate an A2AClient bound to the agent’s base URL
-        self.client = A2AClient(url=base_url)
+        # One A2AClient and one breaker per replica, so one failing replica
+        # (or child agent) doesn't affect the others
+        self.replicas = [
+            Replica(url, A2AClient(url=url, http_client=http_client, retry=retry), breaker_factory())
+            for url in urls
+        ]
+        self.streaming = streaming
+        self.hedge = hedge
+
+        # session ID -> URL of the replica serving it, least recently used first
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, str] = OrderedDict()
+
+        # (kind of call, message) -> the call in flight, while coalescing
+        self.coalesce = coalesce
+        self._flights: dict[tuple[str, str], Flight] = {}
+        self.flights = 0            # Calls actually sent while coalescing
+        self.coalesced = 0          # Calls that joined one already in flight
+
         # Log that the connector is ready for use
-        logger.info(f"AgentConnector: initialized for {self.name} at {base_url}")
+        logger.info(f"AgentConnector: initialized for {self.name} at {', '.join(urls)}")
+
+    # -------------------------------------------------------------------------
+    # ⚖️ pick: Choose the replica for a call
+    # -------------------------------------------------------------------------
+    def pick(self, session_id: str | None = None, exclude: set[str] = frozenset()) -> Replica:
+        """
+        Choose a replica: the one already serving `session_id` if it's healthy,
+        else the less busy of two random healthy replicas.
+
+        Args:
+            session_id: Session of the call (None = no stickiness)
+            exclude: URLs of replicas not to use (e.g., one that just failed)
+
+        Raises:
+            CircuitOpenError: if every replica is failing
+        """
+        healthy = [
+            replica for replica in self.replicas
+            if replica.url not in exclude and replica.breaker.available()
+        ]
+        if not healthy:
+            raise CircuitOpenError(f"{self.name}: no healthy replica")
+
+        if session_id is not None:
+            url = self._sessions.get(session_id)
+            if url is not None:
+                for replica in healthy:
+                    if replica.url == url:
+                        self._sessions.move_to_end(session_id)
+                        return replica
+                logger.info(f"AgentConnector: moving session {session_id} of {self.name} off {url}")
+
+        # ⚖️ Power of two choices: nearly as good as least-loaded, without a global scan
+        if len(healthy) == 1:
+            replica = healthy[0]
+        else:
+            first, second = random.sample(healthy, 2)
+            replica = first if first.outstanding <= second.outstanding else second
+
+        if session_id is not None:
+            self._sessions[session_id] = replica.url
+            self._sessions.move_to_end(session_id)
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return replica
 
     async def send_task(self, message: str, session_id: str) -> Task:
         """
@@ -53,12 +547,227 @@ class AgentConnector:
 
         Returns:
             Task: The full Task object (including history) from the remote agent.
+
+        Raises:
+            CircuitOpenError: if the agent has been failing and isn't called right now
+        """
+        return await self._coalesced("send", message, lambda: self._send_task(message, session_id))
+
+    async def _send_task(self, message: str, session_id: str) -> Task:
+        """send_task() without coalescing."""
+        # Build the JSON-RPC payload with a new unique task ID
+        payload = self._payload(message, session_id)
+        replica = self.pick(session_id)
+
+        if self.hedge is not None:
+            task_result = await self._send_hedged(payload, replica)
+        else:
+            task_result = await self._send(payload, replica)
+        # Log receipt of the completed task for debugging/tracing
+        logger.info(f"AgentConnector: received response from {self.name} for task {task_result.id}")
+        # Return the Task Pydantic model for further processing by the orchestrator
+        return task_result
+
+    async def _send(self, payload: dict, replica: Replica, failover: bool = True) -> Task:
+        """
+        Send one task to `replica`, failing over to another replica if it
+        never reached this one, and cancel it remotely if we're canceled.
+        """
+        task_id = payload["id"]
+        session_id = payload["sessionId"]
+        failed: set[str] = set()
+
+        # Use the replica's A2AClient to send the task and await the response
+        while True:
+            start = time.monotonic()
+            try:
+                async with replica.call() as client:
+                    task_result = await client.send_task(payload)
+                if self.hedge is not None:
+                    self.hedge.record(time.monotonic() - start)
+                return task_result
+            except CircuitOpenError:
+                logger.warning(f"AgentConnector: {self.name} at {replica.url} is unavailable (circuit {replica.breaker.state})")
+                raise
+            except asyncio.CancelledError:
+                # Our own task was canceled: stop the remote work as well, then re-raise
+                await self._cancel_remote(replica, task_id)
+                raise
+            except Exception as e:
+                # The task never reached this replica (down, busy): try another one
+                if not failover or not replica.client.retry.should_retry(e, idempotent=False):
+                    raise
+                failed.add(replica.url)
+                try:
+                    replica = self.pick(session_id, exclude=failed)
+                except CircuitOpenError:
+                    raise e from None
+                logger.info(f"AgentConnector: {self.name} failing over to {replica.url} ({e!r})")
+
+    # -------------------------------------------------------------------------
+    # 🦔 _send_hedged: Race a second copy against a slow call
+    # -------------------------------------------------------------------------
+    async def _send_hedged(self, payload: dict, replica: Replica) -> Task:
         """
-        # Generate a unique ID for this task using uuid4, hex form
-        task_id = uuid.uuid4().hex
-        # Build the JSON-RPC payload matching TaskSendParams schema
-        payload = {
-            "id": task_id,
+        Send the task; if it's still running after the hedge delay (and the
+        budget allows), send a copy with its own task ID to another replica
+        (the same one if there's no other). Return whichever answers first;
+        the other call is canceled, locally and on its replica.
+        """
+        calls = [asyncio.create_task(self._send(payload, replica))]
+        try:
+            delay = self.hedge.delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(calls, timeout=delay)
+                if not done and self.hedge.allow():
+                    calls.append(asyncio.create_task(self._send_copy(payload, replica)))
+
+            # First successful answer wins; a failure only counts once both failed
+            pending = set(calls)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for call in calls:
+                    if call in done and not call.exception():
+                        if call is not calls[0]:
+                            self.hedge.won += 1
+                        return call.result()
+                if not pending:
+                    return calls[0].result()    # Raises the primary call's error
+        finally:
+            for call in calls:
+                call.cancel()
+            await asyncio.gather(*calls, return_exceptions=True)
+
+    async def _send_copy(self, payload: dict, primary: Replica) -> Task:
+        """The hedge: same message and session, new task ID, preferably another replica."""
+        try:
+            # Not bound to the session: the session stays on its own replica
+            replica = self.pick(exclude={primary.url})
+        except CircuitOpenError:
+            replica = primary
+        logger.info(f"AgentConnector: hedging task {payload['id']} of {self.name} on {replica.url}")
+        return await self._send({**payload, "id": uuid.uuid4().hex}, replica, failover=False)
+
+    async def send_task_streaming(
+        self, message: str, session_id: str
+    ) -> AsyncIterable[TaskStatusUpdateEvent | TaskArtifactUpdateEvent]:
+        """
+        Send a text task with "tasks/sendSubscribe" and yield the agent's
+        status and artifact events as they arrive.
+
+        Args:
+            message (str): What you want the agent to do.
+            session_id (str): Session identifier to group related calls.
+
+        Raises:
+            CircuitOpenError: if the agent has been failing and isn't called right now
+        """
+        payload = self._payload(message, session_id)
+        task_id = payload["id"]
+        replica = self.pick(session_id)
+
+        try:
+            async with replica.call() as client:
+                async for event in client.send_task_streaming(payload):
+                    yield event
+        except CircuitOpenError:
+            logger.warning(f"AgentConnector: {self.name} at {replica.url} is unavailable (circuit {replica.breaker.state})")
+            raise
+        except asyncio.CancelledError:
+            await self._cancel_remote(replica, task_id)
+            raise
+        logger.info(f"AgentConnector: stream from {self.name} for task {task_id} finished")
+
+    async def stream_reply(self, message: str, session_id: str) -> str:
+        """
+        Send a text task and return the agent's reply text.
+
+        While the caller is streaming its own reply (inside forward_partials),
+        the task is streamed and every partial reply of the agent is forwarded
+        upstream right away. Otherwise, or if the agent can't stream, this is
+        a plain send_task().
+
+        Args:
+            message (str): What you want the agent to do.
+            session_id (str): Session identifier to group related calls.
+
+        Returns:
+            str: The agent's final reply ("" if it sent none)
+        """
+        return await self._coalesced("reply", message, lambda: self._stream_reply(message, session_id))
+
+    async def _stream_reply(self, message: str, session_id: str) -> str:
+        """stream_reply() without coalescing."""
+        sink = _partial_sink.get()
+        if sink is not None and self.streaming:
+            try:
+                return await self._stream_to(sink, message, session_id)
+            except A2AClientRPCError as e:
+                if e.code != MethodNotFoundError().code:
+                    raise
+                # The card said it streams, but the server doesn't: stop trying
+                logger.info(f"AgentConnector: {self.name} does not support streaming")
+                self.streaming = False
+
+        task = await self._send_task(message, session_id)
+        if task.history and len(task.history) > 1:
+            return task.history[-1].parts[0].text
+        return ""
+
+    async def _stream_to(self, sink: asyncio.Queue, message: str, session_id: str) -> str:
+        """Stream a task, forward its partial replies to `sink`, return the final text."""
+        reply = None
+        async for event in self.send_task_streaming(message, session_id):
+            if isinstance(event, TaskArtifactUpdateEvent):
+                text = "".join(part.text for part in event.artifact.parts)
+                reply = text if reply is None else reply + text
+            elif event.status.message is not None:
+                text = "".join(part.text for part in event.status.message.parts)
+                if event.final:
+                    # Failed / canceled tasks explain why in their final status
+                    reply = text if reply is None else reply
+                elif text:
+                    sink.put_nowait({"is_task_complete": False, "content": text})
+        return reply or ""
+
+    # -------------------------------------------------------------------------
+    # ✈️ _coalesced: Share one call between identical concurrent calls
+    # -------------------------------------------------------------------------
+    async def _coalesced(self, kind: str, message: str, call: Callable[[], Awaitable]):
+        """
+        Run `call()`, or, if a call of the same kind with the same message is
+        already in flight, wait for that one's result (or error) instead.
+
+        The shared call runs in its own asyncio task (with the first caller's
+        context, so its partial replies reach the first caller's stream;
+        callers that join later only get the final reply).
+        """
+        if not self.coalesce:
+            return await call()
+
+        key = (kind, message)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = Flight(asyncio.create_task(call()))
+            self._flights[key] = flight
+            self.flights += 1
+
+            def landed(task: asyncio.Task):
+                # Later calls start a new flight: the reply may change over time
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                if not task.cancelled():
+                    task.exception()    # Retrieved here too, if every caller left
+            flight.task.add_done_callback(landed)
+        else:
+            self.coalesced += 1
+            logger.info(f"AgentConnector: joining the call in flight to {self.name} for {message!r}")
+        return await flight.join()
+
+    def _payload(self, message: str, session_id: str) -> dict:
+        """Build TaskSendParams for a text message, with a new unique task ID."""
+        return {
+            "id": uuid.uuid4().hex,
             "sessionId": session_id,
             "message": {
                 "role": "user",                # Indicates this message is from the user
@@ -68,9 +777,43 @@ class AgentConnector:
             }
         }
 
-        # Use the A2AClient to send the task asynchronously and await the response
-        task_result = await self.client.send_task(payload)
-        # Log receipt of the completed task for debugging/tracing
-        logger.info(f"AgentConnector: received response from {self.name} for task {task_id}")
-        # Return the Task Pydantic model for further processing by the orchestrator
-        return task_result
+    def stats(self) -> dict:
+        """Per-replica load and breaker state, sticky sessions, hedging and coalescing counters."""
+        return {
+            "replicas": [replica.stats() for replica in self.replicas],
+            "sessions": len(self._sessions),
+            "hedge": self.hedge.stats() if self.hedge is not None else None,
+            "coalesce": {
+                "flights": self.flights,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._flights),
+            } if self.coalesce else None,
+        }
+
+    async def aclose(self):
+        """Release the connector's pooled connections (a shared pool stays open)."""
+        for replica in self.replicas:
+            await replica.client.aclose()
+
+    async def _cancel_remote(self, replica: Replica, task_id: str):
+        """
+        Best-effort "tasks/cancel" for a task we stopped waiting for.
+        Errors (agent down, task already finished, ...) are only logged.
+
+        Args:
+            replica (Replica): The replica the task was sent to.
+            task_id (str): ID of the task sent to the remote agent.
+        """
+        logger.info(f"AgentConnector: canceling task {task_id} on {self.name} at {replica.url}")
+        try:
+            # Shielded so a second cancellation doesn't abort the cancel request itself
+            await asyncio.wait_for(
+                asyncio.shield(replica.client.cancel_task({"id": task_id})),
+                CANCEL_TIMEOUT
+            )
+        except A2AClientRPCError as e:
+            if e.code != TaskNotFoundError().code:
+                logger.warning(f"AgentConnector: could not cancel task {task_id} on {self.name}: {e}")
+            # Not found: the request never arrived (e.g., a hedge canceled right away)
+        except Exception as e:
+            logger.warning(f"AgentConnector: could not cancel task {task_id} on {self.name}: {e}")
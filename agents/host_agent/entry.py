@@ -12,9 +12,16 @@ import logging                              # Standard Python logging module
 import click                                # Library for building CLI interfaces
 
 # Utility for discovering remote A2A agents from a local registry
-from utilities.discovery import DiscoveryClient
+from utilities.discovery import DiscoveryClient, REGISTRY_POLL_INTERVAL
+# Local fast-path router (answers easy queries without the LLM)
+from agents.host_agent.router import IntentRouter, RoutingCache, ROUTER_THRESHOLD
+from agents.host_agent.router import ROUTING_CACHE_SIZE, ROUTING_CACHE_TTL
 # Shared A2A server implementation (Starlette + JSON-RPC)
 from server.server import A2AServer
+from server.cli import admission_options, worker_options, store_options, session_options
+from server.task_store import create_task_store
+# Conversation sessions with an idle TTL, an LRU limit and history compaction
+from utilities.session_service import BoundedSessionService
 # Pydantic models for defining agent metadata (AgentCard, etc.)
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
 # Orchestrator implementation and its task manager
@@ -45,7 +52,32 @@ logger = logging.getLogger(__name__)
         "Defaults to utilities/agent_registry.json"
     )
 )
-def main(host: str, port: int, registry: str):
+@click.option(
+    "--registry-poll", default=REGISTRY_POLL_INTERVAL, show_default=True,
+    help="Seconds between checks of the registry file for added or removed agents (0 = never)"
+)
+@click.option(
+    "--router-threshold", default=ROUTER_THRESHOLD, show_default=True,
+    help="Min confidence for the local router to skip the LLM (0 = never skip it)"
+)
+@click.option(
+    "--routing-cache-size", default=ROUTING_CACHE_SIZE, show_default=True,
+    help="Queries whose LLM routing decision is remembered (0 = no routing cache)"
+)
+@click.option(
+    "--routing-cache-ttl", default=ROUTING_CACHE_TTL, show_default=True,
+    help="Seconds a remembered routing decision is reused"
+)
+@admission_options
+@worker_options
+@store_options
+@session_options
+def main(host: str, port: int, registry: str, registry_poll: float, router_threshold: float,
+         routing_cache_size: int, routing_cache_ttl: float,
+         max_in_flight: int, max_queue: int, queue_timeout: float,
+         workers: int, max_pending: int, max_tasks: int, task_ttl: float,
+         task_db: str | None, task_cache_ttl: float,
+         max_sessions: int, session_ttl: float, keep_turns: int):
     """
     Entry point to start the OrchestratorAgent A2A server.
 
@@ -55,11 +87,20 @@ def main(host: str, port: int, registry: str):
     3. Instantiate an OrchestratorAgent with discovered AgentCards.
     4. Wrap it in an OrchestratorTaskManager for JSON-RPC handling.
     5. Launch the A2AServer to listen for incoming tasks.
+    6. While it runs, pick up agents added to or removed from the registry.
     """
     # 1) Discover all registered child agents from the registry file
-    discovery = DiscoveryClient(registry_file=registry)
-    # Run the async discovery synchronously at startup
-    agent_cards = asyncio.run(discovery.list_agent_cards())
+    discovery = DiscoveryClient(registry_file=registry, watch_interval=registry_poll or None)
+    # Run the async discovery synchronously at startup (all agents at once)
+    results = asyncio.run(discovery.discover())
+    for result in results:
+        if result.ok:
+            logger.info(f"Discovered {result.card.name} at {result.url} ({result.latency * 1000:.0f} ms)")
+        else:
+            logger.warning(f"Agent at {result.url} unavailable after {result.latency:.1f}s: {result.error}")
+    agent_cards = [result.card for result in results if result.ok]
+    # Remember these cards, so watching the registry only probes new agents
+    discovery.prime(results)
 
     # Warn if no agents are found in the registry
     if not agent_cards:
@@ -68,7 +109,7 @@ def main(host: str, port: int, registry: str):
         )
 
     # 2) Define the OrchestratorAgent's own metadata for discovery
-    capabilities = AgentCapabilities(streaming=False)
+    capabilities = AgentCapabilities(streaming=True)
     skill = AgentSkill(
         id="orchestrate",                          # Unique skill identifier
         name="Orchestrate Tasks",                  # Human-friendly name
@@ -95,15 +136,36 @@ def main(host: str, port: int, registry: str):
     )
 
     # 3) Instantiate the OrchestratorAgent and its TaskManager
-    orchestrator = OrchestratorAgent(agent_cards=agent_cards)
-    task_manager = OrchestratorTaskManager(agent=orchestrator)
+    orchestrator = OrchestratorAgent(
+        agent_cards=agent_cards,
+        discovery=discovery if registry_poll else None,
+        router=IntentRouter(threshold=router_threshold) if router_threshold else None,
+        routing_cache=(
+            RoutingCache(max_entries=routing_cache_size, ttl=routing_cache_ttl)
+            if routing_cache_size else None
+        ),
+        session_service=BoundedSessionService(
+            max_sessions=max_sessions, ttl=session_ttl, keep_turns=keep_turns
+        )
+    )
+    task_manager = OrchestratorTaskManager(
+        agent=orchestrator,
+        store=create_task_store(
+            max_tasks=max_tasks, ttl=task_ttl, db_path=task_db, cache_ttl=task_cache_ttl
+        )
+    )
 
     # 4) Create and start the A2A server
     server = A2AServer(
         host=host,
         port=port,
         agent_card=orchestrator_card,
-        task_manager=task_manager
+        task_manager=task_manager,
+        max_in_flight=max_in_flight,
+        max_queue=max_queue,
+        queue_timeout=queue_timeout,
+        workers=workers,
+        max_pending=max_pending
     )
     server.start()
 
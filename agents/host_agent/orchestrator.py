@@ -3,13 +3,37 @@
 # =============================================================================
 # 🎯 Purpose:
 # Defines the OrchestratorAgent that uses a Gemini-based LLM to interpret user
-# queries and delegate them to any child A2A agent discovered at startup.
+# queries and delegate them to any child A2A agent in the registry.
 # Also defines OrchestratorTaskManager to expose this logic via JSON-RPC.
+#
+# The registry file is watched while the server runs: agents added to it are
+# discovered and become callable, removed ones disappear, without a restart
+# (and without losing the in-memory sessions).
+#
+# Fast path: a local IntentRouter (agents/host_agent/router.py) looks at each
+# query first. When it is confident which child agent should answer, the
+# query is delegated straight away and the child's reply is returned, with
+# no Gemini turn at all; otherwise the LLM decides as before.
+# A RoutingCache also remembers which delegate_task call the LLM made for a
+# query, and replays it when the same phrasing comes back.
+#
+# Compound requests ("recommend a neurologist and tell me the time") can be
+# sent to several agents at once with the delegate_many tool: the calls run
+# concurrently, so the turn takes as long as the slowest child, not the sum.
+#
+# Terminal replies: some children answer in a form meant for the user as is
+# (a doctor card, a booking confirmation). When delegate_task calls one of
+# TERMINAL_AGENTS, its reply is returned verbatim and the run ends there,
+# instead of a second Gemini turn that only restates it.
 # =============================================================================
 
 import os                           # Standard library for interacting with the operating system
+import asyncio                      # Runs delegate_many's child calls concurrently
 import uuid                         # For generating unique identifiers (e.g., session IDs)
 import logging                      # Standard library for configurable logging
+from contextvars import ContextVar  # Tracks which agent the LLM picked (router audits)
+from typing import MutableMapping   # Session state the delegation helper writes to
+from typing import AsyncIterable    # Type hint for the streaming generator
 from dotenv import load_dotenv      # Utility to load environment variables from a .env file
 
 # Load the .env file so that environment variables like GOOGLE_API_KEY
@@ -22,8 +46,8 @@ load_dotenv()
 from google.adk.agents.llm_agent import LlmAgent
 # LlmAgent: core class to define a Gemini-powered AI agent
 
-from google.adk.sessions import InMemorySessionService
-# InMemorySessionService: stores session state in memory (for simple demos)
+from google.adk.sessions import BaseSessionService
+# BaseSessionService: interface of the ADK session stores
 
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 # InMemoryMemoryService: optional conversation memory stored in RAM
@@ -34,12 +58,18 @@ from google.adk.artifacts import InMemoryArtifactService
 from google.adk.runners import Runner
 # Runner: orchestrates agent, sessions, memory, and tool invocation
 
+from google.adk.agents.run_config import RunConfig, StreamingMode
+# RunConfig/StreamingMode: switch the Runner into token streaming (SSE) mode
+
 from google.adk.agents.readonly_context import ReadonlyContext
 # ReadonlyContext: passed to system prompt function to read context
 
 from google.adk.tools.tool_context import ToolContext
 # ToolContext: passed to tool functions for state and actions
 
+from google.adk.events import Event, EventActions
+# Event/EventActions: record fast-path turns in the session history
+
 from google.genai import types           
 # types.Content & types.Part: used to wrap user messages for the LLM
 
@@ -50,8 +80,11 @@ from client.client import A2AClientHTTPError  # Add this import at the top
 # -----------------------------------------------------------------------------
 from server.task_manager import InMemoryTaskManager
 # InMemoryTaskManager: base class providing in-memory task storage and locking
+from server.task_store import TaskStore
+# TaskStore: pluggable task storage (RAM or SQLite)
 
 from models.request import SendTaskRequest, SendTaskResponse
+from models.request import SendTaskStreamingRequest, SendTaskStreamingResponse
 # Data models for incoming task requests and outgoing responses
 
 from models.task import Message, TaskStatus, TaskState, TextPart
@@ -59,18 +92,42 @@ from models.task import Message, TaskStatus, TaskState, TextPart
 
 from models.json_rpc import JSONRPCResponse, JSONRPCError  # Add this import at the top
 
+from utilities.session_service import BoundedSessionService
+# BoundedSessionService: in-memory sessions with an idle TTL, an LRU limit and history compaction
+
 # -----------------------------------------------------------------------------
 # Connector to child A2A agents
 # -----------------------------------------------------------------------------
-from agents.host_agent.agent_connect import AgentConnector
+from agents.host_agent.agent_connect import AgentConnector, CircuitOpenError, forward_partials
+from agents.host_agent.agent_connect import mute_partials
+from agents.host_agent.agent_connect import COALESCED_AGENTS, HedgePolicy, HEDGED_AGENTS
 # AgentConnector: lightweight wrapper around A2AClient to call other agents
+# forward_partials: passes child agents' partial replies up our own stream
+# mute_partials: turns that off for concurrent calls (their chunks would interleave)
+from client.client import create_http_client
+# create_http_client: one pooled keep-alive HTTP client shared by all connectors
 
 from models.agent import AgentCard
 # AgentCard: metadata structure for agent discovery results
+from utilities.discovery import DiscoveryClient
+# DiscoveryClient: watches the registry and reports when the set of agents changed
+from agents.host_agent.router import IntentRouter, RouteDecision, RoutingCache, awaits_choice
+from agents.host_agent.router import NOT_ROUTED    # Messages only the LLM may route
+# IntentRouter: picks the child agent locally for easy queries (skips the LLM)
+# RoutingCache: replays the LLM's earlier routing decision for a repeated query
 
 # Set up module-level logger for debug/info messages
 logger = logging.getLogger(__name__)
 
+# Seconds delegate_many waits for each child before reporting it as timed out
+DELEGATE_TIMEOUT = 30.0
+
+# Children whose replies go to the user verbatim (no LLM summarization turn)
+TERMINAL_AGENTS = {"DoctorRecommendationAgent", "BookAppointmentAgent"}
+
+# During an LLM run: the (agent, message) delegate_task calls it made, in order
+_delegated: ContextVar[list[tuple[str, str]] | None] = ContextVar("delegated", default=None)
+
 
 class OrchestratorAgent:
     """
@@ -81,13 +138,35 @@ class OrchestratorAgent:
     # Define supported MIME types for input/output
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self, agent_cards: list[AgentCard]):
-        # Build one AgentConnector per discovered AgentCard
+    def __init__(
+        self,
+        agent_cards: list[AgentCard],
+        discovery: DiscoveryClient | None = None,
+        router: IntentRouter | None = None,
+        routing_cache: RoutingCache | None = None,
+        terminal_agents: set[str] | None = None,
+        session_service: BaseSessionService | None = None
+    ):
+        # One connection pool for all child agents: connections stay open
+        # between calls instead of a new TCP handshake per delegated task
+        self._http = create_http_client()
+
+        # Optional: local fast-path router, retrained whenever the agents change
+        self.router = router
+        # Optional: the LLM's past routing decisions, cleared whenever the agents change
+        self.routing_cache = routing_cache
+        # Children whose reply ends the run as is
+        self.terminal_agents = TERMINAL_AGENTS if terminal_agents is None else terminal_agents
+
+        # Build one AgentConnector per discovered agent name
         # agent_cards is a list of AgentCard objects returned by discovery
-        self.connectors = {
-            card.name: AgentConnector(card.name, card.url)
-            for card in agent_cards
-        }
+        self.connectors: dict[str, AgentConnector] = {}
+        self._update_connectors(agent_cards)
+
+        # Optional: keeps the connectors in sync with the registry while we run
+        self.discovery = discovery
+        if discovery is not None:
+            discovery.on_change = self._update_connectors
 
         # Build the internal LLM agent with our custom tools and instructions
         self._agent = self._build_agent()
@@ -95,15 +174,64 @@ class OrchestratorAgent:
         # Static user ID for session tracking across calls
         self._user_id = "orchestrator_user"
 
+        # Conversations; by default idle sessions expire and long histories
+        # are summarized, so memory and prompt size stay bounded
+        self.session_service = session_service or BoundedSessionService()
+
         # Runner wires up sessions, memory, artifacts, and handles agent.run()
         self._runner = Runner(
             app_name=self._agent.name,
             agent=self._agent,
             artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
+            session_service=self.session_service,
             memory_service=InMemoryMemoryService(),
         )
 
+    def _update_connectors(self, agent_cards: list[AgentCard]):
+        """
+        Point self.connectors at the given cards. Cards sharing a name are
+        replicas of one agent, balanced by its connector.
+
+        Connectors whose replicas didn't change are kept (with their circuit
+        breakers, hedging stats and sticky sessions). The new dict is built
+        aside and swapped in with one assignment, so a tool call sees either
+        the old or the new set of agents, never a mix; calls already running
+        on a dropped connector finish normally (the pool is shared).
+        """
+        replicas: dict[str, list[AgentCard]] = {}
+        for card in agent_cards:
+            replicas.setdefault(card.name, []).append(card)
+
+        current = self.connectors
+        connectors = {}
+        for name, cards in replicas.items():
+            urls = [card.url for card in cards]
+            connector = current.get(name)
+            if connector is None or [replica.url for replica in connector.replicas] != urls:
+                connector = AgentConnector(
+                    name, urls,
+                    http_client=self._http,
+                    streaming=all(card.capabilities.streaming for card in cards),
+                    hedge=HedgePolicy() if name in HEDGED_AGENTS else None,
+                    coalesce=name in COALESCED_AGENTS
+                )
+            connectors[name] = connector
+        changed = connectors.keys() != current.keys() or any(
+            connector is not current[name] for name, connector in connectors.items()
+        )
+        self.connectors = connectors
+        if self.router is not None:
+            self.router.train(agent_cards)
+        if self.routing_cache is not None and changed:
+            self.routing_cache.clear()
+
+        added = connectors.keys() - current.keys()
+        removed = current.keys() - connectors.keys()
+        if current and (added or removed):
+            logger.info(
+                f"Orchestrator agents updated: added {sorted(added)}, removed {sorted(removed)}"
+            )
+
     def _build_agent(self) -> LlmAgent:
         """
         Construct the Gemini-based LlmAgent with:
@@ -119,7 +247,8 @@ class OrchestratorAgent:
             instruction=self._root_instruction,  # Function providing system prompt text
             tools=[
                 self._list_agents,               # Tool 1: list available child agents
-                self._delegate_task             # Tool 2: call a child agent
+                self._delegate_task,             # Tool 2: call a child agent
+                self._delegate_many              # Tool 3: call several child agents at once
             ],
         )
 
@@ -128,12 +257,15 @@ class OrchestratorAgent:
         System prompt function: returns instruction text for the LLM,
         including which tools it can use and a list of child agents.
         """
-        # Build a bullet-list of agent names
+        # Build a bullet-list of agent names (the live set, read on every turn)
         agent_list = "\n".join(f"- {name}" for name in self.connectors)
         return (
-            "You are an orchestrator with two tools:\n"
+            "You are an orchestrator with three tools:\n"
             "1) list_agents() -> list available child agents\n"
             "2) delegate_task(agent_name, message) -> call that agent\n"
+            "3) delegate_many(calls) -> call several agents at once; calls is a list of "
+            "{\"agent_name\": ..., \"message\": ...}. Use it when the user asks for "
+            "independent things that different agents handle.\n"
             "Use these tools to satisfy the user. Do not hallucinate.\n"
             "Available agents:\n" + agent_list
         )
@@ -154,26 +286,83 @@ class OrchestratorAgent:
         """
         Tool function: forwards the `message` to the specified child agent
         (via its AgentConnector), waits for the response, and returns the
-        text of the last reply.
+        text of the last reply. While the orchestrator is streaming, the
+        child's partial replies are forwarded to the user as they arrive.
+
+        A reply from one of the terminal agents is final: the run ends with
+        it, without another LLM turn to summarize it.
         """
-        # Validate agent_name exists
-        if agent_name not in self.connectors:
-            raise ValueError(f"Unknown agent: {agent_name}")
-        connector = self.connectors[agent_name]
+        reply = await self._delegate(agent_name, message, tool_context.state)
+        if agent_name in self.terminal_agents:
+            tool_context.actions.skip_summarization = True
+        return reply
+
+    async def _delegate_many(self, calls: list[dict], tool_context: ToolContext) -> list[dict]:
+        """
+        Tool function: sends several messages to child agents at the same time
+        and returns every reply once all of them answered (or timed out).
 
-        # Ensure session_id persists across tool calls via tool_context.state
+        Args:
+            calls: [{"agent_name": ..., "message": ...}, ...]
+
+        Returns:
+            list[dict]: One entry per call, in the same order:
+            {"agent_name", "reply"} on success, {"agent_name", "error"} if the
+            call failed or took longer than DELEGATE_TIMEOUT seconds
+        """
         state = tool_context.state
+
+        async def call(agent_name: str, message: str) -> dict:
+            # Runs in its own task (gather), so this only affects this call
+            mute_partials()
+            try:
+                reply = await asyncio.wait_for(
+                    self._delegate(agent_name, message, state), DELEGATE_TIMEOUT
+                )
+                return {"agent_name": agent_name, "reply": reply}
+            except asyncio.TimeoutError:
+                return {"agent_name": agent_name, "error": f"No reply within {DELEGATE_TIMEOUT:.0f}s"}
+            except Exception as e:
+                # One failing child must not cost us the other replies
+                logger.warning(f"delegate_many: {agent_name} failed: {e}")
+                return {"agent_name": agent_name, "error": str(e) or type(e).__name__}
+
+        return list(await asyncio.gather(*(
+            call(str(c.get("agent_name", "")), str(c.get("message", ""))) for c in calls
+        )))
+
+    async def _delegate(self, agent_name: str, message: str, state: MutableMapping) -> str:
+        """
+        Shared by the delegate_task tool and the router's fast path: call the
+        child agent with this conversation's session ID (kept in `state`).
+        """
+        # Validate agent_name exists (one lookup: the dict may be swapped meanwhile)
+        connector = self.connectors.get(agent_name)
+        if connector is None:
+            raise ValueError(f"Unknown agent: {agent_name}")
+
+        # Ensure session_id persists across tool calls via the session state
         if "session_id" not in state:
             state["session_id"] = str(uuid.uuid4())
         session_id = state["session_id"]
 
-        # Delegate task asynchronously and await Task result
-        child_task = await connector.send_task(message, session_id)
+        # Set again below if this agent asks the user to pick from a list
+        state["awaiting_agent"] = None
+        delegated = _delegated.get()
+        if delegated is not None:
+            delegated.append((agent_name, message))
+
+        # Delegate task asynchronously and await the child's reply
+        try:
+            reply = await connector.stream_reply(message, session_id)
+        except CircuitOpenError:
+            # The child has been failing: answer right away instead of waiting on it
+            return f"{agent_name} is temporarily unavailable. Please try again in a little while."
 
-        # Extract text from the last history entry if available
-        if child_task.history and len(child_task.history) > 1:
-            return child_task.history[-1].parts[0].text
-        return ""
+        # A bare number next ("2") is the user's pick, for this agent
+        if awaits_choice(agent_name, reply):
+            state["awaiting_agent"] = agent_name
+        return reply
 
     async def invoke(self, query: str, session_id: str) -> str:
         """
@@ -216,21 +405,33 @@ class OrchestratorAgent:
                 parts=[types.Part.from_text(text=query)]
             )
 
+            # ⚡ Fast path: we know which agent to ask, skip the LLM
+            decision = self._route(query, session)
+            if self._use_fast_path(decision):
+                return await self._fast_path(session, content, decision)
+
             # 🚀 Run the agent using the Runner and collect the last event
             last_event = None
-            async for event in self._runner.run_async(
-                user_id=self._user_id,
-                session_id=session.id,
-                new_message=content
-            ):
-                last_event = event
+            fresh = not session.events    # No earlier turns the LLM could draw on
+            delegated = []
+            token = _delegated.set(delegated)
+            try:
+                async for event in self._runner.run_async(
+                    user_id=self._user_id,
+                    session_id=session.id,
+                    new_message=content
+                ):
+                    last_event = event
+            finally:
+                _delegated.reset(token)
+            self._learn(query, decision, delegated, fresh)
 
             # 🧹 Fallback: return empty string if something went wrong
             if not last_event or not last_event.content or not last_event.content.parts:
                 return ""
 
             # 📤 Extract and join all text responses into one string
-            return "\n".join([p.text for p in last_event.content.parts if p.text])
+            return _event_text(last_event)
         except A2AClientHTTPError as e:
             if hasattr(e, 'args') and len(e.args) > 0 and e.args[0] == 429:
                 return (
@@ -240,15 +441,181 @@ class OrchestratorAgent:
                 )
             raise
 
+    def _route(self, query: str, session) -> RouteDecision | None:
+        """Where this query should go, if we know without the LLM."""
+        awaiting_agent = session.state.get("awaiting_agent")
+
+        # 1) The LLM already routed this phrasing: replay its tool call. Not
+        # while a child agent waits for an answer (the same words may be that
+        # answer), nor for messages that undo or negate a request: both depend
+        # on the conversation, which the cache doesn't know
+        if (
+            self.routing_cache is not None
+            and awaiting_agent is None
+            and not NOT_ROUTED.search(query)
+        ):
+            cached = self.routing_cache.get(query)
+            if cached is not None and cached[0] in self.connectors:
+                return RouteDecision(cached[0], cached[1], 1.0, "cache")
+
+        # 2) The local router is confident
+        if self.router is None:
+            return None
+        return self.router.route(query, awaiting_agent=awaiting_agent)
+
+    def _use_fast_path(self, decision: RouteDecision | None) -> bool:
+        """True to act on the decision, False to ask the LLM (no decision, or audited)."""
+        if decision is None:
+            return False
+        return decision.source == "cache" or not self.router.should_audit()
+
+    def _learn(
+        self, query: str, decision: RouteDecision | None,
+        delegated: list[tuple[str, str]], fresh: bool
+    ):
+        """
+        After an LLM run: score the router's audited decision, and remember
+        the LLM's routing if it made exactly one delegate_task call.
+        `fresh` tells whether the session had no history before this turn.
+        """
+        if decision is not None:
+            # Audited: did the LLM pick the agent the router predicted?
+            self.router.record_audit(decision, delegated[0][0] if delegated else None)
+        if self.routing_cache is not None and len(delegated) == 1:
+            self.routing_cache.put(query, *delegated[0], fresh=fresh)
+
+    async def _fast_path(self, session, content: types.Content, decision: RouteDecision) -> str:
+        """
+        ⚡ Delegate a routed query directly and return the child's reply.
+
+        The turn is still recorded in the session (user message, reply and
+        state changes), so the LLM has the full conversation on later turns.
+        """
+        logger.info(f"Router: {decision.agent} ({decision.source}, {decision.confidence:.2f})")
+        state = dict(session.state)
+        try:
+            reply = await self._delegate(decision.agent, decision.message, state)
+        except CircuitOpenError:
+            reply = f"{decision.agent} is temporarily unavailable. Please try again in a little while."
+
+        delta = {key: value for key, value in state.items() if session.state.get(key) != value}
+        invocation_id = Event.new_id()
+        session_service = self._runner.session_service
+        await session_service.append_event(session, Event(
+            invocation_id=invocation_id, author="user", content=content
+        ))
+        await session_service.append_event(session, Event(
+            invocation_id=invocation_id,
+            author=self._agent.name,
+            content=types.Content(role="model", parts=[types.Part.from_text(text=reply)]),
+            actions=EventActions(state_delta=delta)
+        ))
+        return reply
+
+    async def start(self):
+        """Start watching the registry for added or removed agents."""
+        if self.discovery is not None:
+            await self.discovery.start()
+
+    async def aclose(self):
+        """Stop watching the registry and close the shared connection pool."""
+        if self.discovery is not None:
+            await self.discovery.stop()
+        await self._http.aclose()
+
+    async def stream(self, query: str, session_id: str) -> AsyncIterable[dict]:
+        """
+        🌀 Public: same pipeline as invoke(), but yields Gemini's reply as it's
+        generated (Runner in SSE streaming mode), along with the partial
+        replies of the child agents it delegates to.
+
+        Yields:
+            dict: {"is_task_complete": False, "content": <partial text>} for each chunk,
+                  then {"is_task_complete": True, "content": <full reply>}
+        """
+        async for item in forward_partials(self._stream(query, session_id)):
+            yield item
+
+    async def _stream(self, query: str, session_id: str) -> AsyncIterable[dict]:
+        """The orchestrator's own streamed reply (see stream())."""
+        session = await self._runner.session_service.get_session(
+            app_name=self._agent.name,
+            user_id=self._user_id,
+            session_id=session_id,
+        )
+        if session is None:
+            session = await self._runner.session_service.create_session(
+                app_name=self._agent.name,
+                user_id=self._user_id,
+                session_id=session_id,
+                state={},
+            )
+
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+
+        # ⚡ Fast path: the child's partial replies still stream through
+        decision = self._route(query, session)
+        if self._use_fast_path(decision):
+            yield {"is_task_complete": True, "content": await self._fast_path(session, content, decision)}
+            return
+
+        # 🚀 Tool calls run as usual; only model text is forwarded as it streams
+        fresh = not session.events
+        delegated = []
+        _delegated.set(delegated)
+        try:
+            async for event in self._runner.run_async(
+                user_id=self._user_id,
+                session_id=session.id,
+                new_message=content,
+                run_config=RunConfig(streaming_mode=StreamingMode.SSE)
+            ):
+                if not event.content or not event.content.parts:
+                    continue
+
+                text = "".join(p.text for p in event.content.parts if p.text)
+                if event.is_final_response():
+                    text = text or _event_text(event)    # A terminal agent's reply
+                    self._learn(query, decision, delegated, fresh)
+                    yield {"is_task_complete": True, "content": text}
+                    return
+                if event.partial and text:
+                    yield {"is_task_complete": False, "content": text}
+        finally:
+            # Not reset(token): a generator may be closed from another context
+            _delegated.set(None)
+
+        # 🧹 Fallback: the run ended without a final response
+        yield {"is_task_complete": True, "content": ""}
+
+
+def _event_text(event: Event) -> str:
+    """
+    The text of a final event: the model's text, or, when a terminal agent's
+    reply ended the run, the delegate_task result(s) it carries.
+    """
+    texts = [p.text for p in event.content.parts if p.text]
+    if texts:
+        return "\n".join(texts)
+    # ADK wraps a tool's non-dict return value as {"result": value}
+    return "\n".join(
+        str(p.function_response.response.get("result", ""))
+        for p in event.content.parts
+        if p.function_response and p.function_response.response
+    )
+
 
 class OrchestratorTaskManager(InMemoryTaskManager):
     """
     🪄 TaskManager wrapper: exposes OrchestratorAgent.invoke() over the
-    A2A JSON-RPC `tasks/send` endpoint, handling in-memory storage and
-    response formatting.
+    A2A JSON-RPC `tasks/send` endpoint (and OrchestratorAgent.stream() over
+    `tasks/sendSubscribe`), handling in-memory storage and response formatting.
     """
-    def __init__(self, agent: OrchestratorAgent):
-        super().__init__()       # Initialize base in-memory storage
+    def __init__(self, agent: OrchestratorAgent, store: TaskStore | None = None):
+        super().__init__(store=store)  # Initialize base in-memory storage
         self.agent = agent       # Store our orchestrator logic
 
     def _get_user_text(self, request: SendTaskRequest) -> str:
@@ -257,6 +624,33 @@ class OrchestratorTaskManager(InMemoryTaskManager):
         """
         return request.params.message.parts[0].text
 
+    async def start(self, workers: int = 0, max_pending: int = 0):
+        """
+        Called by the A2A server on startup: start background work, then
+        start watching the agent registry.
+        """
+        await super().start(workers=workers, max_pending=max_pending)
+        await self.agent.start()
+
+    async def stop(self):
+        """
+        Called by the A2A server on shutdown: stop background work, then close
+        the connections to the child agents.
+        """
+        await super().stop()
+        await self.agent.aclose()
+
+    def agent_stats(self) -> dict:
+        """Fast-path router, routing-cache and session counters, for GET /metrics."""
+        stats = {}
+        if isinstance(self.agent.session_service, BoundedSessionService):
+            stats["sessions"] = self.agent.session_service.stats()
+        if self.agent.router is not None:
+            stats["router"] = self.agent.router.stats()
+        if self.agent.routing_cache is not None:
+            stats["routing_cache"] = self.agent.routing_cache.stats()
+        return stats
+
     async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
         """
         Called by the A2A server when a new task arrives:
@@ -288,9 +682,22 @@ class OrchestratorTaskManager(InMemoryTaskManager):
 
         # Step 3: wrap the LLM output into a Message
         reply = Message(role="agent", parts=[TextPart(text=response_text)])
-        async with self.lock:
-            task.status = TaskStatus(state=TaskState.COMPLETED)
-            task.history.append(reply)
+        task = await self.update_store(task.id, TaskStatus(state=TaskState.COMPLETED), reply)
 
         # Step 4: return structured response
         return SendTaskResponse(id=request.id, result=task)
+
+    async def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Called by the A2A server for `tasks/sendSubscribe`: same as
+        on_send_task(), but the orchestrator's reply is streamed as it's generated.
+        """
+        logger.info(f"OrchestratorTaskManager streaming task {request.params.id}")
+
+        user_text = self._get_user_text(request)
+        updates = self.agent.stream(user_text, request.params.sessionId)
+
+        async for response in self.stream_agent_updates(request, updates):
+            yield response
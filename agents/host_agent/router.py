@@ -0,0 +1,445 @@
+# =============================================================================
+# agents/host_agent/router.py
+# =============================================================================
+# 🎯 Purpose:
+# A local pre-router for the OrchestratorAgent. Many requests are trivial to
+# classify ("what time is it", "book doc017 on Friday", a bare "2" picking a
+# doctor from a list), yet each one costs at least two Gemini turns (pick a
+# tool, then summarize). The router answers "which agent?" locally, in
+# microseconds, and the orchestrator skips the LLM when it is confident.
+#
+# ✅ How it decides (first match wins):
+# 0. Messages that cancel, change or negate something ("cancel my appointment
+#    with doc003") always go to the LLM: the agents here act on what they get
+# 1. Rules: regular expressions for unambiguous phrasings, each naming an agent
+# 2. Follow-ups: a bare number goes back to the agent that just asked the
+#    user to pick from a numbered list (DoctorRecommendationAgent)
+# 3. Classifier: multinomial naive Bayes trained on the agents' own skill
+#    examples, tags and descriptions; used only when its posterior
+#    probability is at least `threshold` and most of the query's words are
+#    ones it learned for that agent
+# Anything else returns None, and the orchestrator asks the LLM as before.
+#
+# 📊 Metrics: hit rate per source, and accuracy, estimated by auditing: a
+# fraction of confident requests is sent to the LLM anyway, and the agent it
+# picks is compared with the router's prediction.
+#
+# RoutingCache remembers the LLM's own decisions: normalized query ->
+# (agent, message) of the delegate_task call it made. The next time the same
+# phrasing comes in, that call is replayed without asking the LLM.
+# =============================================================================
+
+import math                          # log-probabilities for naive Bayes
+import random                        # Picks the requests to audit
+import re                            # Rules
+import time                          # Routing-cache expiry
+from collections import OrderedDict  # Routing cache in LRU order
+from typing import Iterable, List
+
+from models.agent import AgentCard
+from utilities.agent_index import tokenize    # Same terms as capability search
+
+# Min posterior probability for the classifier to route without the LLM
+ROUTER_THRESHOLD = 0.8
+
+# Min share of the query's terms the classifier saw in the chosen agent's
+# training texts: a confident guess from a few words in a longer, unrelated
+# question ("the current time slot for a cardiologist") goes to the LLM
+ROUTER_MIN_COVERAGE = 0.6
+
+# Fraction of confident requests sent to the LLM anyway, to measure accuracy
+ROUTER_AUDIT_RATE = 0.05
+
+# Routing cache: max remembered phrasings, and seconds each is trusted
+ROUTING_CACHE_SIZE = 1024
+ROUTING_CACHE_TTL = 600.0
+
+
+class RouteDecision:
+    """
+    🧭 The router's answer: send `message` to `agent`.
+
+    Attributes:
+        agent (str): Name of the child agent
+        message (str): Text to send it (the user's query, unchanged)
+        confidence (float): 1.0 for rules/follow-ups, else the posterior
+        source (str): "rule", "followup", "model" or "cache"
+    """
+
+    def __init__(self, agent: str, message: str, confidence: float, source: str):
+        self.agent = agent
+        self.message = message
+        self.confidence = confidence
+        self.source = source
+
+    def __repr__(self) -> str:
+        return (f"RouteDecision(agent={self.agent!r}, source={self.source!r}, "
+                f"confidence={self.confidence:.2f})")
+
+
+class Rule:
+    """
+    📏 A regular expression that, when it matches, routes to one agent.
+
+    Attributes:
+        agent (str): Agent to route to (the rule is skipped if it's not registered)
+        pattern (re.Pattern): Searched in the query (case-insensitive)
+    """
+
+    def __init__(self, agent: str, pattern: str):
+        self.agent = agent
+        self.pattern = re.compile(pattern, re.IGNORECASE)
+
+    def matches(self, query: str) -> bool:
+        return self.pattern.search(query) is not None
+
+
+# Rules for the agents in this project. A match skips the LLM and goes
+# straight to an agent that may act on it, so each one is narrow:
+# - time: the whole message asks for the time ("what's the time?"), not about
+#   some other time ("what is the time of my appointment")
+# - booking: a booking verb and a doctor ID ("book doc017 on Friday"); the
+#   ID alone ("is doc005 a good doctor?") isn't enough
+DEFAULT_RULES = [
+    Rule("TellTimeAgent", (
+        r"^\s*(?:(?:can you |could you |please )?tell me )?"
+        r"(?:what(?:'s| is) the (?:current )?time|what time is it|the current time|current time)"
+        r"(?: now| right now)?(?: please)?\s*[?.!]*\s*$"
+    )),
+    Rule("BookAppointmentAgent", r"\b(?:book|reserve)\b.*\bdoc\d{3}\b"),
+]
+
+# Messages that undo, change or negate a request are left to the LLM
+NOT_ROUTED = re.compile(
+    r"\b(?:cancel\w*|reschedul\w*|change|move|delete|remove|not|don'?t|never)\b", re.IGNORECASE
+)
+
+# Agents that ask the user to pick from a numbered list, and how to tell
+# from their reply that they're waiting for the choice
+CHOICE_PROMPTS = {
+    "DoctorRecommendationAgent": re.compile(r"reply with the number", re.IGNORECASE),
+}
+
+# The user's pick from such a list: a bare number
+CHOICE = re.compile(r"^\s*\d{1,2}\s*[.!]?\s*$")
+
+# Extra training phrases for this project's agents: their cards only carry
+# two or three examples each, too few to recognize everyday wording
+EXTRA_EXAMPLES = {
+    "TellTimeAgent": [
+        "what time is it", "what is the time now", "current time", "time please", "clock",
+    ],
+    "GreetingAgent": [
+        "greet me", "say hello", "good morning", "good evening", "greeting",
+    ],
+    "DoctorRecommendationAgent": [
+        # The symptom keywords DoctorRecommendationAgent understands
+        "heart chest pain", "skin rash allergy", "throat ear nose", "bone joint",
+        "headache migraine dizziness", "stomach ache", "cold fever", "which doctor should I see",
+        "recommend a doctor", "doctor available on monday tuesday wednesday thursday friday",
+        "i feel sick", "symptom",
+    ],
+    "BookAppointmentAgent": [
+        "book an appointment", "schedule an appointment", "make a booking", "reserve a slot",
+    ],
+    "UserInteractionAgent": [
+        "how are you", "can you help me", "thank you", "tell me something nice", "chat",
+    ],
+}
+
+# Agents the router never picks: the orchestrator may find itself in the
+# registry, and delegating to itself would loop
+NEVER_ROUTED = {"OrchestratorAgent"}
+
+# Short replies whose meaning depends on the conversation (never cached)
+FOLLOWUP = re.compile(r"^\s*(\d{1,2}|yes|no|ok(ay)?|sure)\s*[.!]?\s*$", re.IGNORECASE)
+
+# Words kept when normalizing a query for the routing cache
+_WORDS = re.compile(r"[a-z0-9]+")
+
+
+def awaits_choice(agent: str, reply: str) -> bool:
+    """True if `reply` from `agent` asks the user to pick from a numbered list."""
+    prompt = CHOICE_PROMPTS.get(agent)
+    return prompt is not None and prompt.search(reply or "") is not None
+
+
+class NaiveBayesClassifier:
+    """
+    🧮 Multinomial naive Bayes over word counts, with Laplace smoothing.
+
+    Small and fast to train (one pass over the examples), which is what
+    we need: it's retrained whenever the set of agents changes.
+    """
+
+    def __init__(self, alpha: float = 1.0):
+        self.alpha = alpha
+        self.labels: List[str] = []
+        self._log_prior: dict[str, float] = {}
+        self._log_likelihood: dict[str, dict[str, float]] = {}
+        self._log_unknown: dict[str, float] = {}    # Per label: a term never seen with it
+        self._vocabulary: set[str] = set()
+
+    def train(self, examples: Iterable[tuple[str, str]]):
+        """
+        Args:
+            examples: (text, label) pairs
+        """
+        counts: dict[str, dict[str, int]] = {}
+        documents: dict[str, int] = {}
+        vocabulary = set()
+        for text, label in examples:
+            documents[label] = documents.get(label, 0) + 1
+            label_counts = counts.setdefault(label, {})
+            for term in tokenize(text):
+                label_counts[term] = label_counts.get(term, 0) + 1
+                vocabulary.add(term)
+
+        self.labels = list(documents)
+        self._vocabulary = vocabulary
+        total = sum(documents.values())
+        size = len(vocabulary) or 1
+        self._log_prior = {label: math.log(n / total) for label, n in documents.items()}
+        self._log_likelihood, self._log_unknown = {}, {}
+        for label in self.labels:
+            label_counts = counts[label]
+            denominator = sum(label_counts.values()) + self.alpha * size
+            self._log_likelihood[label] = {
+                term: math.log((n + self.alpha) / denominator) for term, n in label_counts.items()
+            }
+            self._log_unknown[label] = math.log(self.alpha / denominator)
+
+    def predict(self, text: str) -> tuple[str | None, float]:
+        """
+        Returns:
+            tuple[str | None, float]: The most likely label and its posterior
+            probability; (None, 0.0) if the text has no known term
+        """
+        terms = [term for term in tokenize(text) if term in self._vocabulary]
+        if not terms:
+            return None, 0.0
+
+        scores = {}
+        for label in self.labels:
+            likelihood = self._log_likelihood[label]
+            unknown = self._log_unknown[label]
+            scores[label] = self._log_prior[label] + sum(likelihood.get(t, unknown) for t in terms)
+
+        # Softmax of the log scores -> posterior probabilities
+        best = max(scores, key=scores.get)
+        top = scores[best]
+        total = sum(math.exp(score - top) for score in scores.values())
+        return best, 1.0 / total
+
+    def coverage(self, text: str, label: str) -> float:
+        """Share of the text's terms seen in training texts of `label` (0.0 if none)."""
+        terms = tokenize(text)
+        if not terms:
+            return 0.0
+        known = self._log_likelihood.get(label, {})
+        return sum(term in known for term in terms) / len(terms)
+
+
+class IntentRouter:
+    """
+    🚦 Picks a child agent for a query without the LLM, when it's sure.
+
+    Attributes:
+        rules (List[Rule]): Checked in order before the classifier
+        threshold (float): Min classifier probability to route
+        audit_rate (float): Fraction of confident decisions checked against the LLM
+    """
+
+    def __init__(
+        self,
+        rules: List[Rule] | None = None,
+        threshold: float = ROUTER_THRESHOLD,
+        audit_rate: float = ROUTER_AUDIT_RATE
+    ):
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.threshold = threshold
+        self.audit_rate = audit_rate
+        self.agents: set[str] = set()
+        self.classifier = NaiveBayesClassifier()
+
+        # 📊 Counters
+        self.requests = 0
+        self.hits = {"rule": 0, "followup": 0, "model": 0}
+        self.audited = 0    # Confident decisions checked against the LLM
+        self.agreed = 0     # ... where the LLM picked the same agent
+
+    def train(self, cards: List[AgentCard]):
+        """
+        (Re)train on the registered agents: every skill example, tag, name
+        and description becomes a training text labelled with the agent.
+        """
+        cards = [card for card in cards if card.name not in NEVER_ROUTED]
+        examples = []
+        for card in cards:
+            examples.append((card.description, card.name))
+            for skill in card.skills:
+                examples.append((f"{skill.name} {skill.description or ''}", card.name))
+                examples.extend((tag, card.name) for tag in skill.tags or [])
+                examples.extend((example, card.name) for example in skill.examples or [])
+            examples.extend((example, card.name) for example in EXTRA_EXAMPLES.get(card.name, []))
+        self.agents = {card.name for card in cards}
+        self.classifier.train(examples)
+
+    def route(self, query: str, awaiting_agent: str | None = None) -> RouteDecision | None:
+        """
+        Args:
+            query: The user's message
+            awaiting_agent: The agent whose last reply asked this session to
+                pick from a list (see awaits_choice()), if any
+
+        Returns:
+            RouteDecision | None: Where to send the query, or None to ask the LLM
+        """
+        self.requests += 1
+        decision = self._decide(query, awaiting_agent)
+        if decision is not None:
+            self.hits[decision.source] += 1
+        return decision
+
+    def _decide(self, query: str, awaiting_agent: str | None) -> RouteDecision | None:
+        if NOT_ROUTED.search(query):
+            return None
+
+        for rule in self.rules:
+            if rule.agent in self.agents and rule.matches(query):
+                return RouteDecision(rule.agent, query, 1.0, "rule")
+
+        if awaiting_agent in self.agents and CHOICE.match(query):
+            return RouteDecision(awaiting_agent, query, 1.0, "followup")
+
+        agent, probability = self.classifier.predict(query)
+        if (agent is not None and probability >= self.threshold
+                and self.classifier.coverage(query, agent) >= ROUTER_MIN_COVERAGE):
+            return RouteDecision(agent, query, probability, "model")
+        return None
+
+    def should_audit(self) -> bool:
+        """True if this confident decision should go to the LLM anyway."""
+        return random.random() < self.audit_rate
+
+    def record_audit(self, decision: RouteDecision, chosen: str | None):
+        """
+        Count the outcome of an audited request: the agent the LLM delegated
+        to (None if it answered without one) vs the router's prediction.
+        """
+        self.hits[decision.source] -= 1     # The LLM handled it, not the router
+        self.audited += 1
+        self.agreed += chosen == decision.agent
+
+    def stats(self) -> dict:
+        routed = sum(self.hits.values())
+        return {
+            "requests": self.requests,
+            "routed": routed,
+            "hit_rate": routed / self.requests if self.requests else 0.0,
+            **{f"{source}_hits": count for source, count in self.hits.items()},
+            "fallbacks": self.requests - routed,
+            "audited": self.audited,
+            "accuracy": self.agreed / self.audited if self.audited else None,
+        }
+
+
+class RoutingCache:
+    """
+    🗂️ LRU cache of the LLM's routing decisions, with a TTL.
+
+    Keys are normalized queries (lowercase, punctuation and extra spaces
+    removed), so "What time is it?" and "what time is it" share an entry.
+    Short follow-up replies ("2", "yes") are never cached: what they mean
+    depends on the conversation. Entries are shared by all sessions, so a
+    decision is only cached if it can't carry one user's conversation into
+    another's (see put()).
+
+    Attributes:
+        max_entries (int): Max remembered queries (least recently used dropped first)
+        ttl (float): Seconds an entry is trusted
+    """
+
+    def __init__(self, max_entries: int = ROUTING_CACHE_SIZE, ttl: float = ROUTING_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # normalized query -> (agent, message, expiry time), least recently used first
+        self._entries: OrderedDict[str, tuple[str, str, float]] = OrderedDict()
+
+        # 📊 Counters
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.skipped = 0        # Decisions not cached: they depended on the conversation
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(_WORDS.findall(query.lower()))
+
+    def get(self, query: str) -> tuple[str, str] | None:
+        """
+        Returns:
+            tuple[str, str] | None: (agent, message) the LLM chose for this
+            query before, or None
+        """
+        key = self.normalize(query)
+        entry = self._entries.get(key)
+        if entry is None or entry[2] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def put(self, query: str, agent: str, message: str, fresh: bool = False):
+        """
+        Remember that the LLM sent this query to `agent` as `message`.
+
+        The LLM may rewrite the query with details from earlier turns ("book
+        it for friday" -> "book doc017 on Friday"); replaying that for another
+        user would act on the first user's conversation. So the decision is
+        only cached if the message is the query itself, or if the LLM had no
+        earlier turns to draw from.
+
+        Args:
+            query: The user's query
+            agent: The agent the LLM delegated to
+            message: The message the LLM sent it
+            fresh: The session had no history when the LLM routed the query
+        """
+        if FOLLOWUP.match(query):
+            return
+        key = self.normalize(query)
+        if not key:
+            return
+        if not fresh and self.normalize(message) != key:
+            self.skipped += 1
+            return
+        self._entries[key] = (agent, message, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every decision (the set of agents changed)."""
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "skipped": self.skipped,
+        }
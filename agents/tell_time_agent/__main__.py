@@ -18,6 +18,8 @@
 
 # Your custom A2A server class
 from server.server import A2AServer
+from server.cli import admission_options, worker_options, store_options, session_options
+from server.task_store import create_task_store
 
 # Models for describing agent capabilities and metadata
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
@@ -26,6 +28,9 @@ from models.agent import AgentCard, AgentCapabilities, AgentSkill
 from agents.tell_time_agent.task_manager import AgentTaskManager
 from agents.tell_time_agent.agent import TellTimeAgent
 
+# Conversation sessions with an idle TTL, an LRU limit and history compaction
+from utilities.session_service import BoundedSessionService
+
 # CLI and logging support
 import click           # For creating a clean command-line interface
 import logging         # For logging errors and info to the console
@@ -46,14 +51,19 @@ logger = logging.getLogger(__name__)
 @click.command()
 @click.option("--host", default="localhost", help="Host to bind the server to")
 @click.option("--port", default=10002, help="Port number for the server")
-def main(host, port):
+@admission_options
+@worker_options
+@store_options
+@session_options
+def main(host, port, max_in_flight, max_queue, queue_timeout, workers, max_pending,
+         max_tasks, task_ttl, task_db, task_cache_ttl, max_sessions, session_ttl, keep_turns):
     """
     This function sets up everything needed to start the agent server.
     You can run it via: `python -m agents.google_adk --host 0.0.0.0 --port 12345`
     """
 
-    # Define what this agent can do – in this case, it does NOT support streaming
-    capabilities = AgentCapabilities(streaming=False)
+    # Define what this agent can do – it streams its reply over "tasks/sendSubscribe"
+    capabilities = AgentCapabilities(streaming=True)
 
     # Define the skill this agent offers (used in directories and UIs)
     skill = AgentSkill(
@@ -84,7 +94,19 @@ def main(host, port):
         host=host,
         port=port,
         agent_card=agent_card,
-        task_manager=AgentTaskManager(agent=TellTimeAgent())
+        task_manager=AgentTaskManager(
+            agent=TellTimeAgent(session_service=BoundedSessionService(
+                max_sessions=max_sessions, ttl=session_ttl, keep_turns=keep_turns
+            )),
+            store=create_task_store(
+                max_tasks=max_tasks, ttl=task_ttl, db_path=task_db, cache_ttl=task_cache_ttl
+            )
+        ),
+        max_in_flight=max_in_flight,
+        max_queue=max_queue,
+        queue_timeout=queue_timeout,
+        workers=workers,
+        max_pending=max_pending
     )
 
     # Start listening for tasks
@@ -11,24 +11,31 @@
 # 📦 Built-in & External Library Imports
 # -----------------------------------------------------------------------------
 
-from datetime import datetime  # Used to get the current system time
+from typing import AsyncIterable  # Type hint for the streaming generator
 
 # 🧠 Gemini-based AI agent provided by Google's ADK
 from google.adk.agents.llm_agent import LlmAgent
 
 # 📚 ADK services for session, memory, and file-like "artifacts"
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import BaseSessionService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.artifacts import InMemoryArtifactService
 
 # 🏃 The "Runner" connects the agent, session, memory, and files into a complete system
 from google.adk.runners import Runner
 
+# 📡 Run options that switch the Runner into token streaming (SSE) mode
+from google.adk.agents.run_config import RunConfig, StreamingMode
+
 # 🧾 Gemini-compatible types for formatting input/output messages
 from google.genai import types
 
 # 🔐 Load environment variables (like API keys) from a `.env` file
 from dotenv import load_dotenv
+
+# 🧹 Session service that forgets idle sessions and compacts long histories
+from utilities.session_service import BoundedSessionService
+
 load_dotenv()  # Load variables like GOOGLE_API_KEY into the system
 # This allows you to keep sensitive data out of your code.
 
@@ -41,12 +48,17 @@ class TellTimeAgent:
     # This agent only supports plain text input/output
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self):
+    def __init__(self, session_service: BaseSessionService | None = None):
         """
         👷 Initialize the TellTimeAgent:
         - Creates the LLM agent (powered by Gemini)
         - Sets up session handling, memory, and a runner to execute tasks
+
+        Args:
+            session_service: Where conversations are kept
+                (default: a BoundedSessionService with default limits)
         """
+        self.session_service = session_service or BoundedSessionService()
         self._agent = self._build_agent()  # Set up the Gemini agent
         self._user_id = "time_agent_user"  # Use a fixed user ID for simplicity
 
@@ -55,7 +67,7 @@ class TellTimeAgent:
             app_name=self._agent.name,
             agent=self._agent,
             artifact_service=InMemoryArtifactService(),  # For files (not used here)
-            session_service=InMemorySessionService(),    # Keeps track of conversations
+            session_service=self.session_service,        # Keeps track of conversations
             memory_service=InMemoryMemoryService(),      # Optional: remembers past messages
         )
 
@@ -135,15 +147,52 @@ class TellTimeAgent:
         return "\n".join([p.text for p in last_event.content.parts if p.text])
 
 
-    async def stream(self, query: str, session_id: str):
+    async def stream(self, query: str, session_id: str) -> AsyncIterable[dict]:
         """
-        🌀 Simulates a "streaming" agent that returns a single reply.
-        This is here just to demonstrate that streaming is possible.
+        🌀 Same as invoke(), but yields the reply while Gemini is generating it.
+
+        The Runner is switched to SSE streaming mode, so partial text chunks
+        arrive as separate events before the final response.
 
         Yields:
-            dict: Response payload that says the task is complete and gives the time
+            dict: {"is_task_complete": False, "content": <partial text>} for each chunk,
+                  then {"is_task_complete": True, "content": <full reply>}
         """
-        yield {
-            "is_task_complete": True,
-            "content": f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        }
+        session = await self._runner.session_service.get_session(
+            app_name=self._agent.name,
+            user_id=self._user_id,
+            session_id=session_id
+        )
+
+        if session is None:
+            session = await self._runner.session_service.create_session(
+                app_name=self._agent.name,
+                user_id=self._user_id,
+                session_id=session_id,
+                state={}
+            )
+
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+
+        # 🚀 Run the agent in streaming mode and forward every chunk
+        async for event in self._runner.run_async(
+            user_id=self._user_id,
+            session_id=session.id,
+            new_message=content,
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE)
+        ):
+            if not event.content or not event.content.parts:
+                continue
+
+            text = "".join(p.text for p in event.content.parts if p.text)
+            if event.is_final_response():
+                yield {"is_task_complete": True, "content": text}
+                return
+            if event.partial and text:
+                yield {"is_task_complete": False, "content": text}
+
+        # 🧹 Fallback: the run ended without a final response
+        yield {"is_task_complete": True, "content": ""}
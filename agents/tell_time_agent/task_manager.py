@@ -19,12 +19,18 @@ import logging  # Standard Python module for logging debug/info messages
 
 # 🔁 Import the shared in-memory task manager from the server
 from server.task_manager import InMemoryTaskManager
+from server.task_store import TaskStore
 
 # 🤖 Import the actual agent we're using (Gemini-powered TellTimeAgent)
 from agents.tell_time_agent.agent import TellTimeAgent
 
+# 🧹 Its session service, whose counters we report
+from utilities.session_service import BoundedSessionService
+
 # 📦 Import data models used to structure and return tasks
 from models.request import SendTaskRequest, SendTaskResponse
+from models.request import SendTaskStreamingRequest, SendTaskStreamingResponse
+from typing import AsyncIterable
 from models.task import Message, Task, TextPart, TaskStatus, TaskState
 
 
@@ -46,13 +52,20 @@ class AgentTaskManager(InMemoryTaskManager):
 
     - It "inherits" all the logic from InMemoryTaskManager
     - It overrides the part where we handle a new task (on_send_task)
+    - It overrides streaming (on_send_task_subscribe) to forward Gemini's partial replies
     - It uses the Gemini agent to generate a response
     """
 
-    def __init__(self, agent: TellTimeAgent):
-        super().__init__()     # Call parent class constructor
+    def __init__(self, agent: TellTimeAgent, store: TaskStore | None = None):
+        super().__init__(store=store)  # Call parent class constructor (task storage)
         self.agent = agent     # Store the Gemini-based agent as a property
 
+    def agent_stats(self) -> dict:
+        """Conversation session counters and token estimates, for GET /metrics."""
+        if isinstance(self.agent.session_service, BoundedSessionService):
+            return {"sessions": self.agent.session_service.stats()}
+        return {}
+
     # -------------------------------------------------------------------------
     # 🔍 Extract the user's query from the incoming task
     # -------------------------------------------------------------------------
@@ -103,10 +116,29 @@ class AgentTaskManager(InMemoryTaskManager):
         )
 
         # Step 5: Update the task state and add the message to history
-        async with self.lock:                   # Lock access to avoid concurrent writes
-            task.status = TaskStatus(state=TaskState.COMPLETED)  # Mark task as done
-            task.history.append(agent_message)  # Append the agent's message to the task history
+        task = await self.update_store(         # Locks this task to avoid concurrent writes
+            task.id,
+            TaskStatus(state=TaskState.COMPLETED),  # Mark task as done
+            agent_message                           # Append the agent's message to the task history
+        )
 
         # Step 6: Return a structured response back to the A2A client
         return SendTaskResponse(id=request.id, result=task)
 
+    # -------------------------------------------------------------------------
+    # 📡 Streaming version of on_send_task (JSON-RPC "tasks/sendSubscribe")
+    # -------------------------------------------------------------------------
+    async def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Same steps as on_send_task(), but each partial reply from the agent is
+        streamed to the client as soon as Gemini produces it.
+        """
+        logger.info(f"Streaming new task: {request.params.id}")
+
+        query = self._get_user_query(request)
+        updates = self.agent.stream(query, request.params.sessionId)
+
+        async for response in self.stream_agent_updates(request, updates):
+            yield response
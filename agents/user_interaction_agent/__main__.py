@@ -18,6 +18,8 @@
 
 # A2A Server framework
 from server.server import A2AServer
+from server.cli import admission_options, worker_options, store_options
+from server.task_store import create_task_store
 
 # Agent metadata
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
@@ -46,14 +48,18 @@ logger = logging.getLogger(__name__)
 @click.command()
 @click.option("--host", default="localhost", help="Host to bind the server to")
 @click.option("--port", default=10005, help="Port number for the server")
-def main(host, port):
+@admission_options
+@worker_options
+@store_options
+def main(host, port, max_in_flight, max_queue, queue_timeout, workers, max_pending,
+         max_tasks, task_ttl, task_db, task_cache_ttl):
     """
     This function sets up everything needed to start the UserInteractionAgent server.
     Run via: `python -m agents.user_interaction_agent --host 0.0.0.0 --port 12345`
     """
 
-    # Define agent capabilities (no streaming needed for now)
-    capabilities = AgentCapabilities(streaming=False)
+    # Define agent capabilities ("tasks/sendSubscribe" sends the full reply as one update)
+    capabilities = AgentCapabilities(streaming=True)
 
     # Define what this agent is good at
     skill = AgentSkill(
@@ -81,7 +87,17 @@ def main(host, port):
         host=host,
         port=port,
         agent_card=agent_card,
-        task_manager=AgentTaskManager(agent=UserInteractionAgent())
+        task_manager=AgentTaskManager(
+            agent=UserInteractionAgent(),
+            store=create_task_store(
+                max_tasks=max_tasks, ttl=task_ttl, db_path=task_db, cache_ttl=task_cache_ttl
+            )
+        ),
+        max_in_flight=max_in_flight,
+        max_queue=max_queue,
+        queue_timeout=queue_timeout,
+        workers=workers,
+        max_pending=max_pending
     )
 
     server.start()
@@ -20,6 +20,7 @@ import logging  # For logging important info and debug messages
 
 # 🔁 In-memory task system from server
 from server.task_manager import InMemoryTaskManager
+from server.task_store import TaskStore
 
 # 🤖 Polite OpenAI-based assistant agent
 from agents.user_interaction_agent.agent import UserInteractionAgent
@@ -50,8 +51,8 @@ class AgentTaskManager(InMemoryTaskManager):
     - Maintains session history by sessionId
     """
 
-    def __init__(self, agent: UserInteractionAgent):
-        super().__init__()      # Parent constructor
+    def __init__(self, agent: UserInteractionAgent, store: TaskStore | None = None):
+        super().__init__(store=store)  # Parent constructor (task storage)
         self.agent = agent      # Store the user interaction agent instance
 
     # -------------------------------------------------------------------------
@@ -109,9 +110,9 @@ class AgentTaskManager(InMemoryTaskManager):
         )
 
         # Step 7: Complete the task and add to history
-        async with self.lock:
-            task.status = TaskStatus(state=TaskState.COMPLETED)
-            task.history.append(agent_message)
+        task = await self.update_store(
+            task.id, TaskStatus(state=TaskState.COMPLETED), agent_message
+        )
 
         # Step 8: Return updated task
         return SendTaskResponse(id=request.id, result=task)
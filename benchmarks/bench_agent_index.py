@@ -0,0 +1,108 @@
+# =============================================================================
+# benchmarks/bench_agent_index.py
+# =============================================================================
+# 🎯 Purpose:
+# Cost of finding an agent by capability, as the registry grows.
+#
+# AGENTS synthetic agent cards (each with a few skills, tags and examples)
+# are searched for QUERIES free-text queries:
+# - scan:   score every card against the query, term by term (what a
+#           search without an index has to do)
+# - index:  AgentIndex.search() on the prebuilt BM25 inverted index
+#
+# Reported as microseconds per query, plus the one-off index build time.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_agent_index
+# =============================================================================
+
+import random
+import time
+
+from models.agent import AgentCard, AgentCapabilities, AgentSkill
+from utilities.agent_index import AgentIndex, tokenize
+
+AGENTS = [10, 100, 1000]   # Registered agents per row
+QUERIES = 2000             # Queries per row
+SKILLS = 3                 # Skills per agent
+
+WORDS = (
+    "time clock date weather forecast doctor appointment booking cardiology "
+    "dermatology pediatrics reminder calendar invoice payment insurance claim "
+    "pharmacy prescription lab result report translate summary email sms "
+    "greeting poem schedule availability specialist symptom triage"
+).split()
+
+# Real registries cover many domains: spread the words over 50 of them
+# (letter suffixes, so the tokenizer keeps each one a single term)
+DOMAINS = [a + b for a in "abcdefghij" for b in "vwxyz"]
+VOCABULARY = [word + domain for word in WORDS for domain in DOMAINS]
+
+
+def make_cards(count: int, rng: random.Random) -> list[AgentCard]:
+    cards = []
+    for i in range(count):
+        skills = []
+        for j in range(SKILLS):
+            words = rng.sample(VOCABULARY, 4)
+            skills.append(AgentSkill(
+                id=f"{words[0]}_{words[1]}_{j}",
+                name=f"{words[0].title()} {words[1]}",
+                description=f"Handles {words[0]} and {words[1]} requests",
+                tags=words[:3],
+                examples=[f"Can you help with {words[2]} for {words[3]}?"]
+            ))
+        cards.append(AgentCard(
+            name=f"Agent{i}", description=f"Agent number {i}",
+            url=f"http://127.0.0.1:{20000 + i}/", version="1.0.0",
+            capabilities=AgentCapabilities(), skills=skills
+        ))
+    return cards
+
+
+def scan(cards: list[AgentCard], query: str, top_k: int = 3) -> list[str]:
+    """No index: tokenize every card and count the query terms it contains."""
+    terms = set(tokenize(query))
+    scored = []
+    for card in cards:
+        text = [card.name, card.description]
+        for skill in card.skills:
+            text += [skill.id, skill.name, skill.description or ""]
+            text += skill.tags or []
+            text += skill.examples or []
+        score = sum(1 for term in tokenize(" ".join(text)) if term in terms)
+        if score:
+            scored.append((score, card.name))
+    scored.sort(reverse=True)
+    return [name for _, name in scored[:top_k]]
+
+
+def main():
+    rng = random.Random(7)
+    queries = [" ".join(rng.sample(VOCABULARY, 3)) for _ in range(QUERIES)]
+
+    print(f"{QUERIES} queries per row — µs per query")
+    print(f"{'agents':>7} {'scan':>10} {'index':>8} {'build ms':>9}")
+    for count in AGENTS:
+        cards = make_cards(count, rng)
+
+        start = time.perf_counter()
+        index = AgentIndex(cards)
+        build = time.perf_counter() - start
+
+        scan_queries = queries[: max(20, QUERIES // count)]    # The scan is slow: fewer queries
+        start = time.perf_counter()
+        for query in scan_queries:
+            scan(cards, query)
+        scanned = (time.perf_counter() - start) / len(scan_queries)
+
+        start = time.perf_counter()
+        for query in queries:
+            index.search(query)
+        indexed = (time.perf_counter() - start) / len(queries)
+
+        print(f"{count:>7} {scanned * 1e6:>10.0f} {indexed * 1e6:>8.1f} {build * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
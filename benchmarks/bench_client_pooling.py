@@ -0,0 +1,137 @@
+# =============================================================================
+# benchmarks/bench_client_pooling.py
+# =============================================================================
+# 🎯 Purpose:
+# Orchestrator -> child latency with and without connection pooling.
+#
+# A stub child agent (A2AServer + a task manager that answers at once) runs
+# under uvicorn on a local port in a background thread. AgentConnector then
+# sends tasks to it:
+# - unpooled: a new httpx.AsyncClient (and TCP connection) per request, as
+#             A2AClient did before
+# - pooled:   A2AClient's keep-alive connection pool
+#
+# Latency is measured per AgentConnector.send_task() call, sequentially and
+# with several calls in flight, and reported as p50 / p99 in milliseconds.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_client_pooling
+# =============================================================================
+
+import asyncio
+import json
+import socket
+import statistics
+import threading
+import time
+
+import httpx
+import uvicorn
+
+from agents.host_agent.agent_connect import AgentConnector
+from client.client import A2AClient, A2AClientHTTPError, A2AClientJSONError
+from models.agent import AgentCard, AgentCapabilities
+from models.request import SendTaskRequest, SendTaskResponse
+from models.task import Message, TaskState, TaskStatus, TextPart
+from server.server import A2AServer
+from server.task_manager import InMemoryTaskManager
+
+REQUESTS = 500           # Calls per configuration
+CONCURRENCY = [1, 10]    # Calls in flight at the same time
+
+
+class EchoTaskManager(InMemoryTaskManager):
+    """Stub child agent: replies immediately, no LLM involved."""
+
+    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+        task = await self.upsert_task(request.params)
+        task = await self.update_store(
+            task.id,
+            TaskStatus(state=TaskState.COMPLETED),
+            Message(role="agent", parts=[TextPart(text="It is 10:00 AM.")])
+        )
+        return SendTaskResponse(id=request.id, result=task)
+
+
+class UnpooledA2AClient(A2AClient):
+    """A2AClient with the request path as it was before pooling."""
+
+    async def _send_request(self, request):
+        self.requests += 1
+        async with httpx.AsyncClient() as client:
+            try:
+                response = await client.post(
+                    self.url, json=request.model_dump(), timeout=30,
+                    extensions={"trace": self._trace}   # Counts connections, like A2AClient
+                )
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                raise A2AClientHTTPError(e.response.status_code, str(e)) from e
+            except json.JSONDecodeError as e:
+                raise A2AClientJSONError(str(e)) from e
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_child(port: int, task_manager: InMemoryTaskManager | None = None) -> uvicorn.Server:
+    card = AgentCard(
+        name="EchoAgent", description="benchmark", url=f"http://127.0.0.1:{port}/",
+        version="1.0.0", capabilities=AgentCapabilities(), skills=[]
+    )
+    app = A2AServer(agent_card=card, task_manager=task_manager or EchoTaskManager()).app
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def measure(connector: AgentConnector, concurrency: int) -> list[float]:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call():
+        async with semaphore:
+            start = time.perf_counter()
+            await connector.send_task("What time is it?", "bench-session")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(call() for _ in range(REQUESTS)))
+    return latencies
+
+
+def percentile(values: list[float], p: int) -> float:
+    return statistics.quantiles(values, n=100)[p - 1]
+
+
+async def main():
+    port = free_port()
+    server = start_child(port)
+    url = f"http://127.0.0.1:{port}/"
+
+    print(f"{REQUESTS} calls per row — latency in ms")
+    print(f"{'in flight':>9} {'client':>9} {'p50':>7} {'p99':>7} {'connections':>12}")
+    for concurrency in CONCURRENCY:
+        for label, client_cls in [("unpooled", UnpooledA2AClient), ("pooled", A2AClient)]:
+            connector = AgentConnector("EchoAgent", url)
+            replica = connector.replicas[0]
+            replica.client = client_cls(url=url)
+            await connector.send_task("warm-up", "bench-session")
+            latencies = await measure(connector, concurrency)
+            opened = replica.client.pool_stats()["connections_opened"]
+            await connector.aclose()
+            print(
+                f"{concurrency:>9} {label:>9} {percentile(latencies, 50):>7.2f} "
+                f"{percentile(latencies, 99):>7.2f} {opened:>12}"
+            )
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
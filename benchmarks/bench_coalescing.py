@@ -0,0 +1,96 @@
+# =============================================================================
+# benchmarks/bench_coalescing.py
+# =============================================================================
+# 🎯 Purpose:
+# Child calls and latency during a spike of identical questions, with and
+# without request coalescing in AgentConnector.
+#
+# A stub TellTimeAgent runs under uvicorn on a local port in a background
+# thread; each of its replies takes REPLY_TIME seconds (like an LLM turn).
+# A burst of USERS users then asks "What time is it?" at the same moment,
+# each in their own session:
+# - plain:      every user's call reaches the child
+# - coalesced:  AgentConnector(coalesce=True): calls with the same message
+#               join the one already in flight
+#
+# Reported as the number of tasks the child ran, and p50 / p99 latency in
+# milliseconds.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_coalescing
+# =============================================================================
+
+import asyncio
+import statistics
+import time
+
+from agents.host_agent.agent_connect import AgentConnector
+from benchmarks.bench_client_pooling import free_port, start_child
+from models.request import SendTaskRequest, SendTaskResponse
+from models.task import Message, TaskState, TaskStatus, TextPart
+from server.task_manager import InMemoryTaskManager
+
+USERS = [10, 100]        # Identical questions per burst
+REPLY_TIME = 0.2         # Seconds the child takes per task
+
+
+class SlowClockTaskManager(InMemoryTaskManager):
+    """Stub agent: answers after REPLY_TIME seconds, counts the tasks it ran."""
+
+    def __init__(self):
+        super().__init__()
+        self.handled = 0
+
+    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+        self.handled += 1
+        task = await self.upsert_task(request.params)
+        await asyncio.sleep(REPLY_TIME)
+        task = await self.update_store(
+            task.id,
+            TaskStatus(state=TaskState.COMPLETED),
+            Message(role="agent", parts=[TextPart(text="It is 10:00 AM.")])
+        )
+        return SendTaskResponse(id=request.id, result=task)
+
+
+async def burst(connector: AgentConnector, users: int) -> list[float]:
+    latencies = []
+
+    async def call(i: int):
+        start = time.perf_counter()
+        await connector.stream_reply("What time is it?", f"session-{i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(call(i) for i in range(users)))
+    return latencies
+
+
+def percentile(values: list[float], p: int) -> float:
+    return statistics.quantiles(values, n=100)[p - 1]
+
+
+async def main():
+    port = free_port()
+    child = SlowClockTaskManager()
+    server = start_child(port, child)
+    url = f"http://127.0.0.1:{port}/"
+
+    print(f"child replies in {REPLY_TIME * 1000:.0f} ms — latency in ms")
+    print(f"{'users':>6} {'mode':>10} {'child tasks':>12} {'p50':>7} {'p99':>7}")
+    for users in USERS:
+        for label, coalesce in [("plain", False), ("coalesced", True)]:
+            connector = AgentConnector("TellTimeAgent", url, coalesce=coalesce)
+            await connector.send_task("warm-up", "bench-session")
+            child.handled = 0
+            latencies = await burst(connector, users)
+            await connector.aclose()
+            print(
+                f"{users:>6} {label:>10} {child.handled:>12} "
+                f"{percentile(latencies, 50):>7.1f} {percentile(latencies, 99):>7.1f}"
+            )
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+# =============================================================================
+# benchmarks/bench_discovery.py
+# =============================================================================
+# 🎯 Purpose:
+# Orchestrator startup time: discovering a registry of AGENTS agents.
+#
+# One local Starlette app under uvicorn (separate process) plays all the
+# stub agents: agent i answers GET /agent-<i>/.well-known/agent.json after
+# CARD_DELAY seconds. The registry also holds:
+# - DOWN URLs pointing at closed ports (connection refused)
+# - HUNG agents that never answer within the discovery timeout
+#
+# - sequential:  one card at a time, a new client per sweep (as before)
+# - concurrent:  DiscoveryClient.discover() (bounded concurrency, one pool)
+#
+# Run from the project root:
+#     python -m benchmarks.bench_discovery
+# =============================================================================
+
+import asyncio
+import json
+import os
+import multiprocessing
+import socket
+import tempfile
+import time
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from benchmarks.bench_client_pooling import free_port
+from models.agent import AgentCard, AgentCapabilities
+from utilities.discovery import DiscoveryClient
+
+AGENTS = 200             # Healthy stub agents
+DOWN = 10                # Registry entries nobody listens on
+HUNG = 4                 # Agents that never answer in time
+CARD_DELAY = 0.01        # Seconds a healthy agent takes to answer
+TIMEOUT = 1.0            # Discovery timeout per agent (seconds)
+
+
+def run_agents(port: int):
+    async def card(request: Request):
+        name = request.path_params["name"]
+        if name.startswith("hung"):
+            await asyncio.sleep(TIMEOUT * 5)
+        await asyncio.sleep(CARD_DELAY)
+        return JSONResponse(AgentCard(
+            name=name, description="benchmark", url=f"http://127.0.0.1:{port}/{name}/",
+            version="1.0.0", capabilities=AgentCapabilities(), skills=[]
+        ).model_dump(mode="json"))
+
+    app = Starlette()
+    app.add_route("/{name}/.well-known/agent.json", card, methods=["GET"])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error")
+
+
+def start_agents(port: int) -> multiprocessing.Process:
+    process = multiprocessing.Process(target=run_agents, args=(port,), daemon=True)
+    process.start()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+
+
+async def sequential(base_urls: list[str]) -> int:
+    """The previous list_agent_cards(): one fetch after the other."""
+    found = 0
+    async with httpx.AsyncClient() as client:
+        for base in base_urls:
+            try:
+                response = await client.get(base.rstrip("/") + "/.well-known/agent.json", timeout=TIMEOUT)
+                response.raise_for_status()
+                AgentCard.model_validate(response.json())
+                found += 1
+            except Exception:
+                pass
+    return found
+
+
+async def concurrent(registry: str) -> int:
+    results = await DiscoveryClient(registry_file=registry, timeout=TIMEOUT).discover()
+    return sum(result.ok for result in results)
+
+
+async def main():
+    port = free_port()
+    agents = start_agents(port)
+    base_urls = (
+        [f"http://127.0.0.1:{port}/agent-{i}" for i in range(AGENTS)]
+        + [f"http://127.0.0.1:{free_port()}/" for _ in range(DOWN)]
+        + [f"http://127.0.0.1:{port}/hung-{i}" for i in range(HUNG)]
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = os.path.join(tmp, "agent_registry.json")
+        with open(registry, "w") as f:
+            json.dump(base_urls, f)
+
+        print(f"{len(base_urls)} registry entries: {AGENTS} up, {DOWN} down, {HUNG} hung "
+              f"(timeout {TIMEOUT:.0f}s)")
+        print(f"{'mode':>11} {'seconds':>8} {'found':>6}")
+        for label, run in [("sequential", lambda: sequential(base_urls)),
+                           ("concurrent", lambda: concurrent(registry))]:
+            start = time.perf_counter()
+            found = await run()
+            print(f"{label:>11} {time.perf_counter() - start:>8.2f} {found:>6}")
+
+    agents.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
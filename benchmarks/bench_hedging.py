@@ -0,0 +1,93 @@
+# =============================================================================
+# benchmarks/bench_hedging.py
+# =============================================================================
+# 🎯 Purpose:
+# Tail latency of AgentConnector calls with and without request hedging.
+#
+# Two replicas of a stub read-only agent run under uvicorn on local ports in
+# background threads. Most replies take FAST seconds, but SLOW_SHARE of
+# them take SLOW seconds (like the occasional slow LLM response).
+#
+# - plain:   every call waits for its replica, however slow it is
+# - hedged:  HedgePolicy(percentile=0.9, budget=0.1): calls slower than
+#            the 90th percentile send a copy to the other replica
+#
+# Reported as p50 / p99 in milliseconds, plus the extra load hedging added
+# (copies sent / calls).
+#
+# Run from the project root:
+#     python -m benchmarks.bench_hedging
+# =============================================================================
+
+import asyncio
+import random
+import statistics
+import time
+
+from agents.host_agent.agent_connect import AgentConnector, HedgePolicy
+from benchmarks.bench_client_pooling import free_port, start_child
+from models.request import SendTaskRequest, SendTaskResponse
+from models.task import Message, TaskState, TaskStatus, TextPart
+from server.task_manager import InMemoryTaskManager
+
+CALLS = 400              # Calls per configuration
+CONCURRENCY = 10         # Calls in flight
+FAST = 0.01              # Usual reply time (seconds)
+SLOW = 0.5               # Reply time of a slow reply
+SLOW_SHARE = 0.05        # Share of slow replies
+
+
+class JitteryTaskManager(InMemoryTaskManager):
+    """Stub agent: usually fast, sometimes very slow."""
+
+    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+        task = await self.upsert_task(request.params)
+        await asyncio.sleep(SLOW if random.random() < SLOW_SHARE else FAST)
+        task = await self.update_store(
+            task.id,
+            TaskStatus(state=TaskState.COMPLETED),
+            Message(role="agent", parts=[TextPart(text="It is 10:00 AM.")])
+        )
+        return SendTaskResponse(id=request.id, result=task)
+
+
+async def measure(connector: AgentConnector) -> list[float]:
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def call(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await connector.send_task("What time is it?", f"session-{i}")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(call(i) for i in range(CALLS)))
+    return latencies
+
+
+def percentile(values: list[float], p: int) -> float:
+    return statistics.quantiles(values, n=100)[p - 1]
+
+
+async def main():
+    urls = []
+    for _ in range(2):
+        port = free_port()
+        start_child(port, JitteryTaskManager())
+        urls.append(f"http://127.0.0.1:{port}/")
+
+    print(f"{CALLS} calls, {SLOW_SHARE:.0%} take {SLOW * 1000:.0f} ms — latency in ms")
+    print(f"{'mode':>7} {'p50':>7} {'p99':>7} {'extra load':>11}")
+    for label, hedge in [("plain", None), ("hedged", HedgePolicy(percentile=0.9, budget=0.1))]:
+        connector = AgentConnector("TellTimeAgent", urls, hedge=hedge)
+        await measure(connector)                # Warm-up: connections + latency samples
+        if hedge is not None:
+            hedge.calls = hedge.hedged = hedge.won = 0
+        latencies = await measure(connector)
+        extra = hedge.hedged / hedge.calls if hedge else 0.0
+        await connector.aclose()
+        print(f"{label:>7} {percentile(latencies, 50):>7.1f} {percentile(latencies, 99):>7.1f} {extra:>10.1%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+# =============================================================================
+# benchmarks/bench_router.py
+# =============================================================================
+# 🎯 Purpose:
+# How much traffic the local IntentRouter can take off the LLM, how often it
+# is right, and what a routing decision costs.
+#
+# The router is trained on this project's agent cards (same skills, tags and
+# examples as the agents' __main__.py files) and then routes a labelled set
+# of typical patient messages. Each message is labelled with the agent the
+# orchestrator should call, or None if the LLM should handle it (small talk,
+# ambiguous requests).
+#
+# Reported per decision source (rule / follow-up / model / LLM fallback):
+# how many messages, how many were handled right (routed to the expected
+# agent; for the fallback row, really meant for the LLM), and the mean
+# routing time in microseconds. Every routed message saves one Gemini
+# tool-selection turn and one summarization turn.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_router
+# =============================================================================
+
+import time
+
+from agents.host_agent.router import CHOICE_PROMPTS, IntentRouter
+from models.agent import AgentCard, AgentCapabilities, AgentSkill
+
+ROUNDS = 1000    # Times the labelled set is routed, for timing
+
+
+def card(name: str, description: str, skill: AgentSkill) -> AgentCard:
+    return AgentCard(
+        name=name, description=description, url=f"http://localhost/{name}/",
+        version="1.0.0", capabilities=AgentCapabilities(), skills=[skill]
+    )
+
+
+CARDS = [
+    card("TellTimeAgent", "Tells the current system time when asked", AgentSkill(
+        id="tell_time", name="Tell Time Tool", description="Replies with the current time",
+        tags=["time"], examples=["What time is it?", "Tell me the current time"])),
+    card("GreetingAgent", "Agent that greets you based on time of day", AgentSkill(
+        id="greet", name="Greeting Tool",
+        description="Returns a greeting based on the current time of day",
+        tags=["greeting", "time", "hello"], examples=["Greet me", "Say hello based on time"])),
+    card("DoctorRecommendationAgent",
+         "Recommends a doctor based on user symptoms and provides availability and location info.",
+         AgentSkill(
+             id="doctor_recommendation", name="Doctor Recommendation",
+             description="Recommends a doctor based on symptoms and available days.",
+             tags=["healthcare", "doctor", "recommendation", "hospital"],
+             examples=["I have chest pain.", "Which doctor is available on Monday?",
+                       "I have a skin allergy and want to visit today."])),
+    card("BookAppointmentAgent", "Books appointments with doctors based on user input", AgentSkill(
+        id="book_appointment", name="Book Appointment",
+        description="Books an appointment with a doctor based on ID and date",
+        tags=["appointment", "book", "doctor"],
+        examples=["Book an appointment with doc003 on 2025-07-05", "I want doc006 tomorrow"])),
+    card("UserInteractionAgent", "Politely interacts with users and answers general questions", AgentSkill(
+        id="polite_user_interaction", name="Polite User Interaction",
+        description="Interacts politely and respectfully with users, answering general queries.",
+        tags=["conversation", "polite", "chat"],
+        examples=["Hello, how are you?", "Can you assist me?", "Tell me something nice"])),
+    card("OrchestratorAgent", "Delegates tasks to discovered child agents", AgentSkill(
+        id="orchestrate", name="Orchestrate Tasks", description="Routes user requests",
+        tags=["routing", "orchestration"], examples=["What is the time?", "Greet me"])),
+]
+
+# (message, agent the session talked to last, expected agent or None = LLM)
+LABELLED = [
+    ("what time is it", None, "TellTimeAgent"),
+    ("What's the time?", None, "TellTimeAgent"),
+    ("tell me the current time please", None, "TellTimeAgent"),
+    ("Book doc017 on Friday", None, "BookAppointmentAgent"),
+    ("I want doc006 tomorrow", None, "BookAppointmentAgent"),
+    ("please book an appointment with doc002 on 2025-08-01", None, "BookAppointmentAgent"),
+    ("2", "DoctorRecommendationAgent", "DoctorRecommendationAgent"),
+    ("1", "DoctorRecommendationAgent", "DoctorRecommendationAgent"),
+    ("yes", "BookAppointmentAgent", None),
+    ("3", "TellTimeAgent", None),
+    ("no", "BookAppointmentAgent", None),
+    ("I have a headache", None, "DoctorRecommendationAgent"),
+    ("I have chest pain since morning", None, "DoctorRecommendationAgent"),
+    ("my skin has a rash, which doctor should I see", None, "DoctorRecommendationAgent"),
+    ("which doctor is available on Tuesday", None, "DoctorRecommendationAgent"),
+    ("recommend a doctor for my fever", None, "DoctorRecommendationAgent"),
+    ("I have a sore throat and ear pain", None, "DoctorRecommendationAgent"),
+    ("greet me", None, "GreetingAgent"),
+    ("say hello to me", None, "GreetingAgent"),
+    ("good morning! greet me nicely", None, "GreetingAgent"),
+    ("Hello, how are you?", None, "UserInteractionAgent"),
+    ("can you assist me", None, "UserInteractionAgent"),
+    ("tell me something nice", None, "UserInteractionAgent"),
+    ("I want to book an appointment", None, "BookAppointmentAgent"),
+    ("book me an appointment with a cardiologist tomorrow", None, "BookAppointmentAgent"),
+    ("what should I do about my insurance claim", None, None),
+    ("thanks", None, None),
+    ("2", None, None),
+    ("can you find me a skin doctor and book the earliest slot", None, None),
+    ("where is the cafeteria", None, None),
+    # Look like a rule's target, but aren't
+    ("cancel my appointment with doc003", None, None),
+    ("is doc005 a good doctor?", None, None),
+    ("what is the time of my appointment", None, None),
+    ("what's the current time slot for a cardiologist", None, None),
+]
+
+
+def awaiting(last_agent: str | None) -> str | None:
+    """The agent waiting for a pick, assuming the last agent asked for one if it ever does."""
+    return last_agent if last_agent in CHOICE_PROMPTS else None
+
+
+def main():
+    router = IntentRouter(audit_rate=0.0)
+    router.train(CARDS)
+
+    rows: dict[str, list[int]] = {}    # source -> [messages, correct]
+    for message, last_agent, expected in LABELLED:
+        decision = router.route(message, awaiting_agent=awaiting(last_agent))
+        source = decision.source if decision else "llm"
+        chosen = decision.agent if decision else None
+        row = rows.setdefault(source, [0, 0])
+        row[0] += 1
+        row[1] += chosen == expected if decision else expected is None
+        if decision and chosen != expected:
+            print(f"  wrong: {message!r} -> {chosen} (expected {expected})")
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for message, last_agent, _ in LABELLED:
+            router.route(message, awaiting_agent=awaiting(last_agent))
+    per_decision = (time.perf_counter() - start) / (ROUNDS * len(LABELLED))
+
+    print(f"{len(LABELLED)} labelled messages, threshold {router.threshold}")
+    print(f"{'source':>9} {'messages':>9} {'correct':>8}")
+    for source in ("rule", "followup", "model", "llm"):
+        messages, correct = rows.get(source, [0, 0])
+        print(f"{source:>9} {messages:>9} {correct:>8}")
+    routed = sum(row[0] for source, row in rows.items() if source != "llm")
+    print(f"routed without the LLM: {routed / len(LABELLED):.0%}, "
+          f"{per_decision * 1e6:.1f} µs per decision")
+
+
+if __name__ == "__main__":
+    main()
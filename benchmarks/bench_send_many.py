@@ -0,0 +1,130 @@
+# =============================================================================
+# benchmarks/bench_send_many.py
+# =============================================================================
+# 🎯 Purpose:
+# Bulk-send throughput of A2AClient: one await at a time vs send_many().
+#
+# A stub agent (A2AServer + a task manager that "works" for AGENT_DELAY
+# seconds, like an agent waiting on I/O) runs under uvicorn on a local port
+# in a separate process, so client and server don't share one CPU core and
+# GIL. The client then sends TASKS tasks:
+# - sequential:   `await client.send_task(...)` in a loop (one round trip each)
+# - send_many:    a window of concurrent requests, one task per request
+# - send_many+b:  the same window, BATCH tasks per JSON-RPC batch request
+#
+# Reported as tasks per second and HTTP requests sent.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_send_many
+# =============================================================================
+
+import asyncio
+import multiprocessing
+import socket
+import time
+
+import uvicorn
+
+from client.client import A2AClient
+from models.agent import AgentCard, AgentCapabilities
+from models.request import SendTaskRequest, SendTaskResponse
+from models.task import Message, TaskState, TaskStatus, TextPart
+from server.server import A2AServer
+from server.task_manager import InMemoryTaskManager
+
+TASKS = 500              # Tasks per configuration
+AGENT_DELAY = 0.05       # Seconds the stub agent takes per task (I/O wait)
+CONCURRENCY = 20         # Requests in flight for send_many
+BATCH = 10               # Tasks per batch request
+
+
+class SlowEchoTaskManager(InMemoryTaskManager):
+    """Stub agent: answers after AGENT_DELAY seconds, no LLM involved."""
+
+    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+        task = await self.upsert_task(request.params)
+        await asyncio.sleep(AGENT_DELAY)
+        task = await self.update_store(
+            task.id,
+            TaskStatus(state=TaskState.COMPLETED),
+            Message(role="agent", parts=[TextPart(text="Reminder sent.")])
+        )
+        return SendTaskResponse(id=request.id, result=task)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_agent(port: int):
+    card = AgentCard(
+        name="ReminderAgent", description="benchmark", url=f"http://127.0.0.1:{port}/",
+        version="1.0.0", capabilities=AgentCapabilities(), skills=[]
+    )
+    app = A2AServer(agent_card=card, task_manager=SlowEchoTaskManager()).app
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_agent(port: int) -> multiprocessing.Process:
+    process = multiprocessing.Process(target=run_agent, args=(port,), daemon=True)
+    process.start()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+
+
+def payloads(run: str):
+    for i in range(TASKS):
+        yield {
+            "id": f"{run}-{i}",
+            "message": {"role": "user", "parts": [{"type": "text", "text": f"Remind patient {i}"}]},
+        }
+
+
+async def sequential(client: A2AClient, run: str) -> int:
+    for payload in payloads(run):
+        await client.send_task(payload)
+    return TASKS
+
+
+async def bulk(client: A2AClient, run: str, batch_size: int) -> int:
+    ok = 0
+    async for result in client.send_many(
+        payloads(run), concurrency=CONCURRENCY, batch_size=batch_size
+    ):
+        ok += result.ok
+    return ok
+
+
+async def main():
+    port = free_port()
+    agent = start_agent(port)
+    url = f"http://127.0.0.1:{port}/"
+
+    runs = [
+        ("sequential", lambda c, run: sequential(c, run)),
+        ("send_many", lambda c, run: bulk(c, run, 1)),
+        (f"send_many+b{BATCH}", lambda c, run: bulk(c, run, BATCH)),
+    ]
+
+    print(f"{TASKS} tasks, agent takes {AGENT_DELAY * 1000:.0f} ms each")
+    print(f"{'mode':>14} {'tasks/s':>9} {'ok':>6} {'requests':>9}")
+    for label, run in runs:
+        async with A2AClient(url=url) as client:
+            await client.send_task(next(payloads(f"warm-{label}")))
+            client.requests = 0
+            start = time.perf_counter()
+            ok = await run(client, label)
+            elapsed = time.perf_counter() - start
+            print(f"{label:>14} {TASKS / elapsed:>9.0f} {ok:>6} {client.requests:>9}")
+
+    agent.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
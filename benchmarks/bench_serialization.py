@@ -0,0 +1,106 @@
+# =============================================================================
+# benchmarks/bench_serialization.py
+# =============================================================================
+# 🎯 Purpose:
+# Micro-benchmark for the A2AServer response path.
+#
+# Compares requests/second for `tasks/get` on tasks with 10, 100 and 1000
+# messages in their history:
+# - before: request.json() + pretty-printed debug dump, then
+#           model_dump() -> jsonable_encoder() -> JSONResponse (stdlib json)
+# - after:  server.serialization (pydantic-core straight to bytes, A2AJSONResponse)
+#
+# Requests go through the real Starlette app in-process (httpx ASGITransport),
+# so routing and HTTP handling are included but no sockets are involved.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_serialization
+# =============================================================================
+
+import asyncio
+import contextlib
+import io
+import time
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from models.agent import AgentCard, AgentCapabilities
+from models.json_rpc import JSONRPCResponse, InternalError
+from models.request import A2ARequest, GetTaskRequest
+from models.task import Message, Task, TaskState, TaskStatus, TextPart
+from server.server import A2AServer
+from server.task_manager import InMemoryTaskManager
+
+HISTORY_SIZES = [10, 100, 1000]
+DURATION = 2.0          # Seconds spent measuring each configuration
+
+
+class LegacyA2AServer(A2AServer):
+    """A2AServer with the request/response path as it was before server.serialization."""
+
+    async def _handle_request(self, request: Request):
+        import json
+        try:
+            body = await request.json()
+            print("\n🔍 Incoming JSON:", json.dumps(body, indent=2))
+            json_rpc = A2ARequest.validate_python(body)
+            if isinstance(json_rpc, GetTaskRequest):
+                result = await self.task_manager.on_get_task(json_rpc)
+            else:
+                raise ValueError(f"Unsupported A2A method: {type(json_rpc)}")
+            return JSONResponse(content=jsonable_encoder(result.model_dump(exclude_none=True)))
+        except Exception as e:
+            return JSONResponse(
+                JSONRPCResponse(id=None, error=InternalError(message=str(e))).model_dump(),
+                status_code=200
+            )
+
+
+def build_task(task_id: str, size: int) -> Task:
+    history = [
+        Message(
+            role="user" if i % 2 == 0 else "agent",
+            parts=[TextPart(text=f"Message {i}: I have a headache, which doctor is available on Friday?")]
+        )
+        for i in range(size)
+    ]
+    return Task(id=task_id, status=TaskStatus(state=TaskState.COMPLETED), history=history)
+
+
+async def measure(server_cls, size: int) -> float:
+    task_manager = InMemoryTaskManager()       # Only `tasks/get` is exercised
+    task_manager.tasks["bench"] = build_task("bench", size)
+    card = AgentCard(
+        name="BenchAgent", description="benchmark", url="http://bench/",
+        version="1.0.0", capabilities=AgentCapabilities(), skills=[]
+    )
+    server = server_cls(agent_card=card, task_manager=task_manager)
+    payload = GetTaskRequest(params={"id": "bench"}).model_dump()
+
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/", json=payload)   # warm-up
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < DURATION:
+            response = await client.post("/", json=payload)
+            response.read()
+            count += 1
+        return count / (time.perf_counter() - start)
+
+
+async def main():
+    print(f"{'history':>8} {'before req/s':>14} {'after req/s':>13} {'speedup':>8}")
+    for size in HISTORY_SIZES:
+        # The legacy path prints every request; keep that cost but hide the output
+        with contextlib.redirect_stdout(io.StringIO()):
+            before = await measure(LegacyA2AServer, size)
+        after = await measure(A2AServer, size)
+        print(f"{size:>8} {before:>14.0f} {after:>13.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
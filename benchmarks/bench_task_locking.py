@@ -0,0 +1,122 @@
+# =============================================================================
+# benchmarks/bench_task_locking.py
+# =============================================================================
+# 🎯 Purpose:
+# Concurrency benchmark for InMemoryTaskManager locking.
+#
+# Simulates N concurrent sessions (up to 1000). Each session repeatedly sends
+# a message to its own task (upsert_task + update_store) and reads it back
+# with tasks/get, like a client polling in background mode.
+#
+# - global lock:  one asyncio.Lock for every task, and tasks/get copies the
+#                 task while holding it (the previous implementation)
+# - striped:      InMemoryTaskManager as it is now (striped per-task locks,
+#                 lock-free tasks/get)
+#
+# Two store variants are measured:
+# - in-memory: critical sections never await (the current store)
+# - async I/O: one `await` inside each critical section, like a store that
+#              persists the change (database, disk) before releasing the lock
+#
+# Run from the project root:
+#     python -m benchmarks.bench_task_locking
+# =============================================================================
+
+import asyncio
+import time
+
+from models.request import GetTaskRequest
+from models.task import Message, Task, TaskSendParams, TaskState, TaskStatus, TextPart
+from server.task_manager import InMemoryTaskManager
+
+SESSIONS = [1, 10, 100, 1000]
+ROUNDS = 20              # send + get rounds per session
+IO_DELAY = 0.0005        # Seconds of simulated I/O inside a critical section
+
+
+def make_manager(base_cls, io_delay: float) -> InMemoryTaskManager:
+    """Wrap a task manager so every write waits `io_delay` seconds while locked."""
+
+    class Manager(base_cls):
+        async def _persist(self):
+            if io_delay:
+                await asyncio.sleep(io_delay)
+
+        async def upsert_task(self, params: TaskSendParams) -> Task:
+            async with self.task_lock(params.id):
+                task = self.tasks.get(params.id)
+                if task is None:
+                    task = Task(
+                        id=params.id,
+                        status=TaskStatus(state=TaskState.SUBMITTED),
+                        history=[params.message]
+                    )
+                    self.tasks[params.id] = task
+                else:
+                    task.history.append(params.message)
+                await self._persist()
+                return task
+
+        async def update_store(self, task_id, status, message=None) -> Task:
+            async with self.task_lock(task_id):
+                task = self.tasks[task_id]
+                task.status = status
+                if message is not None:
+                    task.history.append(message)
+                await self._persist()
+                return task
+
+    return Manager()
+
+
+class GlobalLockTaskManager(InMemoryTaskManager):
+    """InMemoryTaskManager with the single global lock it used to have."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock = asyncio.Lock()
+
+    def task_lock(self, task_id: str) -> asyncio.Lock:
+        return self.lock
+
+    async def on_get_task(self, request: GetTaskRequest):
+        async with self.lock:
+            return await super().on_get_task(request)
+
+
+async def session(manager: InMemoryTaskManager, index: int):
+    task_id = f"task-{index}"
+    for i in range(ROUNDS):
+        params = TaskSendParams(
+            id=task_id,
+            message=Message(role="user", parts=[TextPart(text=f"Question {i}")])
+        )
+        await manager.upsert_task(params)
+        await manager.update_store(
+            task_id,
+            TaskStatus(state=TaskState.COMPLETED),
+            Message(role="agent", parts=[TextPart(text=f"Answer {i}")])
+        )
+        await manager.on_get_task(GetTaskRequest(params={"id": task_id, "historyLength": 10}))
+
+
+async def measure(base_cls, sessions: int, io_delay: float) -> float:
+    manager = make_manager(base_cls, io_delay)
+    start = time.perf_counter()
+    await asyncio.gather(*(session(manager, i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return sessions * ROUNDS / elapsed     # Rounds (send + get) per second
+
+
+async def main():
+    for label, io_delay in [("in-memory", 0.0), ("async I/O", IO_DELAY)]:
+        print(f"\n{label} store — rounds/s (send + get)")
+        print(f"{'sessions':>9} {'global lock':>12} {'striped':>10} {'speedup':>8}")
+        for sessions in SESSIONS:
+            before = await measure(GlobalLockTaskManager, sessions, io_delay)
+            after = await measure(InMemoryTaskManager, sessions, io_delay)
+            print(f"{sessions:>9} {before:>12.0f} {after:>10.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
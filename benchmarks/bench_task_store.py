@@ -0,0 +1,68 @@
+# =============================================================================
+# benchmarks/bench_task_store.py
+# =============================================================================
+# 🎯 Purpose:
+# Write throughput of the task store backends.
+#
+# Each round is one conversation turn as the task managers record it:
+# upsert_task() (user message) + update_store() (agent reply, completed).
+# Rounds run from many concurrent sessions, and the clock stops only after
+# the store was stopped, so the SQLite numbers include writing every task
+# to disk.
+#
+# - memory:  BoundedTaskStore (RAM only)
+# - sqlite:  SqliteTaskStore (WAL, write-behind batches, hot cache)
+#
+# Run from the project root:
+#     python -m benchmarks.bench_task_store
+# =============================================================================
+
+import asyncio
+import os
+import tempfile
+import time
+
+from models.task import Message, TaskSendParams, TaskState, TaskStatus, TextPart
+from server.sqlite_task_store import SqliteTaskStore
+from server.task_manager import InMemoryTaskManager
+from server.task_store import BoundedTaskStore
+
+SESSIONS = 100           # Concurrent sessions
+TURNS = [1, 10, 50]      # Turns per session (history grows with every turn)
+
+
+async def session(manager: InMemoryTaskManager, index: int, turns: int):
+    task_id = f"task-{index}"
+    for i in range(turns):
+        await manager.upsert_task(TaskSendParams(
+            id=task_id,
+            message=Message(role="user", parts=[TextPart(text=f"Which doctor is free on day {i}?")])
+        ))
+        await manager.update_store(
+            task_id,
+            TaskStatus(state=TaskState.COMPLETED),
+            Message(role="agent", parts=[TextPart(text=f"Dr. Tanya Bhatt is available on day {i}.")])
+        )
+
+
+async def measure(store, turns: int) -> float:
+    manager = InMemoryTaskManager(store=store)
+    await manager.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(session(manager, i, turns) for i in range(SESSIONS)))
+    await manager.stop()     # Flushes everything still pending
+    return SESSIONS * turns * 2 / (time.perf_counter() - start)    # Writes per second
+
+
+async def main():
+    print(f"{SESSIONS} concurrent sessions — writes/s (each turn = 2 writes)")
+    print(f"{'turns':>6} {'memory':>10} {'sqlite':>10} {'ratio':>7}")
+    for turns in TURNS:
+        memory = await measure(BoundedTaskStore(), turns)
+        with tempfile.TemporaryDirectory() as tmp:
+            sqlite = await measure(SqliteTaskStore(os.path.join(tmp, "tasks.db")), turns)
+        print(f"{turns:>6} {memory:>10.0f} {sqlite:>10.0f} {sqlite / memory:>6.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,8 +7,15 @@
 #
 # It supports:
 # - Sending tasks and receiving responses
+# - Waiting for tasks that the server runs in the background (polling tasks/get)
 # - Getting task status or history
-# - (Streaming and canceling are not supported in this simplified version)
+# - Canceling a queued or running task
+# - Reusing connections: one pooled, keep-alive httpx client per A2AClient
+#   (or one shared by several clients), closed with aclose() / `async with`
+# - Retrying failed calls with exponential backoff and jitter (RetryPolicy)
+# - Streaming a task's status/artifact updates (tasks/sendSubscribe, SSE)
+# - Sending many tasks at once (send_many): a bounded window of concurrent
+#   requests over the pool, optionally packed into JSON-RPC batches
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -16,21 +23,29 @@
 # -----------------------------------------------------------------------------
 
 import json
+import asyncio                                         # Used to sleep between polls
+import logging                                         # Used to warn about unavailable HTTP/2
+import random                                          # Jitter for retry delays
 from uuid import uuid4                                 # Used to encode/decode JSON data
 import httpx                                # Async HTTP client for making web requests
-from httpx_sse import connect_sse           # SSE client extension for httpx (not used currently)
-from typing import Any                      # Type hints for flexible input/output
+from httpx_sse import aconnect_sse          # SSE client extension for httpx (streamed tasks)
+from collections import deque               # Ordered window of in-flight sends
+from typing import Any, AsyncIterator, Iterable    # Type hints for flexible input/output
 
 # Import supported request types
-from models.request import SendTaskRequest, GetTaskRequest  # Removed CancelTaskRequest
+from models.request import SendTaskRequest, GetTaskRequest, CancelTaskRequest
+from models.request import SendTaskStreamingRequest, SendTaskStreamingResponse
 
 # Base request format for JSON-RPC 2.0
-from models.json_rpc import JSONRPCRequest
+from models.json_rpc import JSONRPCRequest, ServerBusyError
 
 # Models for task results and agent identity
-from models.task import Task, TaskSendParams
+from models.task import Task, TaskSendParams, TaskState
+from models.task import TaskStatusUpdateEvent, TaskArtifactUpdateEvent
 from models.agent import AgentCard
 
+logger = logging.getLogger(__name__)
+
 
 # -----------------------------------------------------------------------------
 # Custom Error Classes
@@ -44,17 +59,203 @@ class A2AClientJSONError(Exception):
     """Raised when the response is not valid JSON"""
     pass
 
+class A2AClientRPCError(Exception):
+    """Raised when the agent answers with a JSON-RPC error (e.g., task not found)"""
+    def __init__(self, code: int, message: str):
+        super().__init__(f"Agent error {code}: {message}")
+        self.code = code
+
+    @classmethod
+    def from_response(cls, response: dict[str, Any]) -> "A2AClientRPCError":
+        err = response["error"]
+        return cls(err.get("code"), err.get("message"))
+
+
+# -----------------------------------------------------------------------------
+# RetryPolicy: How failed calls are retried
+# -----------------------------------------------------------------------------
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: before retry N the client sleeps a
+    random time between 0 and min(max_delay, base_delay * 2**N) seconds, so
+    many clients retrying at once don't hit the agent in lockstep.
+
+    What is retried depends on the call:
+    - Every call: connection failures (the request never reached the agent)
+      and "server busy" answers (the agent rejected it before doing anything)
+    - Idempotent calls only (tasks/get, tasks/cancel): also read timeouts,
+      dropped connections and HTTP 5xx, since repeating them is harmless.
+      tasks/send is not retried then, because the agent may have run it.
+
+    Attributes:
+        retries (int): Extra attempts after the first one (0 = never retry)
+        base_delay (float): Delay scale in seconds
+        max_delay (float): Upper bound of a single delay in seconds
+    """
+
+    def __init__(self, retries: int = 2, base_delay: float = 0.1, max_delay: float = 2.0):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (starting at 0)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def should_retry(self, error: Exception, idempotent: bool) -> bool:
+        """True if a call that failed with `error` may be sent again."""
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+            return True
+        if isinstance(error, A2AClientRPCError):
+            return error.code == ServerBusyError().code
+        if not idempotent:
+            return False
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, A2AClientHTTPError):
+            return error.args[0] >= 500
+        return False
+
+
+# Used when an A2AClient is created without a retry policy
+DEFAULT_RETRY = RetryPolicy()
+
+# Streams may stay silent for a long time while the agent thinks or calls
+# other agents, so only connecting (not reading) is limited
+STREAM_TIMEOUT = httpx.Timeout(30.0, read=None)
+
+
+# -----------------------------------------------------------------------------
+# create_http_client: A pooled, keep-alive HTTP client
+# -----------------------------------------------------------------------------
+
+def create_http_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    http2: bool = False,
+    timeout: float = 30.0
+) -> httpx.AsyncClient:
+    """
+    Build an httpx.AsyncClient whose connections are kept open and reused.
+    Pass it to several A2AClients (http_client=...) to share one pool.
+
+    Args:
+        max_connections: Max open connections in the pool
+        max_keepalive_connections: Max idle connections kept for reuse
+        keepalive_expiry: Seconds an idle connection is kept before closing it
+        http2: Use HTTP/2 when the server supports it (needs the `h2` package;
+            falls back to HTTP/1.1 if it isn't installed)
+        timeout: Default timeout (seconds) for every request
+    """
+    if http2:
+        try:
+            import h2  # noqa: F401  (only checking that it's installed)
+        except ImportError:
+            logger.warning("HTTP/2 requested but the 'h2' package isn't installed; using HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ),
+        http2=http2,
+        timeout=timeout
+    )
+
 
 # -----------------------------------------------------------------------------
 # A2AClient: Main interface for talking to an A2A agent
 # -----------------------------------------------------------------------------
 
+# Task states that mean "the server accepted the task but hasn't finished it yet"
+PENDING_STATES = {TaskState.SUBMITTED, TaskState.WORKING}
+
+
+# -----------------------------------------------------------------------------
+# BulkResult: Outcome of one payload sent with send_many()
+# -----------------------------------------------------------------------------
+
+class BulkResult:
+    """
+    One entry of A2AClient.send_many(): the finished task, or the error that
+    payload failed with (other payloads are not affected).
+
+    Attributes:
+        index (int): Position of the payload in the input
+        payload (dict): The payload that was sent
+        task (Task | None): The task, if it was sent successfully
+        error (Exception | None): Why it failed otherwise
+    """
+
+    def __init__(self, index: int, payload: dict[str, Any], task: Task | None = None,
+                 error: Exception | None = None):
+        self.index = index
+        self.payload = payload
+        self.task = task
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"task={self.task.id}" if self.ok else f"error={self.error!r}"
+        return f"BulkResult(index={self.index}, {outcome})"
+
+
 class A2AClient:
-    def __init__(self, agent_card: AgentCard = None, url: str = None):
+    def __init__(
+        self,
+        agent_card: AgentCard = None,
+        url: str = None,
+        poll_interval: float = 0.25,
+        max_poll_interval: float = 2.0,
+        wait_timeout: float | None = 300.0,
+        http_client: httpx.AsyncClient | None = None,
+        retry: RetryPolicy | None = None,
+        **pool_options
+    ):
         """
         Initializes the client using either an agent card or a direct URL.
         One of the two must be provided.
+
+        poll_interval / max_poll_interval / wait_timeout control how send_task()
+        waits for servers running in background mode: it polls tasks/get,
+        doubling the delay up to max_poll_interval, for at most wait_timeout
+        seconds (None = wait forever).
+
+        Connections are pooled and kept alive between requests:
+        - http_client: a shared client from create_http_client(); it's left
+          open by aclose(), since other A2AClients may still use it
+        - otherwise the client creates its own pool on first use, configured
+          by pool_options (the create_http_client() arguments), and closes it
+          in aclose()
+
+        retry sets how failed calls are retried (default: DEFAULT_RETRY;
+        pass RetryPolicy(retries=0) to disable retries).
         """
+        self.poll_interval = poll_interval
+        self.retry = retry or DEFAULT_RETRY
+        self.max_poll_interval = max_poll_interval
+        self.wait_timeout = wait_timeout
+
+        # 🔌 Connection pool
+        self._http = http_client
+        self._owns_http = http_client is None
+        self._pool_options = pool_options
+
+        # Set to False once the server rejects JSON-RPC batches
+        self._batching = True
+
+        # 📊 Pool counters (see pool_stats())
+        self.requests = 0               # Requests sent
+        self.retries = 0                # Requests sent again after a failure
+        self.connections_opened = 0     # New TCP connections (the rest reused one)
+
         if agent_card:
             self.url = agent_card.url
         elif url:
@@ -66,8 +267,11 @@ class A2AClient:
     # -------------------------------------------------------------------------
     # send_task: Send a new task to the agent
     # -------------------------------------------------------------------------
-    async def send_task(self, payload: dict[str, Any]) -> Task:
-
+    async def send_task(self, payload: dict[str, Any], wait: bool = True) -> Task:
+        """
+        Send a task. If the server only queued it (background mode), poll
+        tasks/get until it's finished, unless wait=False.
+        """
         request = SendTaskRequest(
             id=uuid4().hex,
             params=TaskSendParams(**payload)  # ✅ Proper model wrapping
@@ -76,13 +280,227 @@ class A2AClient:
         # print("\n📤 Sending JSON-RPC request:")
         # print(json.dumps(request.model_dump(), indent=2))
 
-        response = await self._send_request(request)
-        if response.get("error"):
-            # Raise a clear exception with the error message
-            err = response["error"]
-            raise Exception(f"Agent error {err.get('code')}: {err.get('message')}")
-        return Task(**response["result"])  # ✅ Extract just the 'result' field
+        # Not idempotent: only retried if the agent can't have started it
+        response = await self._call(request, idempotent=False)
+        task = Task(**response["result"])  # ✅ Extract just the 'result' field
 
+        if wait and task.status.state in PENDING_STATES:
+            task = await self.wait_for_task(task.id)
+        return task
+
+
+    # -------------------------------------------------------------------------
+    # send_task_streaming: Send a task and receive its progress as it happens
+    # -------------------------------------------------------------------------
+    async def send_task_streaming(
+        self, payload: dict[str, Any]
+    ) -> AsyncIterator[TaskStatusUpdateEvent | TaskArtifactUpdateEvent]:
+        """
+        Send a task with "tasks/sendSubscribe" and yield its events as the
+        agent produces them:
+        - TaskStatusUpdateEvent: state changes; partial replies arrive as
+          "working" events carrying a message
+        - TaskArtifactUpdateEvent: the agent's output
+        The iterator ends after the event marked final.
+
+        Like send_task(), the call is retried only if it failed before the
+        agent could start it (and never once events were received).
+
+        Raises:
+            A2AClientRPCError: if the agent rejects the task or fails mid-stream
+        """
+        request = SendTaskStreamingRequest(
+            id=uuid4().hex,
+            params=TaskSendParams(**payload)
+        )
+
+        attempt = 0
+        while True:
+            received = False
+            try:
+                async for event in self._stream_request(request):
+                    received = True
+                    yield event
+                return
+            except Exception as e:
+                if (received or attempt >= self.retry.retries
+                        or not self.retry.should_retry(e, idempotent=False)):
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.info(f"A2AClient: retrying {request.method} to {self.url} in {delay:.2f}s ({e!r})")
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+
+
+    # -------------------------------------------------------------------------
+    # send_many: Send many tasks with a bounded number in flight
+    # -------------------------------------------------------------------------
+    async def send_many(
+        self,
+        payloads: Iterable[dict[str, Any]],
+        concurrency: int = 10,
+        batch_size: int = 10,
+        ordered: bool = False,
+        wait: bool = True
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Send every payload as a task and yield a BulkResult for each one.
+
+        Up to `concurrency` requests are in flight at once over the pooled
+        connections, each carrying up to `batch_size` tasks as one JSON-RPC
+        batch. If the server doesn't accept batches, tasks are sent one per
+        request instead. `payloads` is consumed lazily, so it may be a
+        generator of any length.
+
+        Args:
+            payloads: TaskSendParams dicts, as for send_task()
+            concurrency: Max requests in flight
+            batch_size: Tasks per request (1 = no batching)
+            ordered: Yield results in input order (a slow task holds back
+                the ones after it); otherwise as soon as each one finishes
+            wait: Poll tasks the server only queued, as send_task() does
+
+        Yields:
+            BulkResult: One per payload; a failed payload carries its error
+        """
+        groups = _chunks(enumerate(payloads), max(1, batch_size))
+        window: deque[asyncio.Task] = deque()
+
+        try:
+            for group in groups:
+                window.append(asyncio.create_task(self._send_group(group, wait)))
+                if len(window) < concurrency:
+                    continue
+
+                if ordered:
+                    done = [window.popleft()]
+                else:
+                    finished, _ = await asyncio.wait(window, return_when=asyncio.FIRST_COMPLETED)
+                    done = [t for t in window if t in finished]
+                    for t in done:
+                        window.remove(t)
+                for t in done:
+                    for result in await t:
+                        yield result
+
+            # Drain what's still in flight
+            while window:
+                if ordered:
+                    done = window.popleft()
+                else:
+                    finished, _ = await asyncio.wait(window, return_when=asyncio.FIRST_COMPLETED)
+                    done = finished.pop()
+                    window.remove(done)
+                for result in await done:
+                    yield result
+        finally:
+            # The caller stopped early (or failed): don't leave sends running
+            for t in window:
+                t.cancel()
+            await asyncio.gather(*window, return_exceptions=True)
+
+    async def _send_group(
+        self, group: list[tuple[int, dict[str, Any]]], wait: bool
+    ) -> list[BulkResult]:
+        """Send one group of payloads (batched if possible); never raises."""
+        if len(group) > 1 and self._batching:
+            results = await self._send_batch(group, wait)
+            if results is not None:
+                return results
+
+        return list(await asyncio.gather(
+            *(self._send_one(index, payload, wait) for index, payload in group)
+        ))
+
+    async def _send_one(self, index: int, payload: dict[str, Any], wait: bool) -> BulkResult:
+        try:
+            return BulkResult(index, payload, task=await self.send_task(payload, wait=wait))
+        except Exception as e:
+            return BulkResult(index, payload, error=e)
+
+    async def _send_batch(
+        self, group: list[tuple[int, dict[str, Any]]], wait: bool
+    ) -> list[BulkResult] | None:
+        """
+        Send a group as one JSON-RPC batch.
+
+        Returns:
+            list[BulkResult], or None if the server doesn't support batches
+        """
+        results: dict[int, BulkResult] = {}
+        sent = []        # (index, payload, request) for every valid payload
+        for index, payload in group:
+            try:
+                request = SendTaskRequest(id=uuid4().hex, params=TaskSendParams(**payload))
+                sent.append((index, payload, request))
+            except Exception as e:
+                results[index] = BulkResult(index, payload, error=e)
+
+        responses, failure = None, None
+        if sent:
+            try:
+                responses = await self._call([request for *_, request in sent], idempotent=False)
+            except A2AClientRPCError as e:
+                if e.code != ServerBusyError().code:
+                    # A single error object instead of an array: no batch support
+                    logger.info(f"A2AClient: {self.url} does not accept batches ({e}), sending tasks one by one")
+                    self._batching = False
+                    return None
+                failure = e
+            except Exception as e:
+                failure = e
+
+        follow_ups = []  # Queued tasks to poll, rejected tasks to resend on their own
+        by_id = {response.get("id"): response for response in responses or []}
+        for index, payload, request in sent:
+            response = by_id.get(request.id)
+            if failure is not None:
+                results[index] = BulkResult(index, payload, error=failure)
+            elif response is None:
+                results[index] = BulkResult(index, payload, error=A2AClientJSONError("Missing batch response"))
+            elif response.get("error"):
+                error = A2AClientRPCError.from_response(response)
+                if self.retry.should_retry(error, idempotent=False):
+                    follow_ups.append(self._send_one(index, payload, wait))    # e.g. busy
+                else:
+                    results[index] = BulkResult(index, payload, error=error)
+            else:
+                result = BulkResult(index, payload, task=Task(**response["result"]))
+                results[index] = result
+                if wait and result.task.status.state in PENDING_STATES:
+                    follow_ups.append(self._wait_result(result))
+
+        for result in await asyncio.gather(*follow_ups):
+            results[result.index] = result
+        return [results[index] for index, _ in group]
+
+    async def _wait_result(self, result: BulkResult) -> BulkResult:
+        try:
+            result.task = await self.wait_for_task(result.task.id)
+        except Exception as e:
+            result.error = e
+        return result
+
+
+    # -------------------------------------------------------------------------
+    # wait_for_task: Poll a task until it leaves the submitted/working states
+    # -------------------------------------------------------------------------
+    async def wait_for_task(self, task_id: str) -> Task:
+        """
+        Poll tasks/get with exponential backoff until the task is finished.
+
+        Raises:
+            TimeoutError: if the task is still pending after wait_timeout seconds
+        """
+        delay = self.poll_interval
+        async with asyncio.timeout(self.wait_timeout):
+            while True:
+                await asyncio.sleep(delay)
+                task = await self.get_task({"id": task_id})
+                if task.status.state not in PENDING_STATES:
+                    return task
+                delay = min(delay * 2, self.max_poll_interval)
 
 
     # -------------------------------------------------------------------------
@@ -90,27 +508,178 @@ class A2AClient:
     # -------------------------------------------------------------------------
     async def get_task(self, payload: dict[str, Any]) -> Task:
         request = GetTaskRequest(params=payload)
-        response = await self._send_request(request)
+        response = await self._call(request, idempotent=True)
+        return Task(**response["result"])
+
+
+    # -------------------------------------------------------------------------
+    # cancel_task: Stop a task that is queued or still running on the agent
+    # -------------------------------------------------------------------------
+    async def cancel_task(self, payload: dict[str, Any]) -> Task:
+        """
+        Ask the agent to cancel a task. payload is {"id": <task id>}.
+
+        Returns:
+            Task: The task in its "canceled" state
+        """
+        request = CancelTaskRequest(params=payload)
+        response = await self._call(request, idempotent=True)
         return Task(**response["result"])
 
 
 
     # -------------------------------------------------------------------------
-    # _send_request: Internal helper to send a JSON-RPC request
+    # aclose / async with: Release pooled connections
     # -------------------------------------------------------------------------
-    async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
+    async def aclose(self):
+        """Close the connection pool (unless it was shared via http_client)."""
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "A2AClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+    # -------------------------------------------------------------------------
+    # pool_stats: Connection reuse gauges and counters
+    # -------------------------------------------------------------------------
+    def pool_stats(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict: requests sent, TCP connections opened (requests minus this
+            is how many reused a connection), and open/idle connections now
+        """
+        connections = []
+        if self._http is not None:
+            # httpx doesn't expose its pool publicly; read it defensively
+            pool = getattr(getattr(self._http, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "connections_opened": self.connections_opened,
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for c in connections if c.is_idle()),
+        }
+
+
+    # -------------------------------------------------------------------------
+    # _call: Send a request, retrying per the RetryPolicy
+    # -------------------------------------------------------------------------
+    async def _call(
+        self, request: JSONRPCRequest | list[JSONRPCRequest], idempotent: bool
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        Send a JSON-RPC request (or a batch of them, as a list) and return the
+        response dict (or the list of responses).
+
+        Raises:
+            A2AClientRPCError: if the agent answered with a JSON-RPC error
+            A2AClientHTTPError / httpx.TransportError: if the call failed
+            (after all allowed retries)
+        """
+        attempt = 0
+        while True:
             try:
-                response = await client.post(
-                    self.url,
-                    json=request.model_dump(),  # Convert Pydantic model to JSON
-                    timeout=30
-                )
-                response.raise_for_status()     # Raise error if status code is 4xx/5xx
-                return response.json()          # Return parsed response as a dict
-
-            except httpx.HTTPStatusError as e:
-                raise A2AClientHTTPError(e.response.status_code, str(e)) from e
-
-            except json.JSONDecodeError as e:
-                raise A2AClientJSONError(str(e)) from e
+                response = await self._send_request(request)
+                if isinstance(response, dict) and response.get("error"):
+                    raise A2AClientRPCError.from_response(response)
+                if isinstance(request, list) and not isinstance(response, list):
+                    raise A2AClientJSONError("Expected a batch response")
+                return response
+            except Exception as e:
+                if attempt >= self.retry.retries or not self.retry.should_retry(e, idempotent):
+                    raise
+                delay = self.retry.delay(attempt)
+                method = "batch" if isinstance(request, list) else request.method
+                logger.info(f"A2AClient: retrying {method} to {self.url} in {delay:.2f}s ({e!r})")
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+
+    # -------------------------------------------------------------------------
+    # _send_request: Internal helper to send a JSON-RPC request
+    # -------------------------------------------------------------------------
+    async def _send_request(
+        self, request: JSONRPCRequest | list[JSONRPCRequest]
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        if self._http is None:
+            self._http = create_http_client(**self._pool_options)
+
+        # Convert Pydantic model(s) to JSON; a list is sent as a JSON-RPC batch
+        if isinstance(request, list):
+            body = [r.model_dump() for r in request]
+        else:
+            body = request.model_dump()
+
+        self.requests += 1
+        try:
+            response = await self._http.post(
+                self.url,
+                json=body,
+                extensions={"trace": self._trace}       # Lets us count new connections
+            )
+            response.raise_for_status()     # Raise error if status code is 4xx/5xx
+            return response.json()          # Return parsed response as a dict
+
+        except httpx.HTTPStatusError as e:
+            raise A2AClientHTTPError(e.response.status_code, str(e)) from e
+
+        except json.JSONDecodeError as e:
+            raise A2AClientJSONError(str(e)) from e
+
+    # -------------------------------------------------------------------------
+    # _stream_request: Internal helper to read a Server-Sent Events response
+    # -------------------------------------------------------------------------
+    async def _stream_request(
+        self, request: JSONRPCRequest
+    ) -> AsyncIterator[TaskStatusUpdateEvent | TaskArtifactUpdateEvent]:
+        if self._http is None:
+            self._http = create_http_client(**self._pool_options)
+
+        self.requests += 1
+        async with aconnect_sse(
+            self._http, "POST", self.url,
+            json=request.model_dump(),
+            timeout=STREAM_TIMEOUT,
+            extensions={"trace": self._trace}
+        ) as event_source:
+            response = event_source.response
+            if response.is_error:
+                raise A2AClientHTTPError(response.status_code, f"HTTP {response.status_code}")
+
+            # Errors raised before streaming starts (busy, unknown method, ...)
+            # come back as a plain JSON-RPC response instead of an event stream
+            if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                await response.aread()
+                raise A2AClientRPCError.from_response(response.json())
+
+            async for sse in event_source.aiter_sse():
+                message = SendTaskStreamingResponse.model_validate_json(sse.data)
+                if message.error:
+                    raise A2AClientRPCError(message.error.code, message.error.message)
+                yield message.result
+                if isinstance(message.result, TaskStatusUpdateEvent) and message.result.final:
+                    return
+
+    async def _trace(self, event: str, info: dict):
+        """httpcore trace hook: called for each step of a request."""
+        if event == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+
+def _chunks(items: Iterable, size: int) -> Iterable[list]:
+    """Lazily split `items` into lists of at most `size` elements."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -14,6 +14,10 @@
 # - JSONRPCResponse: The reply to a request (either result or error)
 # - JSONRPCError: The structure of an error response
 # - InternalError: A predefined standard error for unexpected failures
+# - JSONParseError / InvalidRequestError / MethodNotFoundError: other standard errors
+# - TaskNotFoundError: A2A-specific error for unknown task IDs
+# - TaskNotCancelableError: A2A-specific error for tasks that already finished
+# - ServerBusyError: The server is shedding load and rejected the request
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -95,3 +99,66 @@ class InternalError(JSONRPCError):
 
     # Optional debug details (e.g., traceback or context info)
     data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# JSONParseError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# The request body isn't valid JSON (standard code -32700).
+class JSONParseError(JSONRPCError):
+    code: int = -32700
+    message: str = "Invalid JSON payload"
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# InvalidRequestError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# The JSON is valid but isn't a proper JSON-RPC request (standard code -32600).
+class InvalidRequestError(JSONRPCError):
+    code: int = -32600
+    message: str = "Request payload validation error"
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# MethodNotFoundError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# The requested method isn't supported by this server (standard code -32601).
+class MethodNotFoundError(JSONRPCError):
+    code: int = -32601
+    message: str = "Method not found"
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# TaskNotFoundError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# A2A-specific error: no task exists with the requested ID.
+class TaskNotFoundError(JSONRPCError):
+    code: int = -32001
+    message: str = "Task not found"
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# TaskNotCancelableError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# A2A-specific error: the task already reached a final state
+# (completed, failed or canceled) and can't be canceled anymore.
+class TaskNotCancelableError(JSONRPCError):
+    code: int = -32002
+    message: str = "Task cannot be canceled"
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# ServerBusyError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# The server is at its concurrency limit and its wait queue is full (or the
+# request waited too long). Clients should back off and retry later.
+# Uses the JSON-RPC "server error" range (-32000 to -32099).
+class ServerBusyError(JSONRPCError):
+    code: int = -32000
+    message: str = "Server busy"
+    data: Any | None = None
@@ -13,12 +13,14 @@
 #
 # Included Models:
 # - SendTaskRequest
+# - SendTaskStreamingRequest
 # - GetTaskRequest
+# - CancelTaskRequest
 # - A2ARequest (discriminated union)
 # - SendTaskResponse
+# - SendTaskStreamingResponse
 # - GetTaskResponse
-#
-# Note: CancelTaskRequest will be added in a future version if cancellation support is implemented.
+# - CancelTaskResponse
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -34,7 +36,8 @@ from models.json_rpc import JSONRPCRequest, JSONRPCResponse
 
 # Task-related parameter and return models
 from models.task import Task, TaskSendParams
-from models.task import TaskQueryParams
+from models.task import TaskQueryParams, TaskIdParams
+from models.task import TaskStatusUpdateEvent, TaskArtifactUpdateEvent
 
 
 # -----------------------------------------------------------------------------
@@ -46,6 +49,15 @@ class SendTaskRequest(JSONRPCRequest):
     params: TaskSendParams                          # Task creation parameters
 
 
+# -----------------------------------------------------------------------------
+# SendTaskStreamingRequest: Send a task and subscribe to its updates over SSE
+# -----------------------------------------------------------------------------
+
+class SendTaskStreamingRequest(JSONRPCRequest):
+    method: Literal["tasks/sendSubscribe"] = "tasks/sendSubscribe"  # Exact method string required
+    params: TaskSendParams                                          # Task creation parameters
+
+
 # -----------------------------------------------------------------------------
 # GetTaskRequest: Used to retrieve a task's status or history
 # -----------------------------------------------------------------------------
@@ -55,6 +67,15 @@ class GetTaskRequest(JSONRPCRequest):
     params: TaskQueryParams                         # Task ID and optional history limit
 
 
+# -----------------------------------------------------------------------------
+# CancelTaskRequest: Used to stop a task that is queued or still running
+# -----------------------------------------------------------------------------
+
+class CancelTaskRequest(JSONRPCRequest):
+    method: Literal["tasks/cancel"] = "tasks/cancel"  # Exact method string required
+    params: TaskIdParams                              # ID of the task to cancel
+
+
 # -----------------------------------------------------------------------------
 # A2ARequest: Discriminated union of supported request types
 # -----------------------------------------------------------------------------
@@ -64,8 +85,9 @@ A2ARequest = TypeAdapter(
     Annotated[
         Union[
             SendTaskRequest,
+            SendTaskStreamingRequest,
             GetTaskRequest,
-            # CancelTaskRequest can be added here in future if implemented
+            CancelTaskRequest,
         ],
         Field(discriminator="method")
     ]
@@ -80,9 +102,25 @@ class SendTaskResponse(JSONRPCResponse):
     result: Task | None = None                      # The task returned by the agent
 
 
+# -----------------------------------------------------------------------------
+# SendTaskStreamingResponse: One SSE event of a "tasks/sendSubscribe" stream
+# -----------------------------------------------------------------------------
+
+class SendTaskStreamingResponse(JSONRPCResponse):
+    result: TaskStatusUpdateEvent | TaskArtifactUpdateEvent | None = None  # The streamed event
+
+
 # -----------------------------------------------------------------------------
 # GetTaskResponse: Response model for a "tasks/get" request
 # -----------------------------------------------------------------------------
 
 class GetTaskResponse(JSONRPCResponse):
     result: Task | None = None                      # The requested task, or None if not found
+
+
+# -----------------------------------------------------------------------------
+# CancelTaskResponse: Response model for a "tasks/cancel" request
+# -----------------------------------------------------------------------------
+
+class CancelTaskResponse(JSONRPCResponse):
+    result: Task | None = None                      # The task, now in the "canceled" state
@@ -9,6 +9,7 @@
 # - The state of the task (`TaskStatus`, `TaskState`)
 # - The messages exchanged during a task (`Message`, `TextPart`)
 # - Parameters used when sending, querying, or canceling tasks
+# - Streaming events sent over SSE (`TaskStatusUpdateEvent`, `TaskArtifactUpdateEvent`)
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -51,7 +52,10 @@ class Message(BaseModel):
 
 class TaskStatus(BaseModel):
     state: str  # A string like "submitted", "working", etc. (defined more precisely in TaskState)
-    
+
+    # Optional message attached to the status (e.g., partial agent output while "working")
+    message: Message | None = None
+
     # Automatically captures the time when the status is recorded
     timestamp: datetime = Field(default_factory=datetime.now)
 
@@ -106,4 +110,36 @@ class TaskState(str, Enum):
     COMPLETED = "completed"             # Task is done
     CANCELED = "canceled"               # Task was canceled by user or system
     FAILED = "failed"                   # Something went wrong
-    UNKNOWN = "unknown"                 # Fallback for undefined or unrecognized states
\ No newline at end of file
+    UNKNOWN = "unknown"                 # Fallback for undefined or unrecognized states
+
+
+# -----------------------------------------------------------------------------
+# Artifact: A piece of output produced by the agent while working on a task
+# -----------------------------------------------------------------------------
+
+class Artifact(BaseModel):
+    name: str | None = None                # Optional name of the artifact (e.g., "answer")
+    parts: List[Part]                      # The content of the artifact
+    index: int = 0                         # Position of the artifact when a task produces several
+    append: bool | None = None             # True if this chunk extends a previous artifact
+    lastChunk: bool | None = None          # True on the final chunk of the artifact
+    metadata: dict[str, Any] | None = None # Optional extra info
+
+
+# -----------------------------------------------------------------------------
+# Streaming Events: Sent to the client over SSE for "tasks/sendSubscribe"
+# -----------------------------------------------------------------------------
+
+# Sent whenever the task's state changes (and for partial "working" output)
+class TaskStatusUpdateEvent(BaseModel):
+    id: str                                # The task ID this event belongs to
+    status: TaskStatus                     # The new status of the task
+    final: bool = False                    # True on the last event of the stream
+    metadata: dict[str, Any] | None = None # Optional extra info
+
+
+# Sent when the agent produces output (e.g., its final reply)
+class TaskArtifactUpdateEvent(BaseModel):
+    id: str                                # The task ID this event belongs to
+    artifact: Artifact                     # The produced artifact
+    metadata: dict[str, Any] | None = None # Optional extra info
@@ -0,0 +1,142 @@
+# =============================================================================
+# server/admission.py
+# =============================================================================
+# 🎯 Purpose:
+# Admission control (load shedding) for the A2A server.
+#
+# Every `tasks/send` call usually triggers an LLM call. Without a limit, a
+# burst of requests piles up hundreds of coroutines that all hit the provider
+# at once. The AdmissionController:
+# - Lets at most `max_in_flight` requests run at the same time
+# - Keeps up to `max_queue` extra requests waiting for a free slot
+# - Fails a waiting request after `queue_timeout` seconds
+# - Rejects new requests immediately when the wait queue is full
+# - Counts admissions, rejections and timeouts for monitoring
+# =============================================================================
+
+import asyncio                                   # Semaphore + timeouts for async code
+from contextlib import asynccontextmanager       # To offer `async with controller.admit():`
+
+
+# -----------------------------------------------------------------------------
+# ServerBusy: Raised when a request can't be admitted
+# -----------------------------------------------------------------------------
+class ServerBusy(Exception):
+    """Raised when the wait queue is full or a queued request timed out."""
+    pass
+
+
+# -----------------------------------------------------------------------------
+# AdmissionController
+# -----------------------------------------------------------------------------
+class AdmissionController:
+    """
+    🚦 Bounds how many requests run concurrently.
+
+    Attributes:
+        max_in_flight (int | None): Max concurrent requests (None or 0 = unlimited)
+        max_queue (int): Max requests waiting for a slot (0 = reject when all slots are busy)
+        queue_timeout (float | None): Max seconds a request waits in the queue
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        max_queue: int = 0,
+        queue_timeout: float | None = None
+    ):
+        self.max_in_flight = max_in_flight or None
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout or None
+
+        # One semaphore slot per allowed in-flight request
+        self._slots = asyncio.Semaphore(self.max_in_flight) if self.max_in_flight else None
+
+        # 📊 Gauges and counters
+        self.in_flight = 0       # Requests currently running
+        self.queue_depth = 0     # Requests currently waiting for a slot
+        self.admitted = 0        # Total requests that got a slot
+        self.rejected = 0        # Total requests turned away because the queue was full
+        self.timed_out = 0       # Total requests that gave up waiting in the queue
+
+    # -------------------------------------------------------------------------
+    # acquire / release: Take and give back an in-flight slot
+    # -------------------------------------------------------------------------
+    async def acquire(self):
+        """
+        Wait for an in-flight slot.
+
+        Raises:
+            ServerBusy: if the queue is full, or no slot freed up within queue_timeout
+        """
+        if self._slots is None:
+            self._admit()
+            return
+
+        # Fast path: a slot is free and nobody is ahead of us
+        if not self._slots.locked() and self.queue_depth == 0:
+            await self._slots.acquire()    # Returns immediately
+            self._admit()
+            return
+
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise ServerBusy(f"Server busy: {self.in_flight} in flight, {self.queue_depth} queued")
+
+        self.queue_depth += 1
+        acquired = False
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await self._slots.acquire()
+                acquired = True
+        except TimeoutError:
+            # The timeout can fire right after the slot was granted; give it back
+            if acquired:
+                self._slots.release()
+            self.timed_out += 1
+            raise ServerBusy(f"Server busy: no free slot within {self.queue_timeout}s")
+        finally:
+            self.queue_depth -= 1
+
+        self._admit()
+
+    def release(self):
+        """Give back a slot taken by acquire()."""
+        self.in_flight -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    def _admit(self):
+        self.in_flight += 1
+        self.admitted += 1
+
+    # -------------------------------------------------------------------------
+    # admit: Context-manager form of acquire()/release()
+    # -------------------------------------------------------------------------
+    @asynccontextmanager
+    async def admit(self):
+        """
+        Usage:
+            async with controller.admit():
+                ...  # runs while holding a slot
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    # -------------------------------------------------------------------------
+    # stats: Snapshot of the gauges and counters
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
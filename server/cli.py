@@ -0,0 +1,116 @@
+# =============================================================================
+# server/cli.py
+# =============================================================================
+# 🎯 Purpose:
+# Shared `click` options for the agents' `__main__.py` entry points, so every
+# A2A server exposes the same tuning flags with the same defaults.
+#
+# Usage:
+#     @click.command()
+#     @click.option("--host", ...)
+#     @click.option("--port", ...)
+#     @admission_options
+#     @worker_options
+#     @store_options
+#     @session_options
+#     def main(host, port, max_in_flight, max_queue, queue_timeout, workers, max_pending,
+#              max_tasks, task_ttl, task_db, task_cache_ttl, max_sessions, session_ttl,
+#              keep_turns):
+#         ...
+# =============================================================================
+
+import click    # Library for building command-line interfaces
+
+
+# -----------------------------------------------------------------------------
+# 🚦 admission_options: Concurrency limit and load shedding
+# -----------------------------------------------------------------------------
+def admission_options(func):
+    """
+    Adds --max-in-flight, --max-queue and --queue-timeout to a click command.
+    The values map 1:1 to the A2AServer constructor arguments.
+    """
+    func = click.option(
+        "--queue-timeout", default=10.0, type=float, show_default=True,
+        help="Seconds a task may wait for a free slot before 'server busy' is returned"
+    )(func)
+    func = click.option(
+        "--max-queue", default=64, type=int, show_default=True,
+        help="Max tasks waiting for a free slot; extra tasks are rejected immediately"
+    )(func)
+    func = click.option(
+        "--max-in-flight", default=16, type=int, show_default=True,
+        help="Max tasks processed concurrently (0 = unlimited)"
+    )(func)
+    return func
+
+
+# -----------------------------------------------------------------------------
+# 🏭 worker_options: Background task execution
+# -----------------------------------------------------------------------------
+def worker_options(func):
+    """
+    Adds --workers and --max-pending to a click command.
+    With --workers N (N > 0), "tasks/send" returns immediately and N background
+    workers run the agent; clients poll the result with "tasks/get".
+    """
+    func = click.option(
+        "--max-pending", default=1000, type=int, show_default=True,
+        help="Max tasks waiting for a background worker (0 = unbounded)"
+    )(func)
+    func = click.option(
+        "--workers", default=0, type=int, show_default=True,
+        help="Background workers running tasks (0 = run each task inside its HTTP request)"
+    )(func)
+    return func
+
+
+# -----------------------------------------------------------------------------
+# 🗃️ store_options: Task store limits
+# -----------------------------------------------------------------------------
+def store_options(func):
+    """
+    Adds --max-tasks, --task-ttl, --task-db and --task-cache-ttl to a click command.
+    The values map 1:1 to the create_task_store() arguments.
+    """
+    func = click.option(
+        "--task-cache-ttl", default=0.0, type=float, show_default=True,
+        help="With --task-db: seconds a cached task is trusted before it is re-read from the file; set it when several processes share the file (0 = always trust the cache)"
+    )(func)
+    func = click.option(
+        "--task-db", default=None, type=click.Path(dir_okay=False),
+        help="SQLite file to persist tasks to, so they survive restarts (default: RAM only)"
+    )(func)
+    func = click.option(
+        "--task-ttl", default=3600.0, type=float, show_default=True,
+        help="Seconds a finished task is kept after its last use (0 = forever)"
+    )(func)
+    func = click.option(
+        "--max-tasks", default=10000, type=int, show_default=True,
+        help="Max tasks kept in memory; least recently used ones are evicted (0 = unlimited). With --task-db this bounds the hot cache"
+    )(func)
+    return func
+
+
+# -----------------------------------------------------------------------------
+# 💬 session_options: Agent (ADK) session limits
+# -----------------------------------------------------------------------------
+def session_options(func):
+    """
+    Adds --max-sessions, --session-ttl and --keep-turns to a click command.
+    The values map 1:1 to the BoundedSessionService arguments
+    (max_sessions, ttl, keep_turns).
+    """
+    func = click.option(
+        "--keep-turns", default=10, type=int, show_default=True,
+        help="Conversation turns per session sent to the LLM as they are; older ones are summarized (0 = keep all)"
+    )(func)
+    func = click.option(
+        "--session-ttl", default=3600.0, type=float, show_default=True,
+        help="Seconds a conversation session is kept after its last use (0 = forever)"
+    )(func)
+    func = click.option(
+        "--max-sessions", default=1000, type=int, show_default=True,
+        help="Max conversation sessions kept; least recently used ones are evicted (0 = unlimited)"
+    )(func)
+    return func
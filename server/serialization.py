@@ -0,0 +1,137 @@
+# =============================================================================
+# server/serialization.py
+# =============================================================================
+# 🎯 Purpose:
+# Fast JSON encoding/decoding for the A2A server.
+#
+# Pydantic models (JSON-RPC responses, tasks, agent cards) are serialized
+# straight to bytes by pydantic-core, without building an intermediate dict
+# and without a second pass through `jsonable_encoder` + stdlib `json`.
+#
+# Plain Python data (dicts/lists) uses `orjson` when it's installed and falls
+# back to the standard library otherwise, so orjson stays optional.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# 📚 Imports
+# -----------------------------------------------------------------------------
+
+import json                                      # Fallback encoder/decoder
+from datetime import datetime                    # For the stdlib datetime fallback
+from typing import Any, Iterable                 # Type hints
+
+from pydantic import BaseModel                   # All A2A models derive from this
+from starlette.responses import Response         # Base class for our JSON response
+
+from models.json_rpc import JSONRPCMessage     # Envelope whose "id" is always sent
+
+# 🚀 Optional fast backend for plain dicts/lists
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# -----------------------------------------------------------------------------
+# 🔧 Serializer for datetime (stdlib fallback)
+# -----------------------------------------------------------------------------
+def json_serializer(obj):
+    """
+    This function can convert Python datetime objects to ISO strings, and
+    pydantic models to plain JSON data.
+    If you try to serialize a type it doesn't know, it will raise an error.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, BaseModel):
+        data = obj.model_dump(mode="json", exclude_none=True)
+        if isinstance(obj, JSONRPCMessage) and obj.id is None:
+            data = {"jsonrpc": data.pop("jsonrpc"), "id": None, **data}    # Always sent
+        return data
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+# How every serialized JSON-RPC message starts
+_ENVELOPE = b'{"jsonrpc":"2.0"'
+
+
+# -----------------------------------------------------------------------------
+# 📤 dumps(): Serialize a model (or plain data) to JSON bytes
+# -----------------------------------------------------------------------------
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact JSON bytes.
+
+    Args:
+        obj: A pydantic model, or plain JSON-compatible data (which may
+             contain models or datetimes)
+
+    Returns:
+        bytes: UTF-8 encoded JSON (None fields of models are omitted, except
+        a JSON-RPC message's "id", which JSON-RPC 2.0 requires even if null)
+    """
+    if isinstance(obj, BaseModel):
+        # pydantic-core writes the model directly to bytes in one pass
+        body = obj.__pydantic_serializer__.to_json(obj, exclude_none=True)
+        if isinstance(obj, JSONRPCMessage) and obj.id is None:
+            # Errors for unparseable requests have no ID: send "id": null.
+            # "jsonrpc" is always the first field, so it goes right after it
+            body = _ENVELOPE + b',"id":null' + body[len(_ENVELOPE):]
+        return body
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_serializer)
+    return json.dumps(obj, default=json_serializer, separators=(",", ":")).encode("utf-8")
+
+
+# -----------------------------------------------------------------------------
+# 📦 dumps_many(): Serialize several models as one JSON array
+# -----------------------------------------------------------------------------
+def dumps_many(items: Iterable[Any]) -> bytes:
+    """
+    Serialize each item on its own and join the bytes into a JSON array.
+    Used for JSON-RPC batch responses, so no combined dict is ever built.
+
+    Args:
+        items: Models (or plain data) to put in the array
+
+    Returns:
+        bytes: A JSON array
+    """
+    return b"[" + b",".join(dumps(item) for item in items) + b"]"
+
+
+# -----------------------------------------------------------------------------
+# 📥 loads(): Parse JSON bytes
+# -----------------------------------------------------------------------------
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document (e.g., an incoming request body).
+
+    Raises:
+        ValueError: if the payload isn't valid JSON (json.JSONDecodeError and
+                    orjson.JSONDecodeError are both ValueError subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# -----------------------------------------------------------------------------
+# 🧾 A2AJSONResponse: Starlette response that renders through dumps()
+# -----------------------------------------------------------------------------
+class A2AJSONResponse(Response):
+    """
+    Drop-in replacement for Starlette's JSONResponse.
+
+    Accepts a pydantic model, a list of models (rendered as a JSON array),
+    plain JSON data, or bytes that are already encoded.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, list):
+            return dumps_many(content)
+        return dumps(content)
@@ -4,9 +4,15 @@
 # 📌 Purpose:
 # This file defines a very simple A2A (Agent-to-Agent) server.
 # It supports:
-# - Receiving task requests via POST ("/")
-# - Letting clients discover the agent's details via GET ("/.well-known/agent.json")
-# NOTE: It does not support streaming or push notifications in this version.
+# - Receiving task requests via POST ("/"), including JSON-RPC 2.0 batches
+# - Streaming task progress as Server-Sent Events ("tasks/sendSubscribe")
+# - Canceling queued or running tasks ("tasks/cancel")
+# - Letting clients discover the agent's details via GET ("/.well-known/agent.json"),
+#   with an ETag so unchanged cards can be revalidated cheaply (304 Not Modified)
+# - Limiting concurrent tasks and shedding load when overloaded ("server busy")
+# - Reporting server counters via GET ("/metrics")
+# - Optional background mode: "tasks/send" returns at once, workers run the agent
+# NOTE: It does not support push notifications in this version.
 # =============================================================================
 
 
@@ -16,45 +22,79 @@
 
 # 🌐 Starlette is a lightweight web framework for building ASGI applications
 from starlette.applications import Starlette            # To create our web app
-from starlette.responses import JSONResponse            # To send responses as JSON
+from starlette.responses import StreamingResponse       # To stream Server-Sent Events
+from starlette.responses import Response                # For "304 Not Modified"
 from starlette.requests import Request                  # Represents incoming HTTP requests
 
 # 📦 Importing our custom models and logic
 from models.agent import AgentCard                      # Describes the agent's identity and skills
 from models.request import A2ARequest, SendTaskRequest  # Request models for tasks
+from models.request import SendTaskStreamingRequest     # Request model for streamed tasks
+from models.request import GetTaskRequest               # Request model for task lookups
+from models.request import CancelTaskRequest            # Request model for cancellation
 from models.json_rpc import JSONRPCResponse, InternalError  # JSON-RPC utilities for structured messaging
+from models.json_rpc import (                           # Standard JSON-RPC errors
+    JSONParseError, InvalidRequestError, MethodNotFoundError, ServerBusyError
+)
+from pydantic import ValidationError                    # Raised when a request doesn't match any model
 from server import task_manager              # Our actual task handling logic (Gemini agent)
 
+# ⚡ Fast JSON encoding straight from pydantic models to bytes
+from server.serialization import A2AJSONResponse, dumps, loads
+
+# 🚦 Concurrency limit + wait queue for incoming tasks
+from server.admission import AdmissionController, ServerBusy
+
 # 🛠️ General utilities
-import json                                              # Used for printing the request payloads (for debugging)
+import asyncio                                           # Used to run batch entries concurrently
+import hashlib                                           # Used to compute the agent card's ETag
+from contextlib import asynccontextmanager               # Used to define the app lifespan
 import logging                                           # Used to log errors and info messages
+from typing import AsyncIterable, Callable               # Type hints for streamed results
 logger = logging.getLogger(__name__)                     # Setup logger for this file
 
-# 🕒 datetime import for serialization
-from datetime import datetime
-
-# 📦 Encoder to help convert complex data like datetime into JSON
-from fastapi.encoders import jsonable_encoder
-
 
 # -----------------------------------------------------------------------------
-# 🔧 Serializer for datetime
+# 🔓 AdmittedStreamingResponse: A stream that holds an admission slot
 # -----------------------------------------------------------------------------
-def json_serializer(obj):
+class AdmittedStreamingResponse(StreamingResponse):
     """
-    This function can convert Python datetime objects to ISO strings.
-    If you try to serialize a type it doesn't know, it will raise an error.
+    A StreamingResponse that frees its admission slot once the response is
+    over, however it ends: fully sent, failed, or cut short by a client
+    that disconnected, even before the first event was produced.
+
+    Releasing from the stream's own generator isn't enough: a generator that
+    was never iterated never runs its `finally`, and a disconnect can also
+    skip a response's `background` task.
     """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+
+    def __init__(self, content, release: Callable[[], None], **kwargs):
+        super().__init__(content, **kwargs)
+        self._release = release
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release()
 
 
 # -----------------------------------------------------------------------------
 # 🚀 A2AServer Class: The Core Server Logic
 # -----------------------------------------------------------------------------
 class A2AServer:
-    def __init__(self, host="0.0.0.0", port=5000, agent_card: AgentCard = None, task_manager: task_manager = None):
+    def __init__(
+        self,
+        host="0.0.0.0",
+        port=5000,
+        agent_card: AgentCard = None,
+        task_manager: task_manager = None,
+        max_in_flight: int | None = None,
+        max_queue: int = 0,
+        queue_timeout: float | None = None,
+        workers: int = 0,
+        max_pending: int = 0
+    ):
         """
         🔧 Constructor for our A2AServer
 
@@ -63,14 +103,30 @@ class A2AServer:
             port: Port number to listen on (default is 5000)
             agent_card: Metadata that describes our agent (name, skills, capabilities)
             task_manager: Logic to handle the task (using Gemini agent here)
+            max_in_flight: Max tasks processed at the same time (None or 0 = unlimited)
+            max_queue: Max tasks waiting for a free slot before "server busy" is returned
+            queue_timeout: Max seconds a task may wait for a free slot
+            workers: If > 0, "tasks/send" only queues the task and returns it as
+                "submitted"; this many background workers run the agent, and
+                clients poll with "tasks/get" (0 = run every task inline)
+            max_pending: Max tasks waiting for a background worker (0 = unbounded)
         """
         self.host = host
         self.port = port
         self.agent_card = agent_card
         self.task_manager = task_manager
+        self.workers = workers
+        self.max_pending = max_pending
+
+        # 🚦 Admission control for task execution (tasks/get is never limited)
+        self.admission = AdmissionController(
+            max_in_flight=max_in_flight,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout
+        )
 
-        # 🌐 Starlette app initialization
-        self.app = Starlette()
+        # 🌐 Starlette app initialization (lifespan starts/stops the task manager)
+        self.app = Starlette(lifespan=self._lifespan)
 
         # 📥 Register a route to handle task requests (JSON-RPC POST)
         self.app.add_route("/", self._handle_request, methods=["POST"])
@@ -78,6 +134,9 @@ class A2AServer:
         # 🔎 Register a route for agent discovery (metadata as JSON)
         self.app.add_route("/.well-known/agent.json", self._get_agent_card, methods=["GET"])
 
+        # 📊 Register a route exposing server counters (queue depth, rejections, ...)
+        self.app.add_route("/metrics", self._get_metrics, methods=["GET"])
+
     # -----------------------------------------------------------------------------
     # ▶️ start(): Launch the web server using uvicorn
     # -----------------------------------------------------------------------------
@@ -93,17 +152,66 @@ class A2AServer:
         import uvicorn
         uvicorn.run(self.app, host=self.host, port=self.port)
 
+    # -----------------------------------------------------------------------------
+    # 🔁 _lifespan(): Start and stop the task manager with the web server
+    # -----------------------------------------------------------------------------
+    @asynccontextmanager
+    async def _lifespan(self, app: Starlette):
+        """
+        Runs once when the server starts (before the first request) and once
+        when it shuts down. Background workers live inside the server's event loop.
+        """
+        await self.task_manager.start(workers=self.workers, max_pending=self.max_pending)
+        try:
+            yield
+        finally:
+            await self.task_manager.stop()
+
     # -----------------------------------------------------------------------------
     # 🔎 _get_agent_card(): Return the agent's metadata (GET request)
     # -----------------------------------------------------------------------------
-    def _get_agent_card(self, request: Request) -> JSONResponse:
+    def _get_agent_card(self, request: Request) -> Response:
         """
         Endpoint for agent discovery (GET /.well-known/agent.json)
 
+        The response carries an ETag (a hash of the card). A client that
+        sends it back in If-None-Match gets an empty "304 Not Modified"
+        while the card is unchanged.
+
         Returns:
-            JSONResponse: Agent metadata as a dictionary
+            A2AJSONResponse: Agent metadata as JSON, or
+            Response: 304 if the client's copy is current
         """
-        return JSONResponse(self.agent_card.model_dump(exclude_none=True))
+        body = dumps(self.agent_card)
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers = {"ETag": etag}
+
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return A2AJSONResponse(body, headers=headers)
+
+    # -----------------------------------------------------------------------------
+    # 📊 _get_metrics(): Return server counters (GET request)
+    # -----------------------------------------------------------------------------
+    def _get_metrics(self, request: Request) -> A2AJSONResponse:
+        """
+        Endpoint for monitoring (GET /metrics)
+
+        Returns:
+            A2AJSONResponse: Admission-control, background-queue, task-store
+            and agent gauges and counters
+        """
+        queue = self.task_manager.task_queue if self.workers else None
+        return A2AJSONResponse({
+            "admission": self.admission.stats(),
+            "workers": {
+                "workers": self.workers,
+                "pending": queue.qsize() if queue else 0,
+                "max_pending": self.max_pending,
+            },
+            "tasks": self.task_manager.store_stats(),
+            "agent": self.task_manager.agent_stats(),
+        })
 
     # -----------------------------------------------------------------------------
     # 📥 _handle_request(): Handle incoming POST requests for tasks
@@ -113,50 +221,171 @@ class A2AServer:
         This method handles task requests sent to the root path ("/").
 
         - Parses incoming JSON
-        - Validates the JSON-RPC message
-        - For supported task types, delegates to the task manager
+        - A JSON array is treated as a JSON-RPC 2.0 batch (see _handle_batch)
+        - Otherwise the single request is validated and dispatched
         - Returns a response or error
         """
         try:
             # Step 1: Parse incoming JSON body
-            body = await request.json()
-            print("\n🔍 Incoming JSON:", json.dumps(body, indent=2))  # Log input for visibility
+            body = loads(await request.body())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Incoming JSON: {body}")  # Only formatted when debugging
+        except Exception as e:
+            logger.error(f"Invalid JSON: {e}")
+            return self._create_response(
+                JSONRPCResponse(id=None, error=JSONParseError(message=str(e)))
+            )
+
+        # Step 2: A list of requests is a batch – answered with a list of responses
+        if isinstance(body, list):
+            return await self._handle_batch(body)
+
+        # Step 3: Single request – dispatch it and convert the result to a response
+        result = await self._dispatch(body)
+        return self._create_response(result)
+
+    # -----------------------------------------------------------------------------
+    # 📦 _handle_batch(): Run every entry of a JSON-RPC batch concurrently
+    # -----------------------------------------------------------------------------
+    async def _handle_batch(self, batch: list) -> A2AJSONResponse:
+        """
+        Handles a JSON-RPC 2.0 batch (a JSON array of requests).
+
+        All entries are dispatched concurrently and answered together in one
+        JSON array, in the same order as the requests. A failing entry only
+        produces an error object for that entry; the rest still succeed.
 
-            # Step 2: Parse and validate request using discriminated union
+        Args:
+            batch: The parsed JSON array from the request body
+
+        Returns:
+            A2AJSONResponse: Array of JSON-RPC responses
+        """
+        if not batch:
+            # The spec treats an empty batch as a single invalid request
+            return self._create_response(
+                JSONRPCResponse(id=None, error=InvalidRequestError(message="Empty batch"))
+            )
+
+        results = await asyncio.gather(
+            *(self._dispatch(entry, in_batch=True) for entry in batch)
+        )
+        return A2AJSONResponse(list(results))
+
+    # -----------------------------------------------------------------------------
+    # 🚦 _dispatch(): Validate one JSON-RPC request and hand it to the task manager
+    # -----------------------------------------------------------------------------
+    async def _dispatch(self, body, in_batch: bool = False):
+        """
+        Validates a single JSON-RPC request and calls the matching task manager method.
+
+        Errors never escape this method: they are returned as JSON-RPC error
+        responses carrying the request's id, so one bad entry can't fail a batch.
+
+        Args:
+            body: One parsed JSON-RPC request (dict)
+            in_batch: True if the request is part of a batch (streaming isn't allowed there)
+
+        Returns:
+            JSONRPCResponse, or an async iterable of them for streaming requests
+        """
+        request_id = body.get("id") if isinstance(body, dict) else None
+
+        # Step 1: Parse and validate request using discriminated union
+        try:
             json_rpc = A2ARequest.validate_python(body)
+        except ValidationError as e:
+            if any(err["type"] == "union_tag_invalid" for err in e.errors()):
+                error = MethodNotFoundError(data=body.get("method"))
+            else:
+                error = InvalidRequestError(data=e.errors(include_url=False, include_context=False))
+            return JSONRPCResponse(id=request_id, error=error)
 
-            # Step 3: If it's a send-task request, call the task manager to handle it
+        # Step 2: Call the task manager method for this request type
+        try:
             if isinstance(json_rpc, SendTaskRequest):
-                result = await self.task_manager.on_send_task(json_rpc)
+                if self.workers:
+                    # Background mode: store + queue the task and answer immediately
+                    return await self.task_manager.on_send_task_async(json_rpc)
+                async with self.admission.admit():
+                    # Runs as its own asyncio.Task so tasks/cancel can interrupt it
+                    return await self.task_manager.run_send_task(json_rpc)
+            elif isinstance(json_rpc, GetTaskRequest):
+                return await self.task_manager.on_get_task(json_rpc)
+            elif isinstance(json_rpc, CancelTaskRequest):
+                return await self.task_manager.on_cancel_task(json_rpc)
+            elif isinstance(json_rpc, SendTaskStreamingRequest):
+                if in_batch:
+                    return JSONRPCResponse(
+                        id=request_id,
+                        error=InvalidRequestError(message="tasks/sendSubscribe can't be batched")
+                    )
+                # Admit before streaming starts, so "busy" is a normal JSON-RPC error.
+                # The slot is freed by the AdmittedStreamingResponse (_create_response)
+                await self.admission.acquire()
+                # Async generator: events are sent to the client as they're produced
+                return self.task_manager.run_send_task_subscribe(json_rpc)
             else:
                 raise ValueError(f"Unsupported A2A method: {type(json_rpc)}")
 
-            # Step 4: Convert the result into a proper JSON response
-            return self._create_response(result)
+        except ServerBusy as e:
+            logger.warning(f"Rejected request {request_id}: {e}")
+            return JSONRPCResponse(id=request_id, error=ServerBusyError(data=str(e)))
 
         except Exception as e:
             logger.error(f"Exception: {e}")
             # Return a JSON-RPC compliant error response if anything fails
-            return JSONResponse(
-                JSONRPCResponse(id=None, error=InternalError(message=str(e))).model_dump(),
-                status_code=200  # Always return 200 for JSON-RPC errors
-            )
+            return JSONRPCResponse(id=request_id, error=InternalError(message=str(e)))
 
     # -----------------------------------------------------------------------------
-    # 🧾 _create_response(): Converts result object to JSONResponse
+    # 🧾 _create_response(): Converts result object to an HTTP response
     # -----------------------------------------------------------------------------
     def _create_response(self, result):
         """
         Converts a JSONRPCResponse object into a JSON HTTP response.
 
         Args:
-            result: The response object (must be a JSONRPCResponse)
+            result: The response object (a JSONRPCResponse, or an async
+                iterable of them for streaming requests)
 
         Returns:
-            JSONResponse: Starlette-compatible HTTP response with JSON body
+            A2AJSONResponse: Starlette-compatible HTTP response with JSON body, or
+            StreamingResponse: a "text/event-stream" of Server-Sent Events
         """
-        if isinstance(result, JSONRPCResponse):
-            # jsonable_encoder automatically handles datetime and UUID
-            return JSONResponse(content=jsonable_encoder(result.model_dump(exclude_none=True)))
+        if isinstance(result, AsyncIterable):
+            # Only admitted tasks/sendSubscribe requests stream; the response
+            # gives their slot back when it's done
+            return AdmittedStreamingResponse(
+                self._sse_events(result),
+                release=self.admission.release,
+                media_type="text/event-stream"
+            )
+        elif isinstance(result, JSONRPCResponse):
+            # Serialized once, straight from the model to bytes (datetimes included)
+            return A2AJSONResponse(result)
         else:
             raise ValueError("Invalid response type")
+
+    # -----------------------------------------------------------------------------
+    # 📡 _sse_events(): Format streamed responses as Server-Sent Events
+    # -----------------------------------------------------------------------------
+    async def _sse_events(self, results: AsyncIterable[JSONRPCResponse]):
+        """
+        Wraps each streamed JSONRPCResponse in an SSE "data:" frame.
+
+        If the agent fails mid-stream, a final JSON-RPC error event is sent
+        instead of silently dropping the connection.
+
+        Args:
+            results: Async iterable of JSONRPCResponse objects
+
+        Yields:
+            bytes: One SSE frame per response
+        """
+        try:
+            async for item in results:
+                yield b"data: " + dumps(item) + b"\n\n"
+        except Exception as e:
+            logger.error(f"Streaming exception: {e}")
+            error = JSONRPCResponse(id=None, error=InternalError(message=str(e)))
+            yield b"data: " + dumps(error) + b"\n\n"
@@ -0,0 +1,405 @@
+# =============================================================================
+# server/sqlite_task_store.py
+# =============================================================================
+# 🎯 Purpose:
+# A TaskStore that persists tasks to a SQLite database, so an agent can be
+# restarted (or several agent processes can share one file) without losing
+# tasks and their history. No external service is needed.
+#
+# ✅ How it stays fast:
+# - WAL journal mode: readers never block the writer and vice versa
+# - Hot cache: recently used tasks stay in memory as Task objects
+# - Write-behind batching: changed tasks are collected and written together
+#   by a background flusher, in one transaction, with `executemany`
+# - Prepared statements: every query is a fixed SQL string, so sqlite3's
+#   per-connection statement cache compiles it only once
+# - The writer connection runs in a worker thread (asyncio.to_thread), so
+#   writes never block the event loop
+#
+# ❗ Trade-offs:
+# - A change reaches the disk up to `flush_interval` seconds after it was
+#   made; stop() flushes everything on a clean shutdown
+# - When several processes share the file, each task should be handled by
+#   one process at a time (the last write of a task wins). Set `cache_ttl`
+#   so cached tasks are re-read after other processes may have changed them
+# - The mapping interface is synchronous, so reads that miss the cache (and
+#   `in`, len(), iteration) query the database on the event loop. Lookups
+#   are one primary-key probe and len() is one COUNT(*); only iteration
+#   scans every ID, and nothing on the request path iterates the store
+# - Reads refresh a finished task's expiry like writes do (same as
+#   BoundedTaskStore), but reads are batched: the flusher stamps every task
+#   read since the last flush with one `executemany`, so a read never waits
+#   for the disk
+# - Unfinished (submitted / working) tasks expire after `ttl` seconds
+#   without a write, like in BoundedTaskStore: after a crash or restart
+#   nothing runs them any more
+# =============================================================================
+
+import asyncio                                   # Background flusher + to_thread
+import json                                      # Pending IDs as one query parameter
+import logging                                   # Logs flush failures
+import sqlite3                                   # Standard-library SQLite driver
+import time                                      # Timestamps for TTL and cache age
+from collections import OrderedDict              # Hot cache in LRU order
+from typing import Iterator
+
+from models.task import Task
+from server.task_store import TaskStore, ACTIVE_STATES, FINAL_STATES
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# 📜 SQL (fixed strings, so each is prepared once per connection)
+# -----------------------------------------------------------------------------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id      TEXT PRIMARY KEY,
+    state   TEXT NOT NULL,
+    data    TEXT NOT NULL,
+    updated REAL NOT NULL    -- Last write (or read, if finished); the TTL counts from here
+);
+CREATE INDEX IF NOT EXISTS tasks_updated ON tasks (updated);
+"""
+
+UPSERT_SQL = (
+    "INSERT INTO tasks (id, state, data, updated) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET "
+    "state = excluded.state, data = excluded.data, updated = excluded.updated"
+)
+DELETE_SQL = "DELETE FROM tasks WHERE id = ?"
+TOUCH_SQL = "UPDATE tasks SET updated = ? WHERE id = ?"
+SELECT_SQL = "SELECT data FROM tasks WHERE id = ?"
+EXISTS_SQL = "SELECT 1 FROM tasks WHERE id = ?"
+SELECT_IDS_SQL = "SELECT id FROM tasks"
+COUNT_SQL = "SELECT COUNT(*) FROM tasks"
+# How many of the given IDs (a JSON array, so any number fits in one parameter) exist
+COUNT_IDS_SQL = "SELECT COUNT(*) FROM tasks WHERE id IN (SELECT value FROM json_each(?))"
+
+# Finished or unfinished tasks older than a cutoff (the TTL sweep selects,
+# then deletes them). Only finished tasks get their time refreshed by reads,
+# so for unfinished ones the cutoff applies to their last write.
+FINAL_STATE_VALUES = tuple(state.value for state in FINAL_STATES)
+ACTIVE_STATE_VALUES = tuple(state.value for state in ACTIVE_STATES)
+EXPIRING_STATE_VALUES = FINAL_STATE_VALUES + ACTIVE_STATE_VALUES
+_EXPIRED_WHERE = f"updated < ? AND state IN ({', '.join('?' for _ in EXPIRING_STATE_VALUES)})"
+SELECT_EXPIRED_SQL = f"SELECT id, state FROM tasks WHERE {_EXPIRED_WHERE}"
+EXPIRE_SQL = f"DELETE FROM tasks WHERE {_EXPIRED_WHERE}"
+
+
+# -----------------------------------------------------------------------------
+# SqliteTaskStore
+# -----------------------------------------------------------------------------
+class SqliteTaskStore(TaskStore):
+    """
+    💽 Task store backed by a SQLite database in WAL mode.
+
+    Attributes:
+        path (str): Database file (created if missing)
+        cache_size (int): Max tasks kept in the hot cache (0 = unlimited)
+        cache_ttl (float | None): Seconds before a cached task is re-read from
+            disk (None = trust the cache; fine for a single process)
+        ttl (float | None): Seconds a finished task is kept after its last
+            use, read or write, and an unfinished one after its last write
+            (None = forever)
+        flush_interval (float): Max seconds a change waits before being written
+        batch_size (int): Flush early once this many tasks are waiting
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cache_size: int = 10000,
+        cache_ttl: float | None = None,
+        ttl: float | None = None,
+        flush_interval: float = 0.05,
+        batch_size: int = 500,
+        sweep_interval: float = 60.0
+    ):
+        self.path = path
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl or None
+        self.ttl = ttl or None
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.sweep_interval = sweep_interval
+
+        # ✍️ Writer connection: only used from the flusher's worker thread
+        self._writer = sqlite3.connect(path, check_same_thread=False)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")   # Safe with WAL, far fewer fsyncs
+        self._writer.executescript(SCHEMA)
+        self._writer.commit()
+
+        # 📖 Reader connection: used on the event loop for cache misses
+        self._reader = sqlite3.connect(path)
+        self._reader.execute("PRAGMA journal_mode=WAL")
+
+        # task ID -> (task, time it was cached), least recently used first
+        self._cache: OrderedDict[str, tuple[Task, float]] = OrderedDict()
+
+        # Changes waiting for the flusher
+        self._dirty: dict[str, Task] = {}    # Tasks to write
+        self._deleted: set[str] = set()      # Task IDs to delete
+        self._touched: set[str] = set()      # Task IDs read since the last flush
+
+        self._wake = asyncio.Event()         # Set to flush before the interval ends
+        self._flush_lock = asyncio.Lock()    # One flush at a time
+        self._flusher: asyncio.Task | None = None
+        self._writing: asyncio.Future | None = None    # Last call run on the writer thread
+
+        # 📊 Counters
+        self.flushes = 0        # Transactions written
+        self.rows_written = 0   # Tasks written (upserts + deletes)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.expired = 0
+
+    # -------------------------------------------------------------------------
+    # Mapping interface (blocking: a cache miss queries the reader connection)
+    # -------------------------------------------------------------------------
+    def __getitem__(self, task_id: str) -> Task:
+        if task_id in self._dirty:
+            # Not on disk yet (or newer than what's there)
+            self.cache_hits += 1
+            return self._dirty[task_id]
+        if task_id in self._deleted:
+            raise KeyError(task_id)
+
+        entry = self._cache.get(task_id)
+        if entry is not None and (
+            self.cache_ttl is None or time.monotonic() - entry[1] < self.cache_ttl
+        ):
+            self.cache_hits += 1
+            self._cache.move_to_end(task_id)
+            self._touch(task_id, entry[0])
+            return entry[0]
+
+        # Cache miss: one indexed primary-key lookup
+        self.cache_misses += 1
+        row = self._reader.execute(SELECT_SQL, (task_id,)).fetchone()
+        if row is None:
+            self._cache.pop(task_id, None)
+            raise KeyError(task_id)
+
+        task = Task.model_validate_json(row[0])
+        self._cache_put(task_id, task)
+        self._touch(task_id, task)
+        return task
+
+    def __setitem__(self, task_id: str, task: Task):
+        self._cache_put(task_id, task)
+        self._deleted.discard(task_id)
+        self._dirty[task_id] = task
+        if len(self._dirty) >= self.batch_size:
+            self._wake.set()
+
+    def __delitem__(self, task_id: str):
+        if task_id not in self:
+            raise KeyError(task_id)
+        self._cache.pop(task_id, None)
+        self._dirty.pop(task_id, None)
+        self._deleted.add(task_id)
+
+    def __contains__(self, task_id) -> bool:
+        if task_id in self._dirty or task_id in self._cache:
+            return True
+        if task_id in self._deleted:
+            return False
+        # The primary-key index answers this without reading the task's data
+        return self._reader.execute(EXISTS_SQL, (task_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Scans every stored ID: meant for tools and tests, not hot paths."""
+        stored = {row[0] for row in self._reader.execute(SELECT_IDS_SQL)}
+        return iter((stored | set(self._dirty)) - self._deleted)
+
+    def __len__(self) -> int:
+        # Tasks on disk, plus unsaved new ones, minus pending deletes. _dirty
+        # and _deleted never share an ID, and both are at most a few batches
+        count = self._reader.execute(COUNT_SQL).fetchone()[0] + len(self._dirty)
+        pending = [*self._dirty, *self._deleted]
+        if pending:
+            count -= self._reader.execute(COUNT_IDS_SQL, (json.dumps(pending),)).fetchone()[0]
+        return count
+
+    def _touch(self, task_id: str, task: Task):
+        """
+        Remember a read of a finished task, so the next flush restarts its
+        TTL. Unfinished tasks aren't touched: polling a task whose agent is
+        gone mustn't keep it alive.
+        """
+        if self.ttl is not None and task.status.state in FINAL_STATES:
+            self._touched.add(task_id)
+
+    def _cache_put(self, task_id: str, task: Task):
+        """Add or refresh a cache entry, evicting the least recently used ones."""
+        self._cache[task_id] = (task, time.monotonic())
+        self._cache.move_to_end(task_id)
+        if self.cache_size:
+            while len(self._cache) > self.cache_size:
+                # Safe even for unsaved tasks: those are still held in _dirty
+                self._cache.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    # 💾 flush: Write all pending changes in one transaction
+    # -------------------------------------------------------------------------
+    async def flush(self):
+        """Write every changed or deleted task (and every read time) to disk now."""
+        async with self._flush_lock:
+            if not self._dirty and not self._deleted and not self._touched:
+                return
+
+            # Serialize on the event loop, so no task changes while it's encoded
+            now = time.time()
+            dirty, self._dirty = self._dirty, {}
+            deleted, self._deleted = self._deleted, set()
+            touched, self._touched = self._touched, set()
+            rows = [
+                (task_id, _state_value(task), task.model_dump_json(), now)
+                for task_id, task in dirty.items()
+            ]
+            # Written tasks get a fresh timestamp anyway; deleted ones are gone
+            touches = [(now, task_id) for task_id in touched - dirty.keys() - deleted]
+
+            try:
+                await self._in_writer(
+                    self._write, rows, [(task_id,) for task_id in deleted], touches
+                )
+            except BaseException:
+                # Failed, or we were cancelled (e.g., by stop()) while the thread
+                # still runs: put the changes back (unless they were changed again
+                # meanwhile). Writing them a second time is harmless, all three
+                # statements are idempotent
+                for task_id, task in dirty.items():
+                    if task_id not in self._deleted:
+                        self._dirty.setdefault(task_id, task)
+                for task_id in deleted:
+                    if task_id not in self._dirty:
+                        self._deleted.add(task_id)
+                self._touched |= touched
+                raise
+
+            self.flushes += 1
+            self.rows_written += len(rows) + len(deleted)
+
+    async def _in_writer(self, func, *args):
+        """
+        Run `func(*args)` in a worker thread that uses the writer connection.
+
+        The thread can't be interrupted, so the call is shielded: if the caller
+        is cancelled, the call still finishes, and stop() waits for it before
+        closing the connection.
+        """
+        self._writing = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        return await asyncio.shield(self._writing)
+
+    def _write(self, rows: list[tuple], deletes: list[tuple], touches: list[tuple]):
+        """Runs in a worker thread: one transaction for the whole batch."""
+        with self._writer:    # Commits on success, rolls back on error
+            if rows:
+                self._writer.executemany(UPSERT_SQL, rows)
+            if touches:
+                self._writer.executemany(TOUCH_SQL, touches)
+            if deletes:
+                self._writer.executemany(DELETE_SQL, deletes)
+
+    # -------------------------------------------------------------------------
+    # 🧹 expire: Delete tasks not used (unfinished: not updated) for ttl seconds
+    # -------------------------------------------------------------------------
+    async def expire(self) -> int:
+        """
+        Returns:
+            int: Number of tasks deleted from disk
+        """
+        if self.ttl is None:
+            return 0
+
+        # Record pending reads first, so a task just read isn't dropped
+        await self.flush()
+        cutoff = time.time() - self.ttl
+        dropped = await self._in_writer(self._expire, cutoff)
+
+        # Forget cached copies of tasks that are now gone from disk
+        for task_id in dropped:
+            if task_id not in self._dirty:
+                self._cache.pop(task_id, None)
+
+        self.expired += len(dropped)
+        return len(dropped)
+
+    def _expire(self, cutoff: float) -> list[str]:
+        """Runs in a worker thread: returns the IDs of the deleted tasks."""
+        params = (cutoff, *EXPIRING_STATE_VALUES)
+        with self._writer:
+            rows = self._writer.execute(SELECT_EXPIRED_SQL, params).fetchall()
+            self._writer.execute(EXPIRE_SQL, params)
+        for task_id, state in rows:
+            if state in ACTIVE_STATE_VALUES:
+                logger.warning(f"Task store: dropping task {task_id}, unfinished and not updated for {self.ttl:.0f}s")
+        return [task_id for task_id, _ in rows]
+
+    # -------------------------------------------------------------------------
+    # ▶️ start / ⏹️ stop: Run the background flusher
+    # -------------------------------------------------------------------------
+    async def start(self):
+        """Start the background flusher (and TTL sweeps, if a ttl is set)."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop(), name="task-store-flusher")
+
+    async def stop(self):
+        """Stop the flusher, write everything still pending and close the database."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._writing is not None:
+            # A write the flusher started may still be running in its thread
+            await asyncio.gather(self._writing, return_exceptions=True)
+            self._writing = None
+        await self.flush()
+        self._reader.close()
+        self._writer.close()
+
+    async def _flush_loop(self):
+        last_sweep = time.monotonic()
+        while True:
+            try:
+                async with asyncio.timeout(self.flush_interval):
+                    await self._wake.wait()
+            except TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await self.flush()
+                if self.ttl is not None and time.monotonic() - last_sweep >= self.sweep_interval:
+                    last_sweep = time.monotonic()
+                    await self.expire()
+            except Exception as e:
+                logger.error(f"Task store flush failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # 📊 stats: Cache, write-behind and database gauges
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        page_count = self._reader.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self._reader.execute("PRAGMA page_size").fetchone()[0]
+        return {
+            "backend": "sqlite",
+            "tasks": len(self),
+            "cached": len(self._cache),
+            "cache_size": self.cache_size,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "pending_writes": len(self._dirty) + len(self._deleted) + len(self._touched),
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "expired": self.expired,
+            "db_bytes": page_count * page_size,
+        }
+
+
+def _state_value(task: Task) -> str:
+    """The task state as a plain string (it may be stored as a TaskState enum)."""
+    return getattr(task.status.state, "value", task.status.state)
@@ -8,10 +8,32 @@
 # - A base abstract class `TaskManager` that outlines required methods
 # - A simple `InMemoryTaskManager` that keeps tasks temporarily in memory
 #
+# ✅ Streaming:
+# - `on_send_task_subscribe()` yields status/artifact events for SSE clients
+#
+# ✅ Background execution (opt-in):
+# - `on_send_task_async()` stores the task as "submitted" and returns at once
+# - A pool of worker coroutines (see `start()`) runs the agent later;
+#   clients poll the result with `tasks/get`
+#
+# ✅ Concurrency:
+# - Writes are guarded by striped locks (one of LOCK_STRIPES locks per task ID),
+#   so different tasks never wait on each other
+# - `tasks/get` reads without any lock
+#
+# ✅ Cancellation:
+# - Every running agent call is an asyncio.Task tracked by task ID, so
+#   `tasks/cancel` interrupts the LLM call and any pending child-agent calls
+#
+# ✅ Storage:
+# - Tasks live in a pluggable TaskStore (see server/task_store.py):
+#   - BoundedTaskStore (default): RAM only, with LRU eviction and idle TTL
+#   - SqliteTaskStore: persisted to a SQLite file, survives restarts
+# - After changing a task, always assign it back (`self.tasks[task.id] = task`)
+#   so persistent stores know it must be saved
+#
 # ❌ Does not include:
-# - Cancel task functionality
-# - Push notifications or real-time updates
-# - Persistent storage (like a database)
+# - Push notifications
 # =============================================================================
 
 
@@ -21,7 +43,14 @@
 
 from abc import ABC, abstractmethod        # Lets us define abstract base classes (like an interface)
 from typing import Dict                    # Dict is a dictionary type for storing key-value pairs
+from typing import AsyncIterable           # Type hint for async generators (used by streaming)
 import asyncio                             # Used here for locks to safely handle concurrency (async operations)
+import logging                             # Used to log failures of background tasks
+
+logger = logging.getLogger(__name__)
+
+# Number of locks shared by all task IDs (tasks are spread over them by hash)
+LOCK_STRIPES = 64
 
 
 # -----------------------------------------------------------------------------
@@ -30,12 +59,26 @@ import asyncio                             # Used here for locks to safely handl
 
 from models.request import (
     SendTaskRequest, SendTaskResponse,    # For sending tasks to the agent
-    GetTaskRequest, GetTaskResponse       # For querying task info from the agent
+    SendTaskStreamingRequest,             # For sending tasks and streaming updates back
+    SendTaskStreamingResponse,            # One streamed event (wrapped as JSON-RPC)
+    GetTaskRequest, GetTaskResponse,      # For querying task info from the agent
+    CancelTaskRequest, CancelTaskResponse # For stopping a queued or running task
 )
 
+from models.json_rpc import TaskNotFoundError       # Error returned for unknown task IDs
+from models.json_rpc import TaskNotCancelableError  # Error returned for finished tasks
+
+from server.admission import ServerBusy        # Raised when the background queue is full
+from server.task_store import TaskStore, BoundedTaskStore  # Pluggable task storage
+from server.task_store import ACTIVE_STATES    # States of tasks that haven't finished
+from server.task_store import FINAL_STATES     # States of tasks that are done
+
 from models.task import (
     Task, TaskSendParams, TaskQueryParams,  # Task and input models
-    TaskStatus, TaskState, Message          # Task metadata and history objects
+    TaskStatus, TaskState, Message,         # Task metadata and history objects
+    TextPart, Artifact,                     # Message content and produced output
+    TaskStatusUpdateEvent,                  # Streamed when the task state changes
+    TaskArtifactUpdateEvent                 # Streamed when the agent produces output
 )
 
 
@@ -47,9 +90,11 @@ class TaskManager(ABC):
     """
     🔧 This is a base interface class.
 
-    All Task Managers must implement these two async methods:
+    All Task Managers must implement these async methods:
     - on_send_task(): to receive and process new tasks
+    - on_send_task_subscribe(): to process a task while streaming its progress
     - on_get_task(): to fetch the current status or conversation history of a task
+    - on_cancel_task(): to stop a task that is queued or still running
 
     This makes sure all implementations follow a consistent structure.
     """
@@ -59,11 +104,39 @@ class TaskManager(ABC):
         """📥 This method will handle new incoming tasks."""
         pass
 
+    @abstractmethod
+    def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """📡 This method will handle a new task and yield its progress events."""
+        pass
+
     @abstractmethod
     async def on_get_task(self, request: GetTaskRequest) -> GetTaskResponse:
         """📤 This method will return task details by task ID."""
         pass
 
+    @abstractmethod
+    async def on_cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
+        """🛑 This method will cancel a queued or running task by task ID."""
+        pass
+
+    async def start(self, workers: int = 0, max_pending: int = 0):
+        """▶️ Called by the server on startup. Override to start background work."""
+        pass
+
+    async def stop(self):
+        """⏹️ Called by the server on shutdown. Override to stop background work."""
+        pass
+
+    def store_stats(self) -> dict:
+        """📊 Gauges about stored tasks, reported by GET /metrics. Override to add some."""
+        return {}
+
+    def agent_stats(self) -> dict:
+        """📊 Counters of the agent behind this manager, reported by GET /metrics."""
+        return {}
+
 
 # -----------------------------------------------------------------------------
 # 🧠 InMemoryTaskManager
@@ -81,9 +154,35 @@ class InMemoryTaskManager(TaskManager):
     ❗ Not for production: Data is lost when the app stops or restarts.
     """
 
-    def __init__(self):
-        self.tasks: Dict[str, Task] = {}   # 🗃️ Dictionary where key = task ID, value = Task object
-        self.lock = asyncio.Lock()         # 🔐 Async lock to ensure two requests don't modify data at the same time
+    def __init__(self, store: TaskStore | None = None):
+        """
+        Args:
+            store: Where tasks are kept (default: in RAM, without limits)
+        """
+        # 🗃️ Dict-like store where key = task ID, value = Task object
+        self.tasks: TaskStore = store if store is not None else BoundedTaskStore()
+        # 🔐 Striped async locks: two requests for the same task never modify it
+        # at the same time, while requests for different tasks rarely share a lock
+        self._locks = [asyncio.Lock() for _ in range(LOCK_STRIPES)]
+
+        # 🏭 Background execution (only used after start(workers=N) with N > 0)
+        self.task_queue: asyncio.Queue | None = None   # Requests waiting for a worker
+        self._workers: list[asyncio.Task] = []         # The running worker coroutines
+
+        # 🛑 asyncio.Task currently running the agent for each task ID (for tasks/cancel)
+        self.running: Dict[str, asyncio.Task] = {}
+
+    # -------------------------------------------------------------------------
+    # 🔐 task_lock: The lock guarding one task
+    # -------------------------------------------------------------------------
+    def task_lock(self, task_id: str) -> asyncio.Lock:
+        """
+        Return the lock for a task ID. Hold it while changing that task:
+
+            async with self.task_lock(task.id):
+                ...
+        """
+        return self._locks[hash(task_id) % LOCK_STRIPES]
 
     # -------------------------------------------------------------------------
     # 💾 upsert_task: Create or update a task in memory
@@ -98,7 +197,7 @@ class InMemoryTaskManager(TaskManager):
         Returns:
             Task – the newly created or updated task
         """
-        async with self.lock:
+        async with self.task_lock(params.id):
             task = self.tasks.get(params.id)  # Try to find an existing task with this ID
 
             if task is None:
@@ -109,9 +208,58 @@ class InMemoryTaskManager(TaskManager):
                     history=[params.message]
                 )
                 self.tasks[params.id] = task
+            elif task.history and task.history[-1] == params.message:
+                # Already recorded by on_send_task_async(); a worker is now
+                # replaying the same request, so don't store the message twice.
+                # Compared by value: a store may have reloaded the task from
+                # disk since, so it's an equal copy, not the same object
+                pass
             else:
                 # If task exists, add the new message to its history
                 task.history.append(params.message)
+                if task.status.state in FINAL_STATES:
+                    # A new turn reopens a finished task (update_store() won't
+                    # change a finished one)
+                    task.status = TaskStatus(state=TaskState.SUBMITTED)
+                self.tasks[params.id] = task    # Save the change
+
+            return task
+
+    # -------------------------------------------------------------------------
+    # ✏️ update_store: Change a task's status and record the agent's reply
+    # -------------------------------------------------------------------------
+    async def update_store(
+        self, task_id: str, status: TaskStatus, message: Message | None = None
+    ) -> Task:
+        """
+        Set the status of a stored task and optionally append a message to its history.
+
+        Args:
+            task_id: ID of the task to update
+            status: The new TaskStatus
+            message: Optional message (usually the agent's reply) to append
+
+        Returns:
+            Task – the updated task, or the task unchanged if it had already
+            finished (e.g., it was canceled while the agent was answering)
+
+        Raises:
+            ValueError: if no task with this ID exists
+        """
+        async with self.task_lock(task_id):
+            task = self.tasks.get(task_id)
+            if task is None:
+                raise ValueError(f"Task {task_id} not found")
+            if task.status.state in FINAL_STATES:
+                # A late result mustn't overwrite "canceled": the client was
+                # already told. Only a new message (upsert_task) reopens a task
+                logger.info(f"Task {task_id} has already finished; update ignored")
+                return task
+
+            task.status = status
+            if message is not None:
+                task.history.append(message)
+            self.tasks[task_id] = task    # Save the change
 
             return task
 
@@ -128,6 +276,363 @@ class InMemoryTaskManager(TaskManager):
         """
         raise NotImplementedError("on_send_task() must be implemented in subclass")
 
+    # -------------------------------------------------------------------------
+    # 📡 on_send_task_subscribe: Default streaming support for every agent
+    # -------------------------------------------------------------------------
+    async def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Fallback for agents that can't produce partial output.
+
+        Runs the normal `on_send_task()` and streams its result as a single
+        artifact followed by the final status. Agents that can stream for real
+        override this and use `stream_agent_updates()` instead.
+
+        Yields:
+            SendTaskStreamingResponse – one JSON-RPC message per SSE event
+        """
+        response = await self.on_send_task(
+            SendTaskRequest(id=request.id, params=request.params)
+        )
+
+        if response.error:
+            yield SendTaskStreamingResponse(id=request.id, error=response.error)
+            return
+
+        task = response.result
+        if task.history and task.history[-1].role == "agent":
+            yield SendTaskStreamingResponse(
+                id=request.id,
+                result=TaskArtifactUpdateEvent(
+                    id=task.id,
+                    artifact=Artifact(parts=task.history[-1].parts, lastChunk=True)
+                )
+            )
+        yield SendTaskStreamingResponse(
+            id=request.id,
+            result=TaskStatusUpdateEvent(id=task.id, status=task.status, final=True)
+        )
+
+    # -------------------------------------------------------------------------
+    # 🌀 stream_agent_updates: Turn an agent's stream() into A2A events
+    # -------------------------------------------------------------------------
+    async def stream_agent_updates(
+        self, request: SendTaskStreamingRequest, updates: AsyncIterable[dict]
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Store the task, then convert each item yielded by an agent's `stream()`
+        into streaming events.
+
+        Agents yield dicts shaped like:
+            {"is_task_complete": False, "content": "partial text"}
+            {"is_task_complete": True,  "content": "final reply"}
+
+        Partial items become "working" status events, and the final item is
+        saved to the task history and sent as an artifact + final status.
+
+        Args:
+            request: The incoming SendTaskStreamingRequest
+            updates: Async iterable of dicts produced by the agent
+
+        Yields:
+            SendTaskStreamingResponse – one JSON-RPC message per SSE event
+        """
+        task = await self.upsert_task(request.params)
+        status = TaskStatus(state=TaskState.WORKING)
+        await self.update_store(task.id, status)
+        yield SendTaskStreamingResponse(
+            id=request.id,
+            result=TaskStatusUpdateEvent(id=task.id, status=status)
+        )
+
+        async for item in updates:
+            parts = [TextPart(text=item["content"])]
+
+            if not item["is_task_complete"]:
+                # Partial output: tell the client we're still working on it
+                yield SendTaskStreamingResponse(
+                    id=request.id,
+                    result=TaskStatusUpdateEvent(
+                        id=task.id,
+                        status=TaskStatus(
+                            state=TaskState.WORKING,
+                            message=Message(role="agent", parts=parts)
+                        )
+                    )
+                )
+                continue
+
+            # Final output: record it, send it as an artifact and close the stream
+            status = TaskStatus(state=TaskState.COMPLETED)
+            await self.update_store(task.id, status, Message(role="agent", parts=parts))
+            yield SendTaskStreamingResponse(
+                id=request.id,
+                result=TaskArtifactUpdateEvent(
+                    id=task.id, artifact=Artifact(parts=parts, lastChunk=True)
+                )
+            )
+            yield SendTaskStreamingResponse(
+                id=request.id,
+                result=TaskStatusUpdateEvent(id=task.id, status=status, final=True)
+            )
+            return
+
+        # The agent stopped without a final answer
+        status = TaskStatus(state=TaskState.FAILED)
+        await self.update_store(task.id, status)
+        yield SendTaskStreamingResponse(
+            id=request.id,
+            result=TaskStatusUpdateEvent(id=task.id, status=status, final=True)
+        )
+
+    # -------------------------------------------------------------------------
+    # ▶️ start / ⏹️ stop: Manage the background worker pool
+    # -------------------------------------------------------------------------
+    async def start(self, workers: int = 0, max_pending: int = 0):
+        """
+        Start the task store's TTL sweeper and `workers` coroutines that run
+        queued tasks in the background.
+
+        Args:
+            workers: Number of worker coroutines (0 = run every task inline)
+            max_pending: Max tasks waiting for a worker (0 = unbounded)
+        """
+        await self.tasks.start()
+
+        if workers <= 0:
+            return
+
+        self.task_queue = asyncio.Queue(maxsize=max_pending)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"task-worker-{i}")
+            for i in range(workers)
+        ]
+
+    async def stop(self):
+        """Cancel the worker coroutines and the sweeper, and wait for them to finish."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.tasks.stop()
+
+    def store_stats(self) -> dict:
+        """Task count, memory gauges and eviction counters of the task store."""
+        return self.tasks.stats()
+
+    # -------------------------------------------------------------------------
+    # 📨 on_send_task_async: Accept a task now, run it in the background
+    # -------------------------------------------------------------------------
+    async def on_send_task_async(self, request: SendTaskRequest) -> SendTaskResponse:
+        """
+        Store the task as "submitted", queue it for a worker and return right away.
+        The client follows up with `tasks/get` until the task is finished.
+
+        Args:
+            request: The incoming SendTaskRequest
+
+        Returns:
+            SendTaskResponse – the task in its "submitted" state
+
+        Raises:
+            ServerBusy: if the background queue is full
+        """
+        if self.task_queue is None:
+            raise RuntimeError("Background workers are not running; call start(workers=N) first")
+        if self.task_queue.full():
+            raise ServerBusy(f"Server busy: {self.task_queue.qsize()} tasks already pending")
+
+        task = await self.upsert_task(request.params)
+        task = await self.update_store(task.id, TaskStatus(state=TaskState.SUBMITTED))
+        self.task_queue.put_nowait(request)
+
+        return SendTaskResponse(id=request.id, result=task)
+
+    # -------------------------------------------------------------------------
+    # 🏭 _worker: Drain the queue, running each task through run_send_task()
+    # -------------------------------------------------------------------------
+    async def _worker(self):
+        """
+        Worker loop: takes queued requests one by one and runs the agent.
+        Errors are stored on the task as "failed" instead of stopping the worker.
+        """
+        while True:
+            request = await self.task_queue.get()
+            task_id = request.params.id
+            try:
+                async with self.task_lock(task_id):
+                    task = self.tasks.get(task_id)
+                    if task is None or task.status.state != TaskState.SUBMITTED:
+                        continue    # Removed or canceled while it was waiting
+                    task.status = TaskStatus(state=TaskState.WORKING)
+                    self.tasks[task_id] = task
+
+                response = await self.run_send_task(request)
+
+                if response.error:
+                    await self.update_store(task_id, self._failed_status(response.error.message))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background task {task_id} failed: {e}")
+                await self.update_store(task_id, self._failed_status(str(e)))
+            finally:
+                self.task_queue.task_done()
+
+    async def _settle(self, task_id: str, status: TaskStatus):
+        """
+        Give a task that stopped without finishing (the agent raised, or its
+        caller went away) a final status, so it doesn't stay "submitted" /
+        "working" forever: tasks in those states are never evicted.
+        Tasks that already finished keep their status.
+        """
+        async with self.task_lock(task_id):
+            task = self.tasks.get(task_id)
+            if task is not None and task.status.state in ACTIVE_STATES:
+                task.status = status
+                self.tasks[task_id] = task
+
+    def _failed_status(self, reason: str) -> TaskStatus:
+        """Build a "failed" status that carries the error text for the client."""
+        return TaskStatus(
+            state=TaskState.FAILED,
+            message=Message(role="agent", parts=[TextPart(text=reason)])
+        )
+
+    # -------------------------------------------------------------------------
+    # 🏃 run_send_task: Run on_send_task() as a cancellable asyncio.Task
+    # -------------------------------------------------------------------------
+    async def run_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+        """
+        Run `on_send_task()` in its own asyncio.Task, registered under the task ID
+        so `on_cancel_task()` can interrupt it. The server and the background
+        workers call this instead of `on_send_task()` directly.
+
+        Args:
+            request: The incoming SendTaskRequest
+
+        Returns:
+            SendTaskResponse – the agent's result, or the task in its
+            "canceled" state if it was canceled while running
+        """
+        task_id = request.params.id
+        runner = asyncio.create_task(self.on_send_task(request), name=f"task-{task_id}")
+        self.running[task_id] = runner
+        try:
+            return await runner
+        except asyncio.CancelledError:
+            # Canceled through tasks/cancel (not because our caller is going away):
+            # answer the request with the canceled task instead of failing it
+            if runner.cancelled() and not asyncio.current_task().cancelling():
+                return SendTaskResponse(id=request.id, result=self.tasks[task_id])
+            # Our caller is going away (client disconnected, server shutting down)
+            await self._settle(task_id, TaskStatus(state=TaskState.CANCELED))
+            raise
+        except Exception as e:
+            await self._settle(task_id, self._failed_status(str(e)))
+            raise
+        finally:
+            if self.running.get(task_id) is runner:
+                del self.running[task_id]
+
+    # -------------------------------------------------------------------------
+    # 🏃 run_send_task_subscribe: Streaming version of run_send_task()
+    # -------------------------------------------------------------------------
+    async def run_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Pump `on_send_task_subscribe()` from its own asyncio.Task (registered like
+        in `run_send_task()`) and pass its events through a queue.
+
+        If the task is canceled, the stream ends with a final "canceled" status
+        event. If the client goes away, the agent is stopped as well and the
+        task is marked "canceled"; if the agent raises, it's marked "failed".
+
+        Yields:
+            SendTaskStreamingResponse – one JSON-RPC message per SSE event
+        """
+        task_id = request.params.id
+        events: asyncio.Queue = asyncio.Queue()
+        done = object()    # Marks the end of the stream
+
+        async def pump():
+            try:
+                async for event in self.on_send_task_subscribe(request):
+                    await events.put(event)
+            except Exception as e:
+                await events.put(e)
+            finally:
+                events.put_nowait(done)
+
+        runner = asyncio.create_task(pump(), name=f"task-{task_id}")
+        self.running[task_id] = runner
+        finished = False
+        try:
+            while (event := await events.get()) is not done:
+                if isinstance(event, Exception):
+                    finished = True
+                    await self._settle(task_id, self._failed_status(str(event)))
+                    raise event
+                yield event
+            finished = True
+
+            if runner.cancelled():
+                yield SendTaskStreamingResponse(
+                    id=request.id,
+                    result=TaskStatusUpdateEvent(
+                        id=task_id, status=self.tasks[task_id].status, final=True
+                    )
+                )
+        finally:
+            runner.cancel()    # No-op if it already finished
+            if self.running.get(task_id) is runner:
+                del self.running[task_id]
+            if not finished:
+                # The stream was closed early: the client is gone
+                await self._settle(task_id, TaskStatus(state=TaskState.CANCELED))
+
+    # -------------------------------------------------------------------------
+    # 🛑 on_cancel_task: Stop a queued or running task
+    # -------------------------------------------------------------------------
+    async def on_cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
+        """
+        Mark a task as "canceled" and interrupt the agent if it's running.
+
+        A task still waiting in the background queue is simply skipped by the
+        workers. A running task gets its asyncio.Task canceled, which stops the
+        LLM call and any pending calls to child agents (those cancel their own
+        remote tasks, see AgentConnector).
+
+        Args:
+            request: A CancelTaskRequest with the task ID
+
+        Returns:
+            CancelTaskResponse – the canceled task, or an error if the task
+            doesn't exist or has already finished
+        """
+        async with self.task_lock(request.params.id):
+            task = self.tasks.get(request.params.id)
+
+            if not task:
+                return CancelTaskResponse(id=request.id, error=TaskNotFoundError())
+
+            if task.status.state in (TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED):
+                return CancelTaskResponse(
+                    id=request.id,
+                    error=TaskNotCancelableError(data=task.status.state)
+                )
+
+            task.status = TaskStatus(state=TaskState.CANCELED)
+            self.tasks[task.id] = task
+
+        runner = self.running.get(task.id)
+        if runner is not None:
+            runner.cancel()
+
+        return CancelTaskResponse(id=request.id, result=task)
+
     # -------------------------------------------------------------------------
     # 📥 on_get_task: Fetch a task by its ID
     # -------------------------------------------------------------------------
@@ -141,19 +646,21 @@ class InMemoryTaskManager(TaskManager):
         Returns:
             GetTaskResponse – contains the task if found, or an error message
         """
-        async with self.lock:
-            query: TaskQueryParams = request.params
-            task = self.tasks.get(query.id)
-
-            if not task:
-                # If task not found, return a structured error
-                return GetTaskResponse(id=request.id, error={"message": "Task not found"})
-
-            # Optional: Trim the history to only show the last N messages
-            task_copy = task.model_copy()  # Make a copy so we don't affect the original
-            if query.historyLength is not None:
-                task_copy.history = task_copy.history[-query.historyLength:]  # Get last N messages
-            else:
-                task_copy.history = task_copy.history
-
-            return GetTaskResponse(id=request.id, result=task_copy)
+        # No lock needed: writers never await in the middle of an update, so
+        # this coroutine always sees a task either before or after a change
+        query: TaskQueryParams = request.params
+        task = self.tasks.get(query.id)
+
+        if not task:
+            # If task not found, return a structured error
+            return GetTaskResponse(id=request.id, error=TaskNotFoundError())
+
+        # Shallow copy with its own history list (optionally only the last N
+        # messages), so later appends to the stored task don't leak into the response
+        if query.historyLength is not None:
+            history = task.history[-query.historyLength:]   # Get last N messages
+        else:
+            history = list(task.history)
+        task_copy = task.model_copy(update={"history": history})
+
+        return GetTaskResponse(id=request.id, result=task_copy)
@@ -0,0 +1,279 @@
+# =============================================================================
+# server/task_store.py
+# =============================================================================
+# 🎯 Purpose:
+# Where an InMemoryTaskManager keeps its tasks.
+#
+# ✅ Includes:
+# - `TaskStore`: the dict-like interface every backend implements
+# - `BoundedTaskStore`: the default backend, in RAM (described below)
+# - `create_task_store()`: picks a backend from the CLI options
+#   (`SqliteTaskStore` in server/sqlite_task_store.py persists tasks to disk)
+#
+# Every turn of a conversation adds a Task (with its full message history),
+# so a plain dict grows until the process runs out of memory. BoundedTaskStore:
+# - Caps the number of stored tasks (`max_tasks`) and evicts the least
+#   recently used one when the cap is exceeded
+# - Drops finished tasks (completed / failed / canceled) that nobody touched
+#   for `ttl` seconds, using a background sweeper
+# - Never evicts tasks that are still submitted or being worked on, but
+#   drops ones that got no update for `ttl` seconds (stuck, e.g. after a crash)
+# - Reports gauges (task count, messages, approximate bytes) for /metrics
+#
+# Reads and writes are O(1): the store is an OrderedDict kept in
+# least-recently-used -> most-recently-used order (move_to_end on access).
+# =============================================================================
+
+import asyncio                                   # Background sweeper
+from abc import ABC                              # TaskStore is an abstract base class
+import logging                                   # Logs sweeper failures
+import time                                      # Monotonic clock for idle times
+from collections import OrderedDict              # Keeps keys in LRU order
+from collections.abc import MutableMapping       # Gives us get(), pop(), items(), ...
+from typing import Iterator
+
+from models.task import Task, TaskState
+
+logger = logging.getLogger(__name__)
+
+# Tasks in these states are still running and must stay in the store
+ACTIVE_STATES = {TaskState.SUBMITTED, TaskState.WORKING}
+
+# Tasks in these states are done; only they expire after `ttl` seconds idle
+FINAL_STATES = {TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED}
+
+
+# -----------------------------------------------------------------------------
+# TaskStore (Abstract Base Class)
+# -----------------------------------------------------------------------------
+class TaskStore(MutableMapping, ABC):
+    """
+    🧩 Interface for task storage backends.
+
+    A store behaves like `Dict[str, Task]`. The task manager changes Task
+    objects in place and then assigns them back (`store[task.id] = task`),
+    which is the backend's signal that the task must be saved.
+
+    Backends implement the mapping methods (__getitem__, __setitem__,
+    __delitem__, __iter__, __len__) and may override:
+    - start() / stop(): background work (sweepers, write-behind flushing)
+    - stats(): gauges for GET /metrics
+    """
+
+    async def start(self):
+        """▶️ Called when the server starts."""
+        pass
+
+    async def stop(self):
+        """⏹️ Called when the server stops. Must save anything not yet saved."""
+        pass
+
+    def stats(self) -> dict:
+        """📊 Gauges and counters for GET /metrics."""
+        return {"tasks": len(self)}
+
+
+# -----------------------------------------------------------------------------
+# BoundedTaskStore
+# -----------------------------------------------------------------------------
+class BoundedTaskStore(TaskStore):
+    """
+    🗃️ Dict-like task store with LRU eviction and idle TTL.
+
+    Behaves like `Dict[str, Task]`; reading a task (`store[id]`, `store.get(id)`)
+    marks it as recently used.
+
+    Attributes:
+        max_tasks (int): Max tasks kept (0 = unlimited)
+        ttl (float | None): Seconds a finished task may stay idle (None = forever)
+        sweep_interval (float): Seconds between two sweeper runs
+    """
+
+    def __init__(
+        self,
+        max_tasks: int = 0,
+        ttl: float | None = None,
+        sweep_interval: float = 60.0
+    ):
+        self.max_tasks = max_tasks
+        self.ttl = ttl or None
+        self.sweep_interval = sweep_interval
+
+        # task ID -> (task, last access time), oldest access first
+        self._entries: OrderedDict[str, tuple[Task, float]] = OrderedDict()
+        # ID of each submitted / working task -> its last write time, oldest first
+        # (reads don't count: a client polling a stuck task doesn't keep it alive)
+        self._active: OrderedDict[str, float] = OrderedDict()
+        self._sweeper: asyncio.Task | None = None
+
+        # 📊 Counters
+        self.evicted = 0    # Tasks dropped because the store was full
+        self.expired = 0    # Tasks dropped by the TTL sweeper
+
+    # -------------------------------------------------------------------------
+    # Mapping interface
+    # -------------------------------------------------------------------------
+    def __getitem__(self, task_id: str) -> Task:
+        task, _ = self._entries[task_id]
+        self._touch(task_id, task)
+        return task
+
+    def __setitem__(self, task_id: str, task: Task):
+        self._touch(task_id, task)
+        if task.status.state in ACTIVE_STATES:
+            self._active[task_id] = time.monotonic()
+            self._active.move_to_end(task_id)
+        else:
+            self._active.pop(task_id, None)
+        if self.max_tasks and len(self._entries) > self.max_tasks:
+            self._evict()
+
+    def __delitem__(self, task_id: str):
+        del self._entries[task_id]
+        self._active.pop(task_id, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))    # Snapshot, so callers may delete while iterating
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._entries     # Checking for a task doesn't count as using it
+
+    def _touch(self, task_id: str, task: Task):
+        """Store the task as the most recently used entry (O(1))."""
+        self._entries[task_id] = (task, time.monotonic())
+        self._entries.move_to_end(task_id)
+
+    # -------------------------------------------------------------------------
+    # 🧹 Eviction and expiry
+    # -------------------------------------------------------------------------
+    def _evict(self):
+        """Drop least recently used tasks until the store fits in max_tasks."""
+        excess = len(self._entries) - self.max_tasks
+        victims = []
+        for task_id, (task, _) in self._entries.items():
+            if len(victims) >= excess:
+                break
+            if task.status.state not in ACTIVE_STATES:    # Running tasks must stay
+                victims.append(task_id)
+
+        for task_id in victims:
+            del self[task_id]
+        self.evicted += len(victims)
+
+    def sweep(self) -> int:
+        """
+        Drop finished tasks idle for longer than ttl, and unfinished ones
+        that got no update for that long (their agent is gone).
+
+        Both lists are in time order, so each scan stops at the first task
+        that was used (or updated) recently enough.
+
+        Returns:
+            int: Number of tasks dropped
+        """
+        if self.ttl is None:
+            return 0
+
+        cutoff = time.monotonic() - self.ttl
+        dropped = 0
+        for task_id, (task, last_access) in list(self._entries.items()):
+            if last_access > cutoff:
+                break
+            if task.status.state in FINAL_STATES:
+                del self[task_id]
+                dropped += 1
+
+        for task_id, updated in list(self._active.items()):
+            if updated > cutoff:
+                break
+            logger.warning(f"Task store: dropping task {task_id}, unfinished and not updated for {self.ttl:.0f}s")
+            del self[task_id]
+            dropped += 1
+
+        self.expired += dropped
+        return dropped
+
+    # -------------------------------------------------------------------------
+    # ▶️ start / ⏹️ stop: Run the TTL sweeper in the background
+    # -------------------------------------------------------------------------
+    async def start(self):
+        """Start the background sweeper (only if a ttl is set)."""
+        if self.ttl is not None and self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_loop(), name="task-store-sweeper")
+
+    async def stop(self):
+        """Stop the background sweeper."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            await asyncio.gather(self._sweeper, return_exceptions=True)
+            self._sweeper = None
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                dropped = self.sweep()
+                if dropped:
+                    logger.info(f"Task store: expired {dropped} idle tasks")
+            except Exception as e:
+                logger.error(f"Task store sweep failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # 📊 stats: Memory-usage gauges and counters
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        """
+        Snapshot of the store for GET /metrics.
+
+        `approx_bytes` counts the characters of every text part in every
+        history, which is where almost all of a task's memory goes. It walks
+        all stored messages, so it's meant for monitoring, not hot paths.
+        """
+        messages = 0
+        text_bytes = 0
+        for task, _ in self._entries.values():
+            messages += len(task.history)
+            for message in task.history:
+                for part in message.parts:
+                    text_bytes += len(part.text)
+
+        return {
+            "tasks": len(self._entries),
+            "max_tasks": self.max_tasks,
+            "ttl": self.ttl,
+            "messages": messages,
+            "approx_bytes": text_bytes,
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
+
+
+# -----------------------------------------------------------------------------
+# 🏗️ create_task_store: Build the backend selected on the command line
+# -----------------------------------------------------------------------------
+def create_task_store(
+    max_tasks: int = 0,
+    ttl: float | None = None,
+    db_path: str | None = None,
+    cache_ttl: float | None = None
+) -> TaskStore:
+    """
+    Args:
+        max_tasks: Max tasks kept in memory (0 = unlimited). With a database
+            this bounds the hot cache; the database itself keeps every task.
+        ttl: Seconds a finished task is kept after its last use (None = forever)
+        db_path: SQLite file to persist tasks to (None = RAM only)
+        cache_ttl: With a database, seconds a cached task is trusted before it
+            is re-read from disk (None or 0 = always trust it)
+
+    Returns:
+        TaskStore: A SqliteTaskStore if db_path is given, else a BoundedTaskStore
+    """
+    if db_path:
+        # Imported here so RAM-only servers never load sqlite3
+        from server.sqlite_task_store import SqliteTaskStore
+        return SqliteTaskStore(db_path, cache_size=max_tasks, cache_ttl=cache_ttl, ttl=ttl)
+    return BoundedTaskStore(max_tasks=max_tasks, ttl=ttl)
@@ -0,0 +1,170 @@
+# =============================================================================
+# utilities/agent_index.py
+# =============================================================================
+# 🎯 Purpose:
+# Find agents by what they can do instead of by name. AgentIndex builds an
+# inverted index over every agent card (name, description, and each skill's
+# id, name, tags, description and examples) and ranks agents for a free-text
+# query with BM25, the scoring used by most search engines.
+#
+# ✅ How it stays fast:
+# - Built once per set of cards; a query only touches the posting lists of
+#   its own terms, so it costs microseconds even with hundreds of agents
+# - Term weights (idf, length normalization) are precomputed at build time
+# - Only the top_k best agents are sorted (heapq.nlargest)
+#
+# Fields that name a capability (skill ids, tags) count more than free text
+# (descriptions, examples): each field's term counts are multiplied by its
+# weight before scoring (a simple form of BM25F).
+# =============================================================================
+
+import heapq                         # Picks the top_k results without a full sort
+import math                          # log() for the idf weights
+import re                            # Tokenizer
+from typing import List
+
+from models.agent import AgentCard   # The documents we index
+
+# BM25 parameters: term-frequency saturation and document-length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# How much one occurrence of a term counts, per field
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "skill_id": 3.0,
+    "tag": 3.0,
+    "skill_name": 2.0,
+    "description": 1.0,
+    "skill_description": 1.0,
+    "example": 0.5,
+}
+
+# Words that say nothing about a capability
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i is it me my of on or "
+    "please the this to what when which who with you your".split()
+)
+
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase index terms.
+
+    CamelCase and snake_case names are split into words ("TellTimeAgent" ->
+    tell, time, agent), stopwords are dropped and a plural "s" is stripped,
+    so "doctors" in a query finds "doctor" in a card.
+    """
+    terms = []
+    for word in _WORD.findall(text or ""):
+        for part in _CAMEL.findall(word):
+            term = part.lower()
+            if term in STOPWORDS:
+                continue
+            if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+                term = term[:-1]
+            terms.append(term)
+    return terms
+
+
+class AgentMatch:
+    """
+    🎯 One search result.
+
+    Attributes:
+        card (AgentCard): The matching agent
+        score (float): BM25 score (higher is better; only comparable within one query)
+    """
+
+    def __init__(self, card: AgentCard, score: float):
+        self.card = card
+        self.score = score
+
+    def __repr__(self) -> str:
+        return f"AgentMatch(card={self.card.name!r}, score={self.score:.3f})"
+
+
+class AgentIndex:
+    """
+    📇 Inverted index over agent cards, searched with BM25.
+
+    Cards sharing a name are replicas of one agent and are indexed once
+    (the first card is returned).
+
+    Attributes:
+        cards (List[AgentCard]): One card per distinct agent, as indexed
+    """
+
+    def __init__(self, cards: List[AgentCard]):
+        self.cards: List[AgentCard] = []
+        seen = set()
+        for card in cards:
+            if card.name not in seen:
+                seen.add(card.name)
+                self.cards.append(card)
+
+        # term -> [(document number, weighted term frequency)]
+        postings: dict[str, list[tuple[int, float]]] = {}
+        lengths = []
+        for doc, card in enumerate(self.cards):
+            frequencies = self._weighted_terms(card)
+            lengths.append(sum(frequencies.values()))
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, []).append((doc, frequency))
+
+        # Precompute each posting's BM25 contribution, so a query only adds numbers
+        count = len(self.cards)
+        average = (sum(lengths) / count) if count else 0.0
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for term, entries in postings.items():
+            idf = math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5))
+            self._postings[term] = [
+                (doc, idf * frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc] / average)
+                ))
+                for doc, frequency in entries
+            ]
+
+    @staticmethod
+    def _weighted_terms(card: AgentCard) -> dict[str, float]:
+        """Term -> sum of field weights over every occurrence in the card."""
+        fields = [("name", card.name), ("description", card.description)]
+        for skill in card.skills:
+            fields.append(("skill_id", skill.id))
+            fields.append(("skill_name", skill.name))
+            fields.append(("skill_description", skill.description or ""))
+            fields.extend(("tag", tag) for tag in skill.tags or [])
+            fields.extend(("example", example) for example in skill.examples or [])
+
+        frequencies: dict[str, float] = {}
+        for field, text in fields:
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenize(text):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+        return frequencies
+
+    def search(self, query: str, top_k: int = 3) -> List[AgentMatch]:
+        """
+        Rank agents for a free-text query.
+
+        Args:
+            query: What the caller needs, e.g. "book a cardiologist appointment"
+            top_k: Max results
+
+        Returns:
+            List[AgentMatch]: Best matches first; agents sharing no term
+            with the query are left out
+        """
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            for doc, weight in self._postings.get(term, ()):
+                scores[doc] = scores.get(doc, 0.0) + weight
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [AgentMatch(self.cards[doc], score) for doc, score in best]
+
+    def __len__(self) -> int:
+        return len(self.cards)
@@ -5,20 +5,104 @@
 # It reads a registry of agent base URLs (from a JSON file) and fetches
 # each agent's metadata (AgentCard) from the standard discovery endpoint.
 # This allows any client or agent to dynamically learn about available agents.
+#
+# All cards are fetched concurrently (at most `concurrency` at a time) over
+# one pooled HTTP client, so a sweep takes about as long as the slowest
+# agent instead of the sum of all of them. discover() reports every URL's
+# outcome (card or error, and how long it took) as a DiscoveryResult.
+#
+# Cached mode (cache_ttl=...): cards are kept in memory and served from
+# there, so list_agent_cards() costs no network round trip. Entries older
+# than the TTL are revalidated in the background with conditional GETs
+# (If-None-Match + the card's ETag; an unchanged card costs an empty 304),
+# and `on_change` is called with the new card list whenever it changed.
+#
+# Registry watching (watch_interval=...): the registry file's mtime is polled,
+# and when it changed the file is re-read and diffed against the current URL
+# list. Only the added URLs are probed; removed ones leave the cache, and
+# `on_change` fires, so agents can be added or removed without a restart.
+#
+# find_agents(query) ranks agents by capability (skills, tags, descriptions,
+# examples) with the BM25 inverted index in utilities/agent_index.py; the
+# index is rebuilt only when the set of cards changed.
 # =============================================================================
 
 import os                            # os provides functions for interacting with the operating system, such as file paths
 import json                          # json allows encoding and decoding JSON data
+import asyncio                       # asyncio runs the card fetches concurrently
 import logging                       # logging is used to record warning/error/info messages
-from typing import List             # List is a type hint for functions that return lists
+import inspect                       # inspect tells sync and async callbacks apart
+import time                          # time measures how long each fetch took
+from typing import Any, Callable, List     # Type hints
 
 import httpx                         # httpx is an async HTTP client library for sending requests
 from models.agent import AgentCard   # AgentCard is a Pydantic model representing an agent's metadata
+from client.client import create_http_client    # Pooled keep-alive HTTP client
+from utilities.agent_index import AgentIndex, AgentMatch    # Capability search
 
 # Create a named logger for this module; __name__ is the module's name
 logger = logging.getLogger(__name__)
 
 
+# Max card fetches in flight at once (more mostly adds httpx pool overhead
+# when many agents share a host; a sweep is bounded by the slowest agent anyway)
+DISCOVERY_CONCURRENCY = 16
+
+# Seconds to wait for one agent's card
+DISCOVERY_TIMEOUT = 5.0
+
+# In cached mode, a card whose agent can't be reached is still served for
+# this many TTLs after it was last confirmed, then dropped
+MAX_STALE_TTLS = 3
+
+# Seconds between two checks of the registry file's modification time
+REGISTRY_POLL_INTERVAL = 2.0
+
+# Fewest seconds the background refresher waits between two refreshes, so a
+# tiny (or zero) cache_ttl, or a refresh that keeps failing, can't busy-spin
+MIN_REFRESH_INTERVAL = 1.0
+
+
+class DiscoveryResult:
+    """
+    📋 Outcome of fetching one registered agent's card.
+
+    Attributes:
+        url (str): The agent's base URL from the registry
+        card (AgentCard | None): The card, if it was fetched
+        latency (float): Seconds the fetch took
+        error (str | None): Why it failed otherwise
+    """
+
+    def __init__(self, url: str, card: AgentCard | None = None, latency: float = 0.0,
+                 error: str | None = None, etag: str | None = None,
+                 not_modified: bool = False):
+        self.url = url
+        self.card = card
+        self.latency = latency
+        self.error = error
+        self.etag = etag                    # The card's ETag, if the agent sent one
+        self.not_modified = not_modified    # True if the cached card was still current (304)
+
+    @property
+    def ok(self) -> bool:
+        return self.card is not None
+
+    def __repr__(self) -> str:
+        outcome = f"card={self.card.name!r}" if self.ok else f"error={self.error!r}"
+        return f"DiscoveryResult(url={self.url!r}, {outcome}, latency={self.latency:.3f})"
+
+
+class CachedCard:
+    """A card in the cache, with its ETag and when it was last checked/confirmed."""
+
+    def __init__(self, card: AgentCard | None = None, etag: str | None = None):
+        self.card = card
+        self.etag = etag
+        self.checked = 0.0      # Monotonic time of the last fetch attempt
+        self.confirmed = 0.0    # Monotonic time the card was last known to be current
+
+
 class DiscoveryClient:
     """
     🔍 Discovers A2A agents by reading a registry file of URLs and querying
@@ -29,14 +113,60 @@ class DiscoveryClient:
         base_urls (List[str]): Loaded list of agent base URLs.
     """
 
-    def __init__(self, registry_file: str = None):
+    def __init__(
+        self,
+        registry_file: str = None,
+        http_client: httpx.AsyncClient | None = None,
+        concurrency: int = DISCOVERY_CONCURRENCY,
+        timeout: float = DISCOVERY_TIMEOUT,
+        cache_ttl: float | None = None,
+        on_change: Callable[[List[AgentCard]], Any] | None = None,
+        watch_interval: float | None = None
+    ):
         """
         Initialize the DiscoveryClient.
 
         Args:
             registry_file (str, optional): Path to the registry JSON. If None,
                 defaults to 'agent_registry.json' in this utilities folder.
+            http_client (httpx.AsyncClient, optional): Pool to fetch cards
+                with; if omitted, each sweep uses a pool of its own.
+            concurrency (int): Max card fetches in flight at once.
+            timeout (float): Seconds to wait for one agent's card.
+            cache_ttl (float, optional): Enables cached mode: cards are
+                served from memory and revalidated after this many seconds.
+            on_change (callable, optional): Called (or awaited, if async)
+                with the new list of cards whenever it changed (cached mode).
+            watch_interval (float, optional): Enables cached mode and
+                re-reads the registry file within this many seconds of a
+                change (cards are then only revalidated if cache_ttl is set).
         """
+        self.http_client = http_client
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+        # 🗂️ Cached mode
+        self.cache_ttl = cache_ttl
+        self.on_change = on_change
+        self.watch_interval = watch_interval
+        self._cache: dict[str, CachedCard] = {}         # base URL -> cached card
+        self._cards: List[AgentCard] = []               # Card list as last reported
+        self._refresh_lock = asyncio.Lock()             # One refresh at a time
+        self._refreshing: asyncio.Task | None = None    # Background revalidation
+        self._refresher: asyncio.Task | None = None     # Periodic refresh (start())
+        self._watcher: asyncio.Task | None = None       # Registry file polling (start())
+        self._owns_http = False
+
+        # 📇 Capability index over the cards it was built from
+        self._index: AgentIndex | None = None
+        self._index_cards: List[AgentCard] = []
+
+        # 📊 Cache counters
+        self.cache_hits = 0         # list_agent_cards() served from memory
+        self.not_modified = 0       # Revalidations answered with 304
+        self.changes = 0            # Times the card list changed
+        self.reloads = 0            # Times the registry file was re-read
+
         # If the caller provided a custom path, use it; otherwise, build the default path
         if registry_file:
             self.registry_file = registry_file
@@ -49,6 +179,7 @@ class DiscoveryClient:
             )
 
         # Immediately load the registry file into memory
+        self._registry_stamp = self._stat_registry()
         self.base_urls = self._load_registry()
 
     def _load_registry(self) -> List[str]:
@@ -76,33 +207,328 @@ class DiscoveryClient:
             logger.error(f"Error parsing registry file: {e}")
             return []
 
+    # -------------------------------------------------------------------------
+    # 👀 Registry watching
+    # -------------------------------------------------------------------------
+    def _stat_registry(self) -> tuple[int, int] | None:
+        """The registry file's (mtime, size), or None if it doesn't exist."""
+        try:
+            stat = os.stat(self.registry_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_registry(self) -> tuple[List[str], List[str]]:
+        """
+        Re-read the registry file if it changed since it was last read.
+
+        A file that can't be parsed (e.g. caught half-written) is ignored
+        and the current URL list is kept; it's read again on its next change.
+
+        Returns:
+            tuple[List[str], List[str]]: The URLs added and removed (both
+            empty if the file is unchanged)
+        """
+        stamp = self._stat_registry()
+        if stamp == self._registry_stamp:
+            return [], []
+        self._registry_stamp = stamp
+
+        if stamp is None:
+            logger.warning(f"Registry file removed: {self.registry_file}")
+            urls = []
+        else:
+            try:
+                with open(self.registry_file, "r") as f:
+                    urls = json.load(f)
+                if not isinstance(urls, list):
+                    raise ValueError("Registry file must contain a JSON list of URLs.")
+            except (OSError, json.JSONDecodeError, ValueError) as e:
+                logger.error(f"Ignoring registry change, file is invalid: {e}")
+                return [], []
+
+        self.reloads += 1
+        known = set(self.base_urls)
+        added = [url for url in dict.fromkeys(urls) if url not in known]
+        removed = [url for url in self.base_urls if url not in set(urls)]
+        self.base_urls = urls
+        if added or removed:
+            logger.info(f"Registry reloaded: {len(added)} added, {len(removed)} removed")
+        return added, removed
+
+    async def _watch_loop(self):
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            try:
+                added, removed = self.reload_registry()
+                if added or removed:
+                    # Only the new URLs are due, so only they are probed
+                    await self.refresh()
+            except Exception as e:
+                logger.error(f"Registry reload failed: {e}")
+
     async def list_agent_cards(self) -> List[AgentCard]:
         """
         Asynchronously fetch the discovery endpoint from each registered URL
         and parse the returned JSON into AgentCard objects.
 
+        In cached mode the cards come from memory; only the very first call
+        waits for the network. Stale entries are revalidated in the background.
+
         Returns:
             List[AgentCard]: Successfully retrieved agent cards.
         """
-        cards: List[AgentCard] = []  # Prepare an empty list to collect AgentCard instances
-
-        # Create a new AsyncClient and ensure it's closed when done
-        async with httpx.AsyncClient() as client:
-            # Iterate through each base URL in the registry
-            for base in self.base_urls:
-                # Normalize URL (remove trailing slash) and append the discovery path
-                url = base.rstrip("/") + "/.well-known/agent.json"
-                try:
-                    # Send a GET request to the discovery endpoint with a timeout
-                    response = await client.get(url, timeout=5.0)
-                    # Raise an exception if the response status is 4xx or 5xx
-                    response.raise_for_status()
-                    # Convert the JSON response into an AgentCard Pydantic model
-                    card = AgentCard.model_validate(response.json())
-                    # Add the valid AgentCard to our list
-                    cards.append(card)
-                except Exception as e:
-                    # If anything goes wrong, log which URL failed and why
-                    logger.warning(f"Failed to discover agent at {url}: {e}")
-        # Return the list of successfully fetched AgentCards
+        if self.cached:
+            if not self._cache:
+                await self.refresh()
+            else:
+                self.cache_hits += 1
+                if self._due() and (self._refreshing is None or self._refreshing.done()):
+                    self._refreshing = asyncio.create_task(self.refresh(), name="discovery-refresh")
+            return self.cached_cards()
+
+        results = await self.discover()
+        for result in results:
+            if not result.ok:
+                # If anything went wrong, log which URL failed and why
+                logger.warning(f"Failed to discover agent at {result.url}: {result.error}")
+        # Return the successfully fetched AgentCards, in registry order
+        return [result.card for result in results if result.ok]
+
+    async def discover(self, urls: List[str] | None = None) -> List[DiscoveryResult]:
+        """
+        Fetch every registered agent's card concurrently.
+
+        Args:
+            urls: Only fetch these base URLs (default: the whole registry)
+
+        Returns:
+            List[DiscoveryResult]: One result per URL, in the same order, with
+            the card or the error and the fetch latency.
+        """
+        urls = self.base_urls if urls is None else urls
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(client: httpx.AsyncClient, base: str) -> DiscoveryResult:
+            async with semaphore:
+                return await self._fetch_card(client, base)
+
+        # Use the shared pool if we have one, else one for this sweep
+        if self.http_client is not None:
+            return list(await asyncio.gather(
+                *(fetch(self.http_client, base) for base in urls)
+            ))
+        async with create_http_client(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+            timeout=self.timeout
+        ) as client:
+            return list(await asyncio.gather(
+                *(fetch(client, base) for base in urls)
+            ))
+
+    async def _fetch_card(self, client: httpx.AsyncClient, base: str) -> DiscoveryResult:
+        """Fetch one agent's card; errors are returned, never raised."""
+        # Normalize URL (remove trailing slash) and append the discovery path
+        url = base.rstrip("/") + "/.well-known/agent.json"
+        cached = self._cache.get(base)
+        # Revalidate a cached card: the agent answers 304 if it's unchanged
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+        start = time.monotonic()
+        try:
+            # Send a GET request to the discovery endpoint with a timeout
+            response = await client.get(url, timeout=self.timeout, headers=headers)
+            etag = response.headers.get("etag")
+            if response.status_code == 304 and cached is not None:
+                return DiscoveryResult(base, card=cached.card, latency=time.monotonic() - start,
+                                       etag=etag or cached.etag, not_modified=True)
+            # Raise an exception if the response status is 4xx or 5xx
+            response.raise_for_status()
+            # Convert the JSON response into an AgentCard Pydantic model
+            card = AgentCard.model_validate(response.json())
+            return DiscoveryResult(base, card=card, latency=time.monotonic() - start, etag=etag)
+        except Exception as e:
+            error = str(e) or type(e).__name__     # Timeouts have an empty message
+            return DiscoveryResult(base, latency=time.monotonic() - start, error=error)
+
+    # -------------------------------------------------------------------------
+    # 📇 Capability search
+    # -------------------------------------------------------------------------
+    async def find_agents(self, query: str, top_k: int = 3) -> List[AgentMatch]:
+        """
+        Rank the registered agents by how well their skills match a query.
+
+        In cached mode this is a lookup in memory: the index is only rebuilt
+        after the set of cards changed.
+
+        Args:
+            query: What the caller needs, e.g. "which doctor treats migraines"
+            top_k: Max results
+
+        Returns:
+            List[AgentMatch]: Best matches first (card + BM25 score)
+        """
+        cards = await self.list_agent_cards()
+        return self.agent_index(cards).search(query, top_k)
+
+    def agent_index(self, cards: List[AgentCard]) -> AgentIndex:
+        """The index for these cards, reused while they are the same objects."""
+        same = len(cards) == len(self._index_cards) and all(
+            a is b for a, b in zip(cards, self._index_cards)
+        )
+        if self._index is None or not same:
+            self._index, self._index_cards = AgentIndex(cards), cards
+        return self._index
+
+    # -------------------------------------------------------------------------
+    # 🗂️ Cached mode
+    # -------------------------------------------------------------------------
+    @property
+    def cached(self) -> bool:
+        """True if cards are served from memory (cache_ttl or watch_interval set)."""
+        return self.cache_ttl is not None or self.watch_interval is not None
+
+    def cached_cards(self) -> List[AgentCard]:
+        """The cards currently in the cache, in registry order (no network)."""
+        cards = []
+        for base in self.base_urls:
+            entry = self._cache.get(base)
+            if entry is not None and entry.card is not None:
+                cards.append(entry.card)
         return cards
+
+    def _due(self) -> List[str]:
+        """
+        Registry URLs whose cache entry is missing or older than the TTL.
+        Without a TTL, cards are kept until the registry drops them; only
+        agents that couldn't be reached are retried (every watch_interval).
+        """
+        now = time.monotonic()
+        due = []
+        for base in self.base_urls:
+            entry = self._cache.get(base)
+            if entry is None:
+                due.append(base)
+                continue
+            age = now - entry.checked
+            if self.cache_ttl is not None and age >= self.cache_ttl:
+                due.append(base)
+            elif entry.card is None and age >= (self.cache_ttl or self.watch_interval):
+                due.append(base)
+        return due
+
+    def prime(self, results: List[DiscoveryResult]):
+        """
+        Fill the cache from a discover() sweep that was already made (e.g.
+        at startup), so start() doesn't probe those agents a second time.
+        """
+        self._store(results)
+        self._cards = self.cached_cards()
+
+    async def refresh(self, force: bool = False) -> List[DiscoveryResult]:
+        """
+        Revalidate the cache: fetch the cards that are due (all of them with
+        force=True, or on the first call) and call on_change if the list of
+        cards changed.
+
+        Returns:
+            List[DiscoveryResult]: The results of the fetches that were made
+        """
+        async with self._refresh_lock:
+            urls = list(self.base_urls) if force or not self._cache else self._due()
+            results = await self.discover(urls) if urls else []
+            self._store(results)
+
+            # Compared with the last reported list: base_urls may have changed already
+            before, self._cards = self._cards, self.cached_cards()
+            if self._cards != before:
+                self.changes += 1
+                await self._notify(self._cards)
+            return results
+
+    def _store(self, results: List[DiscoveryResult]):
+        """Record fetch results in the cache and forget unregistered URLs."""
+        now = time.monotonic()
+        max_stale = MAX_STALE_TTLS * (self.cache_ttl or 0)
+        for result in results:
+            entry = self._cache.setdefault(result.url, CachedCard())
+            entry.checked = now
+            if result.ok:
+                entry.card, entry.etag, entry.confirmed = result.card, result.etag, now
+                self.not_modified += result.not_modified
+            else:
+                logger.warning(f"Failed to discover agent at {result.url}: {result.error}")
+                if entry.card is not None and now - entry.confirmed >= max_stale:
+                    logger.warning(f"Dropping agent at {result.url} from the cache")
+                    entry.card, entry.etag = None, None
+
+        # Forget URLs that are no longer in the registry
+        for base in list(self._cache):
+            if base not in self.base_urls:
+                del self._cache[base]
+
+    async def _notify(self, cards: List[AgentCard]):
+        if self.on_change is None:
+            return
+        try:
+            outcome = self.on_change(cards)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.error(f"Discovery on_change callback failed: {e}")
+
+    async def start(self):
+        """
+        ▶️ Cached mode: load the cache and keep it fresh with background
+        tasks (TTL revalidation, registry watching), so list_agent_cards()
+        never has to wait for the network.
+        """
+        if not self.cached or self._refresher is not None or self._watcher is not None:
+            return
+        if self.http_client is None:
+            # One pool for all the refreshes, instead of one per sweep
+            self.http_client = create_http_client(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+                timeout=self.timeout
+            )
+            self._owns_http = True
+        await self.refresh()
+        if self.cache_ttl is not None:
+            self._refresher = asyncio.create_task(self._refresh_loop(), name="discovery-refresher")
+        if self.watch_interval is not None:
+            self._watcher = asyncio.create_task(self._watch_loop(), name="registry-watcher")
+
+    async def stop(self):
+        """⏹️ Stop background refreshing and watching and close our own connection pool."""
+        for task in (self._refresher, self._refreshing, self._watcher):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._refresher = self._refreshing = self._watcher = None
+        if self._owns_http:
+            await self.http_client.aclose()
+            self.http_client = None
+            self._owns_http = False
+
+    async def _refresh_loop(self):
+        while True:
+            # Wake up when the oldest entry is due, but not more often than
+            # every MIN_REFRESH_INTERVAL seconds
+            now = time.monotonic()
+            oldest = min((entry.checked for entry in self._cache.values()), default=now)
+            await asyncio.sleep(max(MIN_REFRESH_INTERVAL, oldest + self.cache_ttl - now))
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Discovery refresh failed: {e}")
+
+    def cache_stats(self) -> dict:
+        return {
+            "cards": len(self.cached_cards()),
+            "ttl": self.cache_ttl,
+            "hits": self.cache_hits,
+            "not_modified": self.not_modified,
+            "changes": self.changes,
+            "reloads": self.reloads,
+        }
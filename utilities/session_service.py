@@ -0,0 +1,341 @@
+# =============================================================================
+# utilities/session_service.py
+# =============================================================================
+# 🎯 Purpose:
+# A drop-in replacement for ADK's InMemorySessionService that keeps memory
+# and prompt size bounded, for agents serving many long-lived sessions.
+#
+# InMemorySessionService never forgets a session, and every turn adds events
+# that are sent back to Gemini as context on the next turn. So memory and
+# prompt tokens grow with the number of sessions and with their length.
+#
+# ✅ BoundedSessionService:
+# - Idle TTL: sessions unused for `ttl` seconds are deleted
+# - Max sessions: beyond `max_sessions`, the least recently used is deleted
+# - Compaction: when a session has more than `keep_turns` turns (a turn
+#   starts at a user message), the older turns are replaced by one summary
+#   message at the start of the history. The summary is rolling: each
+#   compaction adds the turns it drops to the previous summary, keeping the
+#   most recent `summary_chars` characters of it.
+# - Token estimates: stats() reports each session's approximate prompt size
+#
+# Session state (`session.state`) is never compacted, only the event history.
+# Expired sessions are removed as a side effect of creating or fetching a
+# session, so there is no background task to manage.
+# =============================================================================
+
+import heapq                          # Largest sessions for stats()
+import json                           # Sizes of function call arguments / responses
+import logging                        # Standard library for configurable logging
+import time                           # Monotonic clock for the idle TTL
+from collections import OrderedDict   # Sessions, least recently used first
+from typing import Any, Callable, List, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService, Session
+from google.genai import types
+
+# Create a logger for this module using its namespace
+logger = logging.getLogger(__name__)
+
+# Defaults (same as the agents' --max-sessions / --session-ttl / --keep-turns)
+MAX_SESSIONS = 1000
+SESSION_TTL = 3600.0
+KEEP_TURNS = 10
+SUMMARY_CHARS = 2000
+
+# Rough size of a token in characters, for English text
+CHARS_PER_TOKEN = 4
+
+# Longest text kept from one event in the summary
+MAX_LINE_CHARS = 200
+
+# ID and first line of the summary event that replaces compacted turns
+SUMMARY_EVENT_ID = "session-summary"
+SUMMARY_HEADER = "Summary of the earlier conversation:"
+
+# Key of a session: (app name, user ID, session ID)
+SessionKey = tuple[str, str, str]
+
+
+def _size(value: Any) -> int:
+    """Characters of a function call's arguments or response, as sent to the model."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(str(value))
+
+
+def estimate_tokens(events: List[Event]) -> int:
+    """
+    Approximate number of prompt tokens the events add to the model's context.
+
+    Counts the characters of text parts, function calls and function
+    responses and divides by CHARS_PER_TOKEN; good enough to compare
+    sessions and to watch the trend, not for billing.
+    """
+    chars = 0
+    for event in events:
+        if event.content is None or not event.content.parts:
+            continue
+        for part in event.content.parts:
+            if part.text:
+                chars += len(part.text)
+            elif part.function_call:
+                chars += len(part.function_call.name or "") + _size(part.function_call.args or {})
+            elif part.function_response:
+                chars += len(part.function_response.name or "") + _size(part.function_response.response or {})
+    return chars // CHARS_PER_TOKEN
+
+
+def _clip(text: str, limit: int = MAX_LINE_CHARS) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def summarize(previous: str, events: List[Event]) -> str:
+    """
+    Default summarizer: the previous summary plus one line per dropped event
+    ("user: ...", "orchestrator called delegate_task(...)", ...).
+
+    No LLM call is made, so compaction costs nothing. Any callable with the
+    same signature (e.g., one asking a cheap model for a summary) can be
+    passed to BoundedSessionService instead.
+
+    Args:
+        previous: The current summary ("" if there is none yet)
+        events: The events being compacted away, oldest first
+
+    Returns:
+        str: The new summary
+    """
+    lines = [previous] if previous else []
+    for event in events:
+        if event.content is None or not event.content.parts:
+            continue
+        for part in event.content.parts:
+            if part.text:
+                lines.append(f"{event.author}: {_clip(part.text)}")
+            elif part.function_call:
+                args = json.dumps(part.function_call.args or {}, default=str)
+                lines.append(f"{event.author} called {part.function_call.name}({_clip(args)})")
+            elif part.function_response:
+                response = json.dumps(part.function_response.response or {}, default=str)
+                lines.append(f"{part.function_response.name} returned {_clip(response)}")
+    return "\n".join(lines)
+
+
+class BoundedSessionService(InMemorySessionService):
+    """
+    🧹 InMemorySessionService with an idle TTL, an LRU size limit and
+    history compaction.
+
+    Attributes:
+        max_sessions (int): Sessions kept at most (0 = unlimited)
+        ttl (float): Seconds a session may stay unused (0 = forever)
+        keep_turns (int): Most recent turns kept verbatim (0 = no compaction)
+        summary_chars (int): Max length of the rolling summary
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        ttl: float = SESSION_TTL,
+        keep_turns: int = KEEP_TURNS,
+        summary_chars: int = SUMMARY_CHARS,
+        summarizer: Callable[[str, List[Event]], str] = summarize
+    ):
+        """
+        Args:
+            max_sessions: Least recently used sessions beyond this are deleted
+                (0 = unlimited).
+            ttl: Sessions unused for this many seconds are deleted (0 = never).
+            keep_turns: Turns kept as they are; older ones are summarized
+                (0 = never compact).
+            summary_chars: The summary keeps its most recent characters only.
+            summarizer: Builds the new summary from the previous one and the
+                events being dropped.
+        """
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.keep_turns = keep_turns
+        self.summary_chars = summary_chars
+        self.summarizer = summarizer
+
+        # Session key -> monotonic time of its last use, least recently used first
+        self._used: OrderedDict[SessionKey, float] = OrderedDict()
+        # Session key -> its current summary text
+        self._summaries: dict[SessionKey, str] = {}
+
+        self.expired = 0        # Sessions deleted after the idle TTL
+        self.evicted = 0        # Sessions deleted to stay under max_sessions
+        self.compactions = 0    # Times a history was compacted
+        self.compacted_events = 0
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None
+    ) -> Session:
+        await self._expire()
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._touch((app_name, user_id, session.id))
+        await self._evict()
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config=None
+    ) -> Optional[Session]:
+        await self._expire()
+        stored = self.sessions.get(app_name, {}).get(user_id, {}).get(session_id)
+        if stored is None:
+            return None
+        key = (app_name, user_id, stored.id)
+        self._touch(key)
+        # Compact the stored history before copying it, so the copy the
+        # Runner builds the prompt from is already short
+        self._compact(key, stored)
+        return await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session, event)
+        key = (session.app_name, session.user_id, session.id)
+        if key in self._used:
+            self._touch(key)
+        return event
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        self._forget((app_name, user_id, session_id))
+
+    # -------------------------------------------------------------------------
+    # 🧹 Expiry and eviction
+    # -------------------------------------------------------------------------
+    def _touch(self, key: SessionKey):
+        self._used[key] = time.monotonic()
+        self._used.move_to_end(key)
+
+    def _forget(self, key: SessionKey):
+        self._used.pop(key, None)
+        self._summaries.pop(key, None)
+
+    async def _drop(self, key: SessionKey):
+        app_name, user_id, session_id = key
+        self._forget(key)
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+    async def _expire(self):
+        """Delete sessions idle for longer than the TTL (they're at the front)."""
+        if not self.ttl:
+            return
+        deadline = time.monotonic() - self.ttl
+        while self._used:
+            key, used = next(iter(self._used.items()))
+            if used > deadline:
+                break
+            await self._drop(key)
+            self.expired += 1
+            logger.info(f"BoundedSessionService: session {key[2]} of {key[0]} expired")
+
+    async def _evict(self):
+        """Delete least recently used sessions beyond max_sessions."""
+        while self.max_sessions and len(self._used) > self.max_sessions:
+            key = next(iter(self._used))
+            await self._drop(key)
+            self.evicted += 1
+            logger.info(f"BoundedSessionService: session {key[2]} of {key[0]} evicted")
+
+    # -------------------------------------------------------------------------
+    # 🗜️ _compact: Summarize all but the last keep_turns turns
+    # -------------------------------------------------------------------------
+    def _compact(self, key: SessionKey, session: Session):
+        """
+        Replace the turns before the last `keep_turns` ones with a summary
+        event. Cuts happen only where a user message starts a turn, so a
+        function call is never separated from its response.
+        """
+        if not self.keep_turns:
+            return
+        events = session.events
+        first = 1 if events and events[0].id == SUMMARY_EVENT_ID else 0
+        starts = [
+            i for i in range(first, len(events))
+            if events[i].author == "user"
+        ]
+        if len(starts) <= self.keep_turns:
+            return
+
+        cut = starts[-self.keep_turns]
+        dropped = events[first:cut]
+        summary = self.summarizer(self._summaries.get(key, ""), dropped)
+        if len(summary) > self.summary_chars:
+            # Oldest lines go first; don't start with half a line
+            tail = summary[-(self.summary_chars - 1):]
+            summary = "…" + (tail.split("\n", 1)[1] if "\n" in tail else tail)
+        self._summaries[key] = summary
+
+        summary_event = Event(
+            id=SUMMARY_EVENT_ID,
+            invocation_id=dropped[-1].invocation_id,
+            author="user",
+            timestamp=dropped[-1].timestamp,
+            content=types.Content(
+                role="user",
+                parts=[types.Part(text=f"{SUMMARY_HEADER}\n{summary}")]
+            )
+        )
+        session.events = [summary_event] + events[cut:]
+        self.compactions += 1
+        self.compacted_events += len(dropped)
+
+    # -------------------------------------------------------------------------
+    # 📊 stats: Sizes and counters, for GET /metrics
+    # -------------------------------------------------------------------------
+    def session_tokens(self) -> dict[str, int]:
+        """Estimated prompt tokens of every session's history, by session ID."""
+        return {
+            session.id: estimate_tokens(session.events)
+            for users in self.sessions.values()
+            for sessions in users.values()
+            for session in sessions.values()
+        }
+
+    def stats(self, top: int = 10) -> dict:
+        """
+        Session count, expiry/eviction/compaction counters and token estimates.
+
+        Args:
+            top: How many of the largest sessions to list individually
+        """
+        sizes = []
+        for users in self.sessions.values():
+            for sessions in users.values():
+                for session in sessions.values():
+                    sizes.append((estimate_tokens(session.events), len(session.events), session.id))
+        largest = heapq.nlargest(top, sizes)
+        return {
+            "sessions": len(sizes),
+            "max_sessions": self.max_sessions,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "compactions": self.compactions,
+            "compacted_events": self.compacted_events,
+            "tokens": sum(size[0] for size in sizes),
+            "largest": [
+                {"session": session_id, "events": events, "tokens": tokens}
+                for tokens, events, session_id in largest
+            ],
+        }